@@ -380,6 +380,12 @@ OVERRIDE = {
         """,
         '__delitem__': None,
     },
+    'BufferSpec': {
+        '__new__': None,
+        '__init__': """
+        def __init__(self, buf: BufSpec, *, readonly: bool = False) -> None: ...
+        """,
+    },
     'Pickle': {
         '__new__': None,
         '__init__': """
@@ -389,11 +395,17 @@ OVERRIDE = {
             loads: Callable[[Buffer], Any],
             protocol: Optional[int] = None,
             threshold: Optional[int] = None,
+            *,
+            compress: Any = None,
+            compress_threshold: Optional[int] = None,
         ) -> None: ...
         @overload
         def __init__(self,
             dumps: Optional[Callable[[Any], bytes]] = None,
             loads: Optional[Callable[[Buffer], Any]] = None,
+            *,
+            compress: Any = None,
+            compress_threshold: Optional[int] = None,
         ) -> None: ...
         """,
     },
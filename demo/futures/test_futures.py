@@ -3,6 +3,7 @@ import sys
 import time
 import warnings
 import functools
+import itertools
 import unittest
 
 from mpi4py import MPI
@@ -161,6 +162,8 @@ class ProcessPoolInitTest(ProcessPoolMixin,
             env={},
             use_pkl5=None,
             backoff=0.001,
+            prefetch=1,
+            progress='poll',
             )
         futures = [executor.submit(time.sleep, 0)
                    for _ in range(self.worker_count)]
@@ -276,6 +279,69 @@ class ProcessPoolInitTest(ProcessPoolMixin,
             if save is not None:
                 os.environ['MPI4PY_FUTURES_USE_PKL5'] = save
 
+    def test_prefetch_kwarg(self):
+        for prefetch in (1, 2, 5):
+            executor = self.executor_type(prefetch=prefetch)
+            result = list(executor.map(pow, range(30), [2] * 30))
+            self.assertEqual(result, [x * x for x in range(30)])
+            futures = [executor.submit(divmod, 1, x) for x in range(-3, 4)]
+            for x, future in zip(range(-3, 4), futures):
+                if x == 0:
+                    self.assertIsInstance(
+                        future.exception(), ZeroDivisionError)
+                else:
+                    self.assertEqual(future.result(), divmod(1, x))
+            executor.shutdown()
+
+    def test_prefetch_environ(self):
+        save = os.environ.get('MPI4PY_FUTURES_PREFETCH')
+        try:
+            for value in ('0', '1', '4'):
+                os.environ['MPI4PY_FUTURES_PREFETCH'] = value
+                executor = self.executor_type()
+                result = list(executor.map(abs, range(-9, 9)))
+                self.assertEqual(result, [abs(x) for x in range(-9, 9)])
+                executor.shutdown()
+        finally:
+            del os.environ['MPI4PY_FUTURES_PREFETCH']
+            if save is not None:
+                os.environ['MPI4PY_FUTURES_PREFETCH'] = save
+
+    def test_progress_kwarg(self):
+        for progress in ('poll', 'wait'):
+            executor = self.executor_type(progress=progress)
+            for x in range(5):
+                self.assertEqual(executor.submit(abs, -x).result(), x)
+            result = list(executor.map(pow, range(30), [2] * 30))
+            self.assertEqual(result, [x * x for x in range(30)])
+            future = executor.submit(divmod, 1, 0)
+            self.assertIsInstance(future.exception(), ZeroDivisionError)
+            executor.shutdown()
+
+    @unittest.skipIf(SHARED_POOL, 'shared-pool')
+    def test_progress_environ(self):
+        save = os.environ.get('MPI4PY_FUTURES_PROGRESS')
+        try:
+            for value in ('poll', 'WAIT'):
+                os.environ['MPI4PY_FUTURES_PROGRESS'] = value
+                executor = self.executor_type()
+                executor.submit(time.sleep, 0).result()
+                executor.shutdown()
+            with warnings.catch_warnings(record=True) as wlist:
+                warnings.simplefilter('always')
+                os.environ['MPI4PY_FUTURES_PROGRESS'] = 'foobar'
+                executor = self.executor_type()
+                executor.submit(time.sleep, 0).result()
+                executor.shutdown()
+            self.assertTrue(wlist)
+            msg = wlist[0].message
+            self.assertIsInstance(msg, RuntimeWarning)
+            self.assertIn('foobar', msg.args[0])
+        finally:
+            del os.environ['MPI4PY_FUTURES_PROGRESS']
+            if save is not None:
+                os.environ['MPI4PY_FUTURES_PROGRESS'] = save
+
     @unittest.skipIf(SHARED_POOL, 'shared-pool')
     def test_initializer(self):
         executor = self.executor_type(
@@ -813,6 +879,105 @@ class ProcessPoolExecutorTest(ProcessPoolMixin,
         with self.assertRaises(ValueError):
             set(map_unordered(pow, range(40), range(40), chunksize=-1))
 
+    def test_map_chunksize_auto(self):
+        ref = list(map(pow, range(40), range(40)))
+        sequence = [(a, a) for a in range(40)]
+        for unordered in (False, True):
+            check = set if unordered else list
+            for buffersize in (None, 1, 5):
+                kwargs = dict(chunksize='auto',
+                              buffersize=buffersize,
+                              unordered=unordered)
+                self.assertEqual(
+                    check(self.executor.map(
+                        pow, range(40), range(40), **kwargs)),
+                    check(ref))
+                self.assertEqual(
+                    check(self.executor.starmap(
+                        pow, iter(sequence), **kwargs)),
+                    check(ref))
+        self.assertEqual(
+            list(self.executor.map(pow, [], chunksize='auto')), [])
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                              chunksize='auto')
+        self.assertEqual(next(i), (0, 1))
+        self.assertEqual(next(i), (0, 1))
+        with self.assertRaises(ZeroDivisionError):
+            next(i)
+
+    def test_map_chunksize_auto_sizes(self):
+        chunks = futures.pool._AutoChunks(range(100), 2)
+        self.assertEqual(len(next(chunks)[0]), 1)
+        chunks.record(1, 0.001, 0.002)
+        sizes = [len(next(chunks)[0]) for _ in range(3)]
+        self.assertEqual(sizes, [2, 4, 8])
+        sizes = [len(chunk) for chunk, in chunks]
+        self.assertEqual(sum(sizes), 100 - 15)
+        self.assertEqual(sizes[-1], 1)
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        chunks = futures.pool._AutoChunks((i for i in range(100)), 2)
+        chunks.record(1, 0.001, 0.002)
+        sizes = [len(chunk) for chunk, in chunks]
+        self.assertEqual(sum(sizes), 100)
+        self.assertLessEqual(max(sizes), 10)
+
+    def test_map_buffersize(self):
+        ref = list(map(pow, range(40), range(40)))
+        for buffersize in (1, 3, 50):
+            for chunksize in (1, 6):
+                self.assertEqual(
+                    list(self.executor.map(pow, range(40), range(40),
+                                           chunksize=chunksize,
+                                           buffersize=buffersize)),
+                    ref)
+                self.assertEqual(
+                    set(self.executor.map(pow, range(40), range(40),
+                                          chunksize=chunksize,
+                                          buffersize=buffersize,
+                                          unordered=True)),
+                    set(ref))
+        with self.assertRaises(ValueError):
+            self.executor.map(pow, range(40), range(40), buffersize=0)
+        with self.assertRaises(TypeError):
+            self.executor.map(pow, range(40), range(40), buffersize=2.0)
+
+    def test_map_buffersize_lazy(self):
+        consumed = []
+
+        def iterable():
+            for i in itertools.count():
+                consumed.append(i)
+                yield (i,)
+
+        for unordered in (False, True):
+            del consumed[:]
+            iterator = self.executor.starmap(
+                abs, iterable(), buffersize=4, unordered=unordered)
+            self.assertEqual(len(consumed), 4)
+            results = list(itertools.islice(iterator, 10))
+            if not unordered:
+                self.assertEqual(results, list(range(10)))
+            self.assertLessEqual(len(consumed), 14)
+            iterator.close()
+            del consumed[:]
+            iterator = self.executor.starmap(
+                abs, iterable(), chunksize=3, buffersize=2,
+                unordered=unordered)
+            self.assertEqual(len(consumed), 6)
+            results = list(itertools.islice(iterator, 10))
+            if not unordered:
+                self.assertEqual(results, list(range(10)))
+            self.assertLessEqual(len(consumed), 6 + 12)
+            iterator.close()
+
+    def test_map_buffersize_timeout(self):
+        for unordered in (False, True):
+            iterator = self.executor.map(
+                time.sleep, [1, 1], timeout=0.25,
+                buffersize=1, unordered=unordered)
+            with self.assertRaises(futures.TimeoutError):
+                list(iterator)
+
 
 class ProcessPoolSubmitTest(unittest.TestCase):
 
@@ -984,6 +1149,20 @@ class ProcessPoolPickleTest(unittest.TestCase):
         cause = exc.__cause__
         self.assertIsInstance(cause, futures._lib.RemoteTraceback)
 
+    def test_bad_pickle_prefetch(self):
+        executor = futures.MPIPoolExecutor(1, prefetch=8)
+        try:
+            fs = [executor.submit(BadPickle) if x == 3 else
+                  executor.submit(abs, -x) for x in range(8)]
+            for x, f in enumerate(fs):
+                if x == 3:
+                    with self.assertRaises(ZeroDivisionError):
+                        f.result()
+                else:
+                    self.assertEqual(f.result(), x)
+        finally:
+            executor.shutdown()
+
 
 class MPICommExecutorTest(unittest.TestCase):
 
@@ -1482,6 +1661,7 @@ if SHARED_POOL:
     del ProcessPoolInitTest.test_init_globals
     del ProcessPoolInitTest.test_use_pkl5_kwarg
     del ProcessPoolInitTest.test_use_pkl5_environ
+    del ProcessPoolInitTest.test_progress_environ
     del ProcessPoolInitTest.test_initializer
     del ProcessPoolInitTest.test_initializer_bad
     del ProcessPoolInitTest.test_initializer_error
@@ -238,6 +238,69 @@ class TestRunCommand(BaseTestRun):
             self.assertEqual(stdout, '')
             self.assertEqual(stderr, '')
 
+    def testImportCache(self):
+        command = '; '.join((
+            'from mpi4py.util import importcache',
+            'import xml.dom.minidom',
+            'assert importcache.installed().hits > 0',
+        ))
+        for np in (1, 2):
+            status, stdout, stderr = execute(
+                np, ['-rc', 'import_cache=True', '-c', command])
+            self.assertEqual(status, 0)
+            self.assertEqual(stdout, '')
+            self.assertEqual(stderr, '')
+        command = '; '.join((
+            'from mpi4py.util import importcache',
+            'assert importcache.installed() is None',
+        ))
+        for value in ('no', 'off', '0', 'maybe'):
+            os.environ['MPI4PY_RC_IMPORT_CACHE'] = value
+            try:
+                status, stdout, stderr = execute(1, ['-c', command])
+            finally:
+                del os.environ['MPI4PY_RC_IMPORT_CACHE']
+            self.assertEqual(status, 0)
+            self.assertEqual(stdout, '')
+            if value == 'maybe':
+                self.assertIn('unexpected value', stderr)
+            else:
+                self.assertEqual(stderr, '')
+        command = '; '.join((
+            'from mpi4py import MPI',
+            'import xml.dom.minidom',
+            'assert MPI.COMM_WORLD.Get_rank() != 0',
+            'MPI.COMM_WORLD.Barrier()',
+        ))
+        for np in (1, 2):
+            status, stdout, stderr = execute(
+                np, ['-rc', 'import_cache=True', '-c', command])
+            self.assertNotEqual(status, 0)
+            self.assertIn('AssertionError', stderr)
+
+    def testProfile(self):
+        from tempfile import mkdtemp
+        from pstats import Stats
+        command = '; '.join((
+            'from mpi4py import MPI',
+            'MPI.COMM_WORLD.Barrier()',
+        ))
+        tempdir = mkdtemp()
+        try:
+            filename = os.path.join(tempdir, 'profile.prof')
+            for np in (1, 2):
+                status, stdout, stderr = execute(
+                    np, [f'--profile={filename}', '-c', command])
+                self.assertEqual(status, 0)
+                self.assertEqual(stdout, '')
+                self.assertTrue(stderr.startswith('function'))
+                stats = Stats(filename)
+                func = ('~', 0, "<method 'Barrier' of "
+                        "'mpi4py.MPI.Comm' objects>")
+                self.assertEqual(stats.stats[func][1], np)
+        finally:
+            shutil.rmtree(tempdir)
+
     def testException(self):
         command = '; '.join((
             'from mpi4py import MPI',
@@ -244,6 +244,12 @@ def setup(app):
         'mpi4py.run',
         'mpi4py.util.pkl5',
         'mpi4py.util.dtlib',
+        'mpi4py.util.shmem',
+        'mpi4py.util.sync',
+        'mpi4py.util.npyio',
+        'mpi4py.util.checkpoint',
+        'mpi4py.util.trace',
+        'mpi4py.util.importcache',
     ]
     typing_overload = typing.overload
     typing.overload = lambda arg: arg
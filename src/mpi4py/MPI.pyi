@@ -768,6 +768,12 @@ class Comm:
     def alltoall(self, sendobj: Sequence[Any]) -> List[Any]: ...
     def reduce(self, sendobj: Any, op: Union[Op, Callable[[Any, Any], Any]] = SUM, root: int = 0) -> Optional[Any]: ...
     def allreduce(self, sendobj: Any, op: Union[Op, Callable[[Any, Any], Any]] = SUM) -> Any: ...
+    def ibcast(self, obj: Any, root: int = 0) -> Request: ...
+    def igather(self, sendobj: Any, root: int = 0) -> Request: ...
+    def iscatter(self, sendobj: Optional[Sequence[Any]], root: int = 0) -> Request: ...
+    def iallgather(self, sendobj: Any) -> Request: ...
+    def ialltoall(self, sendobj: Sequence[Any]) -> Request: ...
+    def iallreduce(self, sendobj: Any, op: Union[Op, Callable[[Any, Any], Any]] = SUM) -> Request: ...
     group: Group
     size: int
     rank: int
@@ -798,8 +804,12 @@ class Intracomm(Comm):
     def Iexscan(self, sendbuf: Union[BufSpec, InPlace], recvbuf: BufSpec, op: Op = SUM) -> Request: ...
     def Scan_init(self, sendbuf: Union[BufSpec, InPlace], recvbuf: BufSpec, op: Op = SUM, info: Info = INFO_NULL) -> Prequest: ...
     def Exscan_init(self, sendbuf: Union[BufSpec, InPlace], recvbuf: BufSpec, op: Op = SUM, info: Info = INFO_NULL) -> Prequest: ...
+    def Allgatherv_alloc(self, sendbuf: BufSpec, recvtype: Optional[Datatype] = None) -> Tuple[memory, List[int], List[int]]: ...
+    def Alltoallv_alloc(self, sendbuf: Union[BufSpecV, List[BufSpec]], recvtype: Optional[Datatype] = None) -> Tuple[memory, List[int], List[int]]: ...
+    def Sparse_exchange(self, sendbufs: Mapping[int, BufSpec], recvtype: Datatype = BYTE) -> Dict[int, memory]: ...
     def scan(self, sendobj: Any, op: Union[Op, Callable[[Any, Any], Any]] = SUM) -> Any: ...
     def exscan(self, sendobj: Any, op: Union[Op, Callable[[Any, Any], Any]] = SUM) -> Any: ...
+    def sparse_exchange(self, sendobj: Mapping[int, Any]) -> Dict[int, Any]: ...
     def Spawn(self, command: str, args: Optional[Sequence[str]] = None, maxprocs: int = 1, info: Info = INFO_NULL, root: int = 0, errcodes: Optional[list] = None) -> Intercomm: ...
     def Spawn_multiple(self, command: Sequence[str], args: Optional[Sequence[Sequence[str]]] = None, maxprocs: Optional[Sequence[int]] = None, info: Union[Info, Sequence[Info]] = INFO_NULL, root: int = 0, errcodes: Optional[list] = None) -> Intercomm: ...
     def Accept(self, port_name: str, info: Info = INFO_NULL, root: int = 0) -> Intercomm: ...
@@ -1066,6 +1076,14 @@ class InPlaceType(int):
     def __new__(cls) -> InPlaceType: ...
     def __repr__(self) -> str: ...
 
+@final
+class BufferSpec:
+    def __init__(self, buf: BufSpec, *, readonly: bool = False) -> None: ...
+    buf: memory
+    count: int
+    datatype: Datatype
+    readonly: bool
+
 class Pickle:
     @overload
     def __init__(self,
@@ -1073,11 +1091,17 @@ class Pickle:
         loads: Callable[[Buffer], Any],
         protocol: Optional[int] = None,
         threshold: Optional[int] = None,
+        *,
+        compress: Any = None,
+        compress_threshold: Optional[int] = None,
     ) -> None: ...
     @overload
     def __init__(self,
         dumps: Optional[Callable[[Any], bytes]] = None,
         loads: Optional[Callable[[Buffer], Any]] = None,
+        *,
+        compress: Any = None,
+        compress_threshold: Optional[int] = None,
     ) -> None: ...
     def dumps(self, obj: Any) -> bytes: ...
     def loads(self, data: Buffer) -> Any: ...
@@ -1085,6 +1109,8 @@ class Pickle:
     def loads_oob(self, data: Buffer, buffers: Iterable[Buffer]) -> Any: ...
     PROTOCOL: Optional[int]
     THRESHOLD: int
+    COMPRESS: Any
+    COMPRESS_THRESHOLD: int
 
 pickle: Final[Pickle] = ...
 
@@ -1138,6 +1164,7 @@ def Wtick() -> float: ...
 def Pcontrol(level: int) -> None: ...
 def get_vendor() -> Tuple[str, Tuple[int, int, int]]: ...
 def _set_abort_status(status: Any) -> None: ...
+def _import_cache() -> bool: ...
 def _comm_lock(comm: Comm, key: Hashable = None) -> Lock: ...
 def _comm_lock_table(comm: Comm) -> Dict[Hashable, Lock]: ...
 _lock_table = _comm_lock_table
@@ -1148,6 +1175,10 @@ def _typealign(datatype: Datatype) -> Optional[int]: ...
 def _sizeof(arg: Any) -> int: ...
 def _addressof(arg: Any) -> int: ...
 def _handleof(arg: Any) -> int: ...
+def _trace_start(size: int = 65536) -> None: ...
+def _trace_stop() -> None: ...
+def _trace_events() -> Tuple[int, List[Tuple]]: ...
+def _trace_report() -> None: ...
 
 __pyx_capi__: Final[Dict[str, Any]] = ...
 _typedict: Final[Dict[str, Datatype]] = ...
@@ -2002,6 +2002,70 @@ cdef class Comm:
         """Reduce to All"""
         cdef MPI_Comm comm = self.ob_mpi
         return PyMPI_allreduce(sendobj, op, comm)
+    #
+    def ibcast(
+        self,
+        obj: Any,
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Broadcast"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_ibcast(obj, root, comm, request)
+        return request
+    #
+    def igather(
+        self,
+        sendobj: Any,
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Gather"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_igather(sendobj, root, comm, request)
+        return request
+    #
+    def iscatter(
+        self,
+        sendobj: Optional[Sequence[Any]],
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Scatter"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_iscatter(sendobj, root, comm, request)
+        return request
+    #
+    def iallgather(
+        self,
+        sendobj: Any,
+    ) -> Request:
+        """Nonblocking Gather to All"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_iallgather(sendobj, comm, request)
+        return request
+    #
+    def ialltoall(
+        self,
+        sendobj: Sequence[Any],
+    ) -> Request:
+        """Nonblocking All to All Scatter/Gather"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_ialltoall(sendobj, comm, request)
+        return request
+    #
+    def iallreduce(
+        self,
+        sendobj: Any,
+        op: Union[Op, Callable[[Any, Any], Any]] = SUM,
+    ) -> Request:
+        """Nonblocking Reduce to All"""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>Request.__new__(Request)
+        PyMPI_iallreduce(sendobj, op, comm, request)
+        return request
 
 
 cdef class Intracomm(Comm):
@@ -2328,6 +2392,52 @@ cdef class Intracomm(Comm):
         request.ob_buf = m
         return request
 
+    # Vector Collectives with Receive Allocation
+
+    def Allgatherv_alloc(
+        self,
+        sendbuf: BufSpec,
+        Datatype recvtype: Optional[Datatype] = None,
+    ) -> Tuple[memory, List[int], List[int]]:
+        """
+        Gather to All Vector, allocating the receive buffer
+        """
+        cdef _p_msg_cco m = message_cco()
+        m.for_allgatherv_alloc(sendbuf, recvtype, self.ob_mpi)
+        with nogil: CHKERR( MPI_Allgatherv_c(
+            m.sbuf, m.scount,             m.stype,
+            m.rbuf, m.rcounts, m.rdispls, m.rtype,
+            self.ob_mpi) )
+        return m._rmsg
+
+    def Alltoallv_alloc(
+        self,
+        sendbuf: Union[BufSpecV, List[BufSpec]],
+        Datatype recvtype: Optional[Datatype] = None,
+    ) -> Tuple[memory, List[int], List[int]]:
+        """
+        All to All Scatter/Gather Vector, allocating the receive buffer
+        """
+        cdef _p_msg_cco m = message_cco()
+        m.for_alltoallv_alloc(sendbuf, recvtype, self.ob_mpi)
+        with nogil: CHKERR( MPI_Alltoallv_c(
+            m.sbuf, m.scounts, m.sdispls, m.stype,
+            m.rbuf, m.rcounts, m.rdispls, m.rtype,
+            self.ob_mpi) )
+        return m._rmsg
+
+    # Sparse Data Exchange
+
+    def Sparse_exchange(
+        self,
+        sendbufs: Mapping[int, BufSpec],
+        Datatype recvtype: Datatype = BYTE,
+    ) -> Dict[int, memory]:
+        """
+        Sparse dynamic data exchange
+        """
+        return PyMPI_sparse_exchange_buf(sendbufs, recvtype, self.ob_mpi)
+
     # Python Communication
     #
     def scan(
@@ -2347,6 +2457,14 @@ cdef class Intracomm(Comm):
         """Exclusive Scan"""
         cdef MPI_Comm comm = self.ob_mpi
         return PyMPI_exscan(sendobj, op, comm)
+    #
+    def sparse_exchange(
+        self,
+        sendobj: Mapping[int, Any],
+    ) -> Dict[int, Any]:
+        """Sparse dynamic data exchange"""
+        cdef MPI_Comm comm = self.ob_mpi
+        return PyMPI_sparse_exchange_obj(sendobj, comm)
 
     # Establishing Communication
     # --------------------------
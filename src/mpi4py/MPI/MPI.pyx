@@ -19,10 +19,13 @@ include "asarray.pxi"
 include "objmodel.pxi"
 include "attrimpl.pxi"
 include "errhimpl.pxi"
+include "traceimpl.pxi"
 include "msgbuffer.pxi"
 include "msgpickle.pxi"
 include "CAPI.pxi"
 
+trace_bootstrap()
+
 
 # Assorted constants
 # ------------------
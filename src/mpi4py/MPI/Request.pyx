@@ -26,6 +26,7 @@ cdef class Request:
         Wait for a send or receive to complete
         """
         cdef MPI_Status *statusp = arg_Status(status)
+        if icoll_pending(self): icoll_advance(self, 1)
         with nogil: CHKERR( MPI_Wait(
             &self.ob_mpi, statusp) )
         if self.ob_mpi == MPI_REQUEST_NULL:
@@ -38,6 +39,8 @@ cdef class Request:
         """
         cdef int flag = 0
         cdef MPI_Status *statusp = arg_Status(status)
+        if icoll_pending(self):
+            if not icoll_advance(self, 0): return False
         with nogil: CHKERR( MPI_Test(
             &self.ob_mpi, &flag, statusp) )
         if self.ob_mpi == MPI_REQUEST_NULL:
@@ -48,6 +51,7 @@ cdef class Request:
         """
         Free a communication request
         """
+        if icoll_pending(self): icoll_discard(self)
         with nogil: CHKERR( MPI_Request_free(&self.ob_mpi) )
 
     def Get_status(self, Status status: Optional[Status] = None) -> bool:
@@ -56,6 +60,8 @@ cdef class Request:
         """
         cdef int flag = 0
         cdef MPI_Status *statusp = arg_Status(status)
+        if icoll_pending(self):
+            if not icoll_advance(self, 0): return False
         with nogil: CHKERR( MPI_Request_get_status(
             self.ob_mpi, &flag, statusp) )
         return <bint>flag
@@ -77,6 +83,7 @@ cdef class Request:
         cdef int index = MPI_UNDEFINED
         cdef MPI_Status *statusp = arg_Status(status)
         #
+        icoll_advance_all(requests, 1)
         cdef tmp = acquire_rs(requests, None, &count, &irequests, NULL)
         try:
             with nogil: CHKERR( MPI_Waitany(
@@ -99,12 +106,18 @@ cdef class Request:
         cdef int index = MPI_UNDEFINED
         cdef int flag = 0
         cdef MPI_Status *statusp = arg_Status(status)
+        cdef object pending = None
         #
+        icoll_advance_all(requests, 0)
         cdef tmp = acquire_rs(requests, None, &count, &irequests, NULL)
         try:
+            pending = icoll_mask(requests, irequests)
             with nogil: CHKERR( MPI_Testany(
                 count, irequests, &index, &flag, statusp) )
+            if pending and index == MPI_UNDEFINED:
+                flag = 0
         finally:
+            icoll_unmask(requests, irequests, pending)
             release_rs(requests, None, count, irequests, 0, NULL)
         #
         return (index, <bint>flag)
@@ -122,6 +135,7 @@ cdef class Request:
         cdef MPI_Request *irequests = NULL
         cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
         #
+        icoll_advance_all(requests, 1)
         cdef tmp = acquire_rs(requests, statuses,
                               &count, &irequests, &istatuses)
         try:
@@ -145,6 +159,8 @@ cdef class Request:
         cdef int flag = 0
         cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
         #
+        if not icoll_advance_all(requests, 0):
+            return False
         cdef tmp = acquire_rs(requests, statuses,
                               &count, &irequests, &istatuses)
         try:
@@ -168,6 +184,7 @@ cdef class Request:
         cdef int outcount = MPI_UNDEFINED, *iindices = NULL
         cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
         #
+        icoll_advance_all(requests, 1)
         cdef tmp1 = acquire_rs(requests, statuses,
                                &incount, &irequests, &istatuses)
         cdef tmp2 = newarray(incount, &iindices)
@@ -197,14 +214,20 @@ cdef class Request:
         cdef MPI_Request *irequests = NULL
         cdef int outcount = MPI_UNDEFINED, *iindices = NULL
         cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
+        cdef object pending = None
         #
+        icoll_advance_all(requests, 0)
         cdef tmp1 = acquire_rs(requests, statuses,
                                &incount, &irequests, &istatuses)
         cdef tmp2 = newarray(incount, &iindices)
         try:
+            pending = icoll_mask(requests, irequests)
             with nogil: CHKERR( MPI_Testsome(
                 incount, irequests, &outcount, iindices, istatuses) )
+            if pending and outcount == MPI_UNDEFINED:
+                outcount = 0
         finally:
+            icoll_unmask(requests, irequests, pending)
             release_rs(requests, statuses,
                        incount, irequests,
                        outcount, istatuses)
@@ -274,6 +297,8 @@ cdef class Request:
         """
         cdef int flag = 0
         cdef MPI_Status *statusp = arg_Status(status)
+        if icoll_pending(self):
+            if not icoll_advance(self, 0): return False
         with nogil: CHKERR( MPI_Request_get_status(
             self.ob_mpi, &flag, statusp) )
         return <bint>flag
@@ -24,9 +24,9 @@ cdef extern from "Python.h":
         Py_ssize_t itemsize
         bint readonly
         char *format
-        #int ndim
-        #Py_ssize_t *shape
-        #Py_ssize_t *strides
+        int ndim
+        Py_ssize_t *shape
+        Py_ssize_t *strides
         #Py_ssize_t *suboffsets
     cdef enum:
         PyBUF_SIMPLE
@@ -77,6 +77,25 @@ cdef int PyMPI_GetBuffer(object obj, Py_buffer *view, int flags) except -1:
         except BaseException: raise
         raise
 
+cdef int PyMPI_GetStridedBuffer(object obj, Py_buffer *view, int flags,
+                                list layout) except -1:
+    cdef int i
+    if PyObject_CheckBuffer(obj):
+        PyObject_GetBuffer(obj, view, flags)
+        if view.strides == NULL:
+            PyBuffer_Release(view)
+            raise BufferError("buffer without strides")
+        layout.append((
+            tuple([view.shape[i] for i in range(view.ndim)]),
+            tuple([view.strides[i] for i in range(view.ndim)]),
+        ))
+        return 0
+    if Py_CheckDLPackBuffer(obj):
+        return Py_GetDLPackBuffer(obj, view, flags, layout)
+    if Py_CheckCAIBuffer(obj):
+        return Py_GetCAIBuffer(obj, view, flags, layout)
+    raise BufferError("object does not expose a strided buffer")
+
 #------------------------------------------------------------------------------
 
 @cython.final
@@ -87,6 +106,7 @@ cdef class memory:
     """
 
     cdef Py_buffer view
+    cdef Py_ssize_t nitems
 
     def __cinit__(self, *args):
         if args:
@@ -209,6 +229,14 @@ cdef class memory:
         PyBuffer_FillInfo(view, self,
                           self.view.buf, self.view.len,
                           self.view.readonly, flags)
+        if self.view.format == NULL: return
+        if self.view.itemsize <= 0: return
+        if (flags & PyBUF_FORMAT) != PyBUF_FORMAT: return
+        view.format = self.view.format
+        view.itemsize = self.view.itemsize
+        if view.shape != NULL:
+            self.nitems = self.view.len // self.view.itemsize
+            view.shape = &self.nitems
 
     # sequence interface (basic)
 
@@ -273,6 +301,14 @@ cdef inline memory getbuffer(object ob, bint readonly, bint format):
     PyMPI_GetBuffer(ob, &buf.view, flags)
     return buf
 
+cdef memory getbuffer_strided(object ob, bint readonly, list layout):
+    cdef memory buf = newbuffer()
+    cdef int flags = PyBUF_STRIDES | PyBUF_FORMAT
+    if not readonly:
+        flags |= PyBUF_WRITABLE
+    PyMPI_GetStridedBuffer(ob, &buf.view, flags, layout)
+    return buf
+
 cdef inline memory asbuffer(object ob, void **base, MPI_Aint *size, bint ro):
     cdef memory buf
     if type(ob) is memory:
@@ -23,6 +23,15 @@ cdef inline int cuda_is_contig(tuple shape,
         size *= dim
     return 1
 
+cdef inline list cuda_get_strides(tuple shape, Py_ssize_t itemsize):
+    cdef Py_ssize_t ndim = len(shape)
+    cdef list strides = [0] * ndim
+    cdef Py_ssize_t size = itemsize
+    for i in reversed(range(ndim)):
+        strides[i] = size
+        size *= <Py_ssize_t>shape[i]
+    return strides
+
 cdef inline char* cuda_get_format(char typekind, Py_ssize_t itemsize) nogil:
    if typekind == c'b':
        if itemsize == sizeof(char): return b"?"
@@ -56,7 +65,8 @@ cdef int Py_CheckCAIBuffer(object obj):
     try: return <bint>hasattr(obj, '__cuda_array_interface__')
     except: return 0
 
-cdef int Py_GetCAIBuffer(object obj, Py_buffer *view, int flags) except -1:
+cdef int Py_GetCAIBuffer(object obj, Py_buffer *view, int flags,
+                         list layout=None) except -1:
     cdef dict cuda_array_interface
     cdef tuple data
     cdef str   typestr
@@ -124,7 +134,7 @@ cdef int Py_GetCAIBuffer(object obj, Py_buffer *view, int flags) except -1:
             f"buffer with negative size "
             f"(shape:{shape}, size:{size})"
         )
-    if (strides is not None and
+    if (layout is None and strides is not None and
         not cuda_is_contig(shape, strides, itemsize, c'C') and
         not cuda_is_contig(shape, strides, itemsize, c'F')):
         raise BufferError(
@@ -132,6 +142,10 @@ cdef int Py_GetCAIBuffer(object obj, Py_buffer *view, int flags) except -1:
             f"buffer is not contiguous "
             f"(shape:{shape}, strides:{strides}, itemsize:{itemsize})"
         )
+    if layout is not None:
+        if strides is None:
+            strides = tuple(cuda_get_strides(shape, itemsize))
+        layout.append((shape, strides))
     if descr is not None and (len(descr) != 1 or descr[0] != ('', typestr)):
         PyErr_WarnFormat(
             RuntimeWarning, 1,
@@ -105,6 +105,21 @@ cdef inline int dlpack_check_contig(const DLTensor *dltensor) except -1:
     if dlpack_is_contig(dltensor, c'F'): return 0
     raise BufferError("dlpack: buffer is not contiguous")
 
+cdef inline tuple dlpack_get_layout(const DLTensor *dltensor,
+                                    Py_ssize_t itemsize):
+    cdef int i, ndim = dltensor.ndim
+    cdef list shape = [dltensor.shape[i] for i in range(ndim)]
+    cdef list strides = [0] * ndim
+    cdef Py_ssize_t size = itemsize
+    if dltensor.strides == NULL:
+        for i in reversed(range(ndim)):
+            strides[i] = size
+            size *= shape[i]
+    else:
+        for i in range(ndim):
+            strides[i] = dltensor.strides[i] * itemsize
+    return (tuple(shape), tuple(strides))
+
 cdef inline void *dlpack_get_data(const DLTensor *dltensor) nogil:
     return <char*> dltensor.data + dltensor.byte_offset
 
@@ -170,7 +185,8 @@ cdef int Py_CheckDLPackBuffer(object obj):
     try: return <bint>hasattr(obj, '__dlpack__')
     except: return 0
 
-cdef int Py_GetDLPackBuffer(object obj, Py_buffer *view, int flags) except -1:
+cdef int Py_GetDLPackBuffer(object obj, Py_buffer *view, int flags,
+                            list layout=None) except -1:
     cdef object dlpack
     cdef object dlpack_device
     cdef unsigned device_type
@@ -203,7 +219,11 @@ cdef int Py_GetDLPackBuffer(object obj, Py_buffer *view, int flags) except -1:
 
     try:
         dlpack_check_shape(dltensor)
-        dlpack_check_contig(dltensor)
+        if layout is None:
+            dlpack_check_contig(dltensor)
+        else:
+            layout.append(dlpack_get_layout(
+                dltensor, dlpack_get_itemsize(dltensor)))
 
         buf = dlpack_get_data(dltensor)
         size = dlpack_get_size(dltensor)
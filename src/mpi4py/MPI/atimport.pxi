@@ -69,6 +69,8 @@ ctypedef struct Options:
     int fast_reduce
     int recv_mprobe
     int errors
+    int trace
+    int import_cache
 
 cdef Options options
 options.initialize = 1
@@ -78,6 +80,8 @@ options.finalize = 1
 options.fast_reduce = 1
 options.recv_mprobe = 1
 options.errors = 1
+options.trace = 0
+options.import_cache = 0
 
 cdef object getOpt(object rc, const char name[], object value):
     cdef bytes bname = b"MPI4PY_RC_" + name.upper()
@@ -119,6 +123,8 @@ cdef int getOptions(Options* opts) except -1:
     opts.fast_reduce = 1
     opts.recv_mprobe = USE_MATCHED_RECV
     opts.errors = 1
+    opts.trace = 0
+    opts.import_cache = 0
     try: from . import rc
     except: return 0
     #
@@ -129,6 +135,8 @@ cdef int getOptions(Options* opts) except -1:
     cdef object fast_reduce  = getOpt(rc, b"fast_reduce"  , True        )
     cdef object recv_mprobe  = getOpt(rc, b"recv_mprobe"  , True        )
     cdef object errors       = getOpt(rc, b"errors"       , 'exception' )
+    cdef object trace        = getOpt(rc, b"trace"        , False       )
+    cdef object import_cache = getOpt(rc, b"import_cache" , False       )
     #
     if initialize in (True, 'yes'):
         opts.initialize = 1
@@ -189,6 +197,20 @@ cdef int getOptions(Options* opts) except -1:
     else:
         warnOpt(b"errors", errors)
     #
+    if trace in (True, 'yes'):
+        opts.trace = 1
+    elif trace in (False, 'no'):
+        opts.trace = 0
+    else:
+        warnOpt(b"trace", trace)
+    #
+    if import_cache in (True, 'yes'):
+        opts.import_cache = 1
+    elif import_cache in (False, 'no'):
+        opts.import_cache = 0
+    else:
+        warnOpt(b"import_cache", import_cache)
+    #
     return 0
 
 # -----------------------------------------------------------------------------
@@ -341,6 +363,10 @@ def _set_abort_status(object status: Any) -> None:
     except:
         abort_status = 1 if status else 0
 
+def _import_cache() -> bool:
+    "Helper for ``python -m mpi4py.run ...``"
+    return <bint>options.import_cache
+
 # -----------------------------------------------------------------------------
 
 # Vile hack for raising a exception and not contaminate the traceback
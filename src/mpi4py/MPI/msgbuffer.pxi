@@ -109,9 +109,70 @@ cdef inline Datatype asdatatype(object datatype):
         return <Datatype> datatype
     return lookup_datatype(datatype)
 
-cdef inline Datatype getdatatype(const char format[]):
+cdef dict StructTypeCache = {}
+
+cdef Datatype lookup_structtype(object obj, object key, Py_ssize_t itemsize):
+    cdef object cache_key = (key, itemsize)
+    cdef Datatype datatype = StructTypeCache.get(cache_key)
+    if datatype is not None and datatype.ob_mpi != MPI_DATATYPE_NULL:
+        return datatype
+    from .util.dtlib import _get_buffer_datatype
+    datatype = <Datatype?> _get_buffer_datatype(obj, itemsize)
+    if len(StructTypeCache) >= 128: StructTypeCache.clear()
+    StructTypeCache[cache_key] = datatype
+    return datatype
+
+cdef inline Datatype getdatatype(const char format[],
+                                 object obj, Py_ssize_t itemsize):
     if format == BYTE_FMT: return __BYTE__
-    return lookup_datatype(pystr(getformat(format)))
+    cdef object key = pystr(getformat(format))
+    if key.startswith('T{'):
+        return lookup_structtype(obj, key, itemsize)
+    return lookup_datatype(key)
+
+cdef dict StridedTypeCache = {}
+
+cdef Datatype lookup_stridedtype(Datatype base, object key,
+                                 tuple layout, MPI_Count *size):
+    cdef tuple shape, strides
+    (shape, strides) = layout
+    cdef list dims = [(n, s) for (n, s) in zip(shape, strides) if n != 1]
+    cdef Py_ssize_t n, s
+    for (n, s) in dims:
+        if s <= 0: raise BufferError(
+            f"message: cannot handle buffer "
+            f"(shape:{shape}, strides:{strides})")
+    if not dims: dims = [(1, base.Get_extent()[1])]
+    size[0] = <MPI_Count> (dims[0][0] * dims[0][1])
+    cdef object cache_key = (key, tuple(dims))
+    cdef Datatype datatype = StridedTypeCache.pop(cache_key, None)
+    if datatype is not None and datatype.ob_mpi != MPI_DATATYPE_NULL:
+        StridedTypeCache[cache_key] = datatype
+        return datatype
+    cdef Datatype oldtype = base
+    for (n, s) in reversed(dims[1:]):
+        datatype = oldtype.Create_hvector(n, 1, s)
+        if oldtype is not base: oldtype.Free()
+        oldtype = datatype
+    datatype = oldtype.Create_resized(0, dims[0][1])
+    if oldtype is not base: oldtype.Free()
+    datatype.Commit()
+    # evicted datatypes are not freed, their handles may still be
+    # in use by messages, buffer specs, or persistent requests
+    if len(StridedTypeCache) >= 128:
+        del StridedTypeCache[next(iter(StridedTypeCache))]
+    StridedTypeCache[cache_key] = datatype
+    return datatype
+
+cdef memory getbuffer_message(object ob, bint readonly, list layout):
+    try:
+        return getbuffer(ob, readonly, 1)
+    except BaseException:
+        try:
+            return getbuffer_strided(ob, readonly, layout)
+        except BaseException:
+            pass
+        raise
 
 @cython.final
 @cython.internal
@@ -140,16 +201,27 @@ cdef _p_message message_basic(object o_buf,
         btype[0] = m.type.ob_mpi
         return m
     # get message buffer
-    cdef bint fmt = (o_type is None)
-    m.buf = getbuffer(o_buf, readonly, fmt)
+    cdef list layout = None
+    if o_type is not None:
+        m.buf = getbuffer(o_buf, readonly, 0)
+    else:
+        layout = []
+        m.buf = getbuffer_message(o_buf, readonly, layout)
     # get message datatype
+    cdef MPI_Count size = m.buf.view.len
     if o_type is not None:
         m.type = asdatatype(o_type)
     else:
-        m.type = getdatatype(m.buf.view.format)
+        m.type = getdatatype(m.buf.view.format, o_buf, m.buf.view.itemsize)
+    # non-contiguous buffer, use a strided datatype
+    if layout:
+        m.type = lookup_stridedtype(
+            m.type, (pystr(getformat(m.buf.view.format)),
+                     m.buf.view.itemsize),
+            layout[0], &size)
     # return collected message data
     baddr[0] = <void*> m.buf.view.buf
-    bsize[0] = <MPI_Aint> m.buf.view.len
+    bsize[0] = size
     btype[0] = m.type.ob_mpi
     return m
 
@@ -168,6 +240,10 @@ cdef _p_message message_simple(object msg,
         _count[0] = 0
         _type[0]  = MPI_BYTE
         return None
+    # special-case prepared buffer specification
+    if type(msg) is BufferSpec:
+        return (<BufferSpec>msg).resolve(
+            readonly, blocks, _addr, _count, _type)
     # unpack message list/tuple
     cdef Py_ssize_t nargs = 0
     cdef object o_buf   = None
@@ -253,13 +329,101 @@ cdef _p_message message_simple(object msg,
                 f"required number of blocks {blocks}")
             count = (length // extent) // blocks
     # return collected message data
-    m.count = o_count if o_count is not None else count
+    m.count = o_count
     m.displ = o_displ if o_displ is not None else displ
     _addr[0]  = <void*>(<char*>baddr + offset)
     _count[0] = count
     _type[0]  = btype
     return m
 
+
+@cython.final
+cdef class BufferSpec:
+
+    """
+    Prepared buffer specification
+    """
+
+    cdef _p_message   ob_msg
+    cdef void         *ob_addr
+    cdef MPI_Count    ob_count
+    cdef MPI_Datatype ob_type
+    cdef bint         ob_rdonly
+    cdef bint         ob_infer
+
+    def __cinit__(self, *args, **kwargs):
+        self.ob_msg = None
+        self.ob_addr = NULL
+        self.ob_count = 0
+        self.ob_type = MPI_DATATYPE_NULL
+        self.ob_rdonly = 1
+        self.ob_infer = 0
+
+    def __init__(
+        self,
+        buf: BufSpec,
+        *,
+        readonly: bool = False,
+    ) -> None:
+        cdef void *addr = NULL
+        cdef MPI_Count count = 0
+        cdef MPI_Datatype dtype = MPI_DATATYPE_NULL
+        cdef _p_message m = message_simple(
+            buf, readonly, 0, 1, &addr, &count, &dtype)
+        self.ob_msg = m
+        self.ob_addr = addr
+        self.ob_count = count
+        self.ob_type = dtype
+        self.ob_rdonly = readonly
+        self.ob_infer = m.count is None
+
+    cdef _p_message resolve(self,
+                            int readonly,
+                            int blocks,
+                            #
+                            void         **_addr,
+                            MPI_Count    *_count,
+                            MPI_Datatype *_type,
+                            ):
+        if self.ob_msg is None: raise ValueError(
+            "message: uninitialized buffer specification")
+        if self.ob_rdonly and not readonly: raise BufferError(
+            "message: read-only buffer specification")
+        cdef MPI_Count count = self.ob_count
+        if blocks >= 2 and self.ob_infer:
+            if (count % blocks) != 0: raise ValueError(
+                f"message: cannot infer count, "
+                f"number of entries {count} is not a multiple of "
+                f"required number of blocks {blocks}")
+            count = count // blocks
+        _addr[0]  = self.ob_addr
+        _count[0] = count
+        _type[0]  = self.ob_type
+        return self.ob_msg
+
+    property buf:
+        """buffer"""
+        def __get__(self) -> memory:
+            if self.ob_msg is None: return None
+            return self.ob_msg.buf
+
+    property count:
+        """number of datatype entries"""
+        def __get__(self) -> int:
+            return self.ob_count
+
+    property datatype:
+        """datatype"""
+        def __get__(self) -> Datatype:
+            if self.ob_msg is None: return None
+            return self.ob_msg.type
+
+    property readonly:
+        """read-only buffer"""
+        def __get__(self) -> bool:
+            return self.ob_rdonly
+
+
 cdef _p_message message_vector(object msg,
                                int readonly,
                                int rank,
@@ -432,6 +596,7 @@ cdef class _p_msg_p2p:
                                    &self.buf,
                                    &self.count,
                                    &self.dtype)
+        trace_message(rank, self.count, self.dtype)
         return 0
 
     cdef int for_recv(self, object msg, int rank, int parts) except -1:
@@ -440,6 +605,7 @@ cdef class _p_msg_p2p:
                                    &self.buf,
                                    &self.count,
                                    &self.dtype)
+        trace_message(rank, self.count, self.dtype)
         return 0
 
 cdef inline _p_msg_p2p message_p2p_send(object sendbuf, int dest):
@@ -464,6 +630,70 @@ cdef inline _p_msg_p2p message_p2p_precv(object recvbuf, int source, int parts):
 
 #------------------------------------------------------------------------------
 
+cdef int message_alloc_type(Datatype rtype,
+                            MPI_Datatype stype,
+                            MPI_Datatype *_rtype,
+                            ) except -1:
+    if rtype is not None:
+        _rtype[0] = rtype.ob_mpi
+        return 0
+    cdef MPI_Count size = 0, lb = 0, extent = 0
+    CHKERR( MPI_Type_size_c(stype, &size) )
+    CHKERR( MPI_Type_get_extent_c(stype, &lb, &extent) )
+    if lb != 0 or size != extent: raise ValueError(
+        f"message: cannot infer receive datatype, "
+        f"send datatype is not contiguous "
+        f"(size:{size}, lb:{lb}, ub:{lb+extent})")
+    _rtype[0] = stype
+    return 0
+
+cdef tuple message_alloc(int blocks,
+                         MPI_Count rsizes[],
+                         MPI_Datatype rtype,
+                         #
+                         void       **_addr,
+                         MPI_Count  **_counts,
+                         MPI_Aint   **_displs,
+                         list keep,
+                         ):
+    cdef MPI_Count size = 0
+    CHKERR( MPI_Type_size_c(rtype, &size) )
+    if size <= 0: raise ValueError(
+        f"message: receive datatype size {size} is not positive")
+    keep.append(newarray(blocks, _counts))
+    keep.append(newarray(blocks, _displs))
+    cdef list counts = [None] * blocks
+    cdef list displs = [None] * blocks
+    cdef MPI_Count count = 0, total = 0
+    for i in range(blocks):
+        if (rsizes[i] % size) != 0: raise ValueError(
+            f"message: received size {rsizes[i]} from process {i} "
+            f"is not a multiple of receive datatype size {size}")
+        count = rsizes[i] // size
+        _counts[0][i] = count
+        _displs[0][i] = <MPI_Aint> total
+        counts[i] = count
+        displs[i] = total
+        total += count
+    cdef memory buf = message_alloc_buffer(total, rtype, _addr)
+    return (buf, counts, displs)
+
+cdef memory message_alloc_buffer(MPI_Count count,
+                                 MPI_Datatype datatype,
+                                 void **_addr):
+    # the buffer spans the true extent of the entries,
+    # and the returned address is shifted by the true lower bound
+    cdef MPI_Count lb = 0, extent = 0, tlb = 0, textent = 0
+    cdef MPI_Count nbytes = 0
+    CHKERR( MPI_Type_get_extent_c(datatype, &lb, &extent) )
+    CHKERR( MPI_Type_get_true_extent_c(datatype, &tlb, &textent) )
+    if count > 0: nbytes = (count - 1) * extent + textent
+    cdef memory buf = memory.allocate(nbytes)
+    _addr[0] = <char*> buf.view.buf - tlb
+    return buf
+
+#------------------------------------------------------------------------------
+
 @cython.final
 @cython.internal
 cdef class _p_msg_cco:
@@ -865,6 +1095,130 @@ cdef class _p_msg_cco:
         return 0
 
 
+    # Vector Collectives with Receive Allocation
+    # ------------------------------------------
+
+    # per-destination sendbuf arguments, packed contiguously
+    cdef int for_cco_send_list(self,
+                               list amsg, Datatype rtype,
+                               int blocks) except -1:
+        if len(amsg) != blocks: raise ValueError(
+            f"expecting {blocks} items, got {len(amsg)}")
+        cdef list msgs = [None] * blocks
+        cdef void **addrs = NULL
+        cdef MPI_Count *counts = NULL
+        cdef MPI_Datatype *types = NULL
+        cdef object tmp1 = allocate(blocks, sizeof(void*), &addrs)
+        cdef object tmp2 = newarray(blocks, &counts)
+        cdef object tmp3 = allocate(blocks, sizeof(MPI_Datatype), &types)
+        for i in range(blocks):
+            msgs[i] = message_simple(
+                amsg[i], 1, i, 0, &addrs[i], &counts[i], &types[i])
+            if types[i] != types[0]: raise ValueError(
+                f"message: send datatype of item {i} "
+                f"does not match the one of item 0")
+        message_alloc_type(rtype, types[0], &self.stype)
+        # counts and displacements in entries of the packed datatype
+        cdef MPI_Count size = 0, lb = 0, extent = 0
+        cdef MPI_Count tsize = 0, tlb = 0, textent = 0
+        cdef MPI_Count nbytes = 0, total = 0
+        CHKERR( MPI_Type_size_c(self.stype, &tsize) )
+        CHKERR( MPI_Type_get_extent_c(self.stype, &tlb, &textent) )
+        if tsize <= 0: raise ValueError(
+            f"message: send datatype size {tsize} is not positive")
+        cdef object tmp4 = newarray(blocks, &self.scounts)
+        cdef object tmp5 = newarray(blocks, &self.sdispls)
+        for i in range(blocks):
+            CHKERR( MPI_Type_size_c(types[i], &size) )
+            nbytes = counts[i] * size
+            if (nbytes % tsize) != 0: raise ValueError(
+                f"message: send size {nbytes} to process {i} "
+                f"is not a multiple of datatype size {tsize}")
+            self.scounts[i] = nbytes // tsize
+            self.sdispls[i] = <MPI_Aint> total
+            total += self.scounts[i]
+        # pack send buffers, using MPI_Pack() and MPI_Unpack()
+        # to convert the layout of non-contiguous datatypes
+        cdef void *base = NULL
+        cdef memory buf = message_alloc_buffer(total, self.stype, &base)
+        cdef bint contiguous = (tlb == 0 and tsize == textent)
+        cdef MPI_Count psize = 0, position = 0
+        cdef void *pbuf = NULL
+        cdef object tmp6 = None
+        for i in range(blocks):
+            if self.scounts[i] == 0: continue
+            CHKERR( MPI_Type_size_c(types[i], &size) )
+            CHKERR( MPI_Type_get_extent_c(types[i], &lb, &extent) )
+            if contiguous and lb == 0 and size == extent:
+                <void>memcpy(<char*>base + self.sdispls[i] * textent,
+                       addrs[i], <size_t> (counts[i] * size))
+                continue
+            CHKERR( MPI_Pack_size_c(
+                counts[i], types[i], MPI_COMM_SELF, &psize) )
+            tmp6 = allocate(psize, 1, &pbuf)
+            position = 0
+            with nogil: CHKERR( MPI_Pack_c(
+                addrs[i], counts[i], types[i],
+                pbuf, psize, &position, MPI_COMM_SELF) )
+            position = 0
+            with nogil: CHKERR( MPI_Unpack_c(
+                pbuf, psize, &position,
+                <char*>base + self.sdispls[i] * textent,
+                self.scounts[i], self.stype, MPI_COMM_SELF) )
+        self.sbuf = base
+        self._smsg = (buf, tmp4, tmp5)
+        return 0
+
+    # allgatherv
+    cdef int for_allgatherv_alloc(self,
+                                  object smsg, Datatype rtype,
+                                  MPI_Comm comm) except -1:
+        if comm == MPI_COMM_NULL: return 0
+        cdef int size=0
+        CHKERR( MPI_Comm_size(comm, &size) )
+        self.for_cco_send(0, smsg, 0, 0)
+        message_alloc_type(rtype, self.stype, &self.rtype)
+        cdef MPI_Count ssize = 0, *rsizes = NULL
+        cdef object tmp = newarray(size, &rsizes)
+        CHKERR( MPI_Type_size_c(self.stype, &ssize) )
+        ssize *= self.scount
+        CHKERR( MPI_Allgather_c(
+            &ssize, 1, MPI_COUNT,
+            rsizes, 1, MPI_COUNT, comm) )
+        self._rcnt = []
+        self._rmsg = message_alloc(
+            size, rsizes, self.rtype,
+            &self.rbuf, &self.rcounts, &self.rdispls, self._rcnt)
+        return 0
+
+    # alltoallv
+    cdef int for_alltoallv_alloc(self,
+                                 object smsg, Datatype rtype,
+                                 MPI_Comm comm) except -1:
+        if comm == MPI_COMM_NULL: return 0
+        cdef int size=0
+        CHKERR( MPI_Comm_size(comm, &size) )
+        if is_list(smsg):
+            self.for_cco_send_list(smsg, rtype, size)
+        else:
+            self.for_cco_send(1, smsg, 0, size)
+        message_alloc_type(rtype, self.stype, &self.rtype)
+        cdef MPI_Count tsize = 0, *ssizes = NULL, *rsizes = NULL
+        cdef object tmp1 = newarray(size, &ssizes)
+        cdef object tmp2 = newarray(size, &rsizes)
+        CHKERR( MPI_Type_size_c(self.stype, &tsize) )
+        for i in range(size):
+            ssizes[i] = self.scounts[i] * tsize
+        CHKERR( MPI_Alltoall_c(
+            ssizes, 1, MPI_COUNT,
+            rsizes, 1, MPI_COUNT, comm) )
+        self._rcnt = []
+        self._rmsg = message_alloc(
+            size, rsizes, self.rtype,
+            &self.rbuf, &self.rcounts, &self.rdispls, self._rcnt)
+        return 0
+
+
 cdef inline _p_msg_cco message_cco():
     cdef _p_msg_cco msg = _p_msg_cco.__new__(_p_msg_cco)
     return msg
@@ -1013,6 +1367,7 @@ cdef class _p_msg_rma:
         else:
             raise ValueError("target: expecting integral or list/tuple")
         self._target = target
+        trace_message(rank, self.ocount, self.otype)
         return 0
 
     cdef int for_put(self, object origin, int rank, object target) except -1:
@@ -1034,6 +1389,7 @@ cdef class _p_msg_rma:
         self.tdisp  = 0
         self.tcount = self.ocount
         self.ttype  = self.otype
+        trace_message(rank, self.ocount, self.otype)
 
     cdef int set_compare(self, object compare, int rank) except -1:
         self._compare = message_simple(
@@ -1114,6 +1470,7 @@ cdef class _p_msg_io:
                                    &self.buf,
                                    &self.count,
                                    &self.dtype)
+        trace_message(MPI_UNDEFINED, self.count, self.dtype)
         return 0
 
     cdef int for_write(self, object msg) except -1:
@@ -1122,6 +1479,7 @@ cdef class _p_msg_io:
                                    &self.buf,
                                    &self.count,
                                    &self.dtype)
+        trace_message(MPI_UNDEFINED, self.count, self.dtype)
         return 0
 
 cdef inline _p_msg_io message_io_read(object buf):
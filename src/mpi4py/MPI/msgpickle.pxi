@@ -6,6 +6,14 @@ cdef extern from "Python.h":
     Py_ssize_t PyBytes_Size(object) except -1
     object     PyBytes_FromStringAndSize(char*,Py_ssize_t)
     object     PyBytes_Join"_PyBytes_Join"(object,object)
+    Py_ssize_t Py_REFCNT(object)
+
+cdef extern from "Python.h":
+    long long  PyLong_AsLongLongAndOverflow(object, int*) except? -1
+    double     PyFloat_AS_DOUBLE(object)
+    Py_ssize_t PyUnicode_GET_LENGTH(object)
+    const char *PyUnicode_AsUTF8AndSize(object, Py_ssize_t*) except NULL
+    object     PyUnicode_DecodeUTF8(const char*, Py_ssize_t, const char*)
 
 # -----------------------------------------------------------------------------
 
@@ -24,6 +32,16 @@ if Py_GETENV(b"MPI4PY_PICKLE_PROTOCOL") != NULL:
 if Py_GETENV(b"MPI4PY_PICKLE_THRESHOLD") != NULL:
     PyPickle_THRESHOLD = int(Py_GETENV(b"MPI4PY_PICKLE_THRESHOLD"))
 
+cdef object PyPickle_COMPRESS = None
+cdef object PyPickle_COMPRESS_THRESHOLD = 1024**2 // 16 # 64 KiB
+
+if Py_GETENV(b"MPI4PY_PICKLE_COMPRESS") != NULL:
+    PyPickle_COMPRESS = pystr(Py_GETENV(b"MPI4PY_PICKLE_COMPRESS")) or None
+
+if Py_GETENV(b"MPI4PY_PICKLE_COMPRESS_THRESHOLD") != NULL:
+    PyPickle_COMPRESS_THRESHOLD = int(
+        Py_GETENV(b"MPI4PY_PICKLE_COMPRESS_THRESHOLD"))
+
 cdef class Pickle:
 
     """
@@ -34,12 +52,20 @@ cdef class Pickle:
     cdef object ob_loads
     cdef object ob_PROTO
     cdef object ob_THRES
+    cdef object ob_ZNAME
+    cdef object ob_CODEC
+    cdef int    ob_ZCID
+    cdef object ob_ZTHRES
 
     def __cinit__(self, *args, **kwargs):
         self.ob_dumps = PyPickle_dumps
         self.ob_loads = PyPickle_loads
         self.ob_PROTO = PyPickle_PROTOCOL
         self.ob_THRES = PyPickle_THRESHOLD
+        self.ob_ZNAME = None
+        self.ob_CODEC = None
+        self.ob_ZCID  = -1
+        self.ob_ZTHRES = PyPickle_COMPRESS_THRESHOLD
 
     def __init__(
         self,
@@ -47,6 +73,9 @@ cdef class Pickle:
         loads: Optional[Callable[[Buffer], Any]] = None,
         protocol: Optional[int] = None,
         threshold: Optional[int] = None,
+        *,
+        compress: Any = None,
+        compress_threshold: Optional[int] = None,
     ) -> None:
         if dumps is None:
             dumps = PyPickle_dumps
@@ -61,6 +90,8 @@ cdef class Pickle:
         self.ob_loads = loads
         self.ob_PROTO = protocol
         self.ob_THRES = threshold
+        self.COMPRESS = compress
+        self.COMPRESS_THRESHOLD = compress_threshold
 
     def dumps(
         self,
@@ -118,6 +149,31 @@ cdef class Pickle:
                 threshold = PyPickle_THRESHOLD
             self.ob_THRES = threshold
 
+    property COMPRESS:
+        """compression codec"""
+        def __get__(self) -> Any:
+            return self.ob_ZNAME
+        def __set__(self, compress: Any):
+            if compress is None:
+                compress = PyPickle_COMPRESS
+            if compress is False:
+                compress = None
+            if compress is True:
+                compress = 'zlib'
+            cdef int cid = -1
+            self.ob_CODEC = codec_lookup(compress, &cid)
+            self.ob_ZCID  = cid
+            self.ob_ZNAME = compress
+
+    property COMPRESS_THRESHOLD:
+        """compression threshold"""
+        def __get__(self) -> int:
+            return self.ob_ZTHRES
+        def __set__(self, threshold: Optional[int]):
+            if threshold is None:
+                threshold = PyPickle_COMPRESS_THRESHOLD
+            self.ob_ZTHRES = threshold
+
 
 cdef Pickle PyMPI_PICKLE = Pickle()
 pickle = PyMPI_PICKLE
@@ -169,6 +225,8 @@ cdef object cdumps_oob(Pickle pkl, object obj):
     cdef Py_ssize_t threshold = pkl.ob_THRES
     cdef object buf_cb = get_buffer_callback(buffers, threshold)
     cdef object data = pkl_dumps(obj, protocol, buffer_callback=buf_cb)
+    if pkl.ob_CODEC is not None:
+        data = compress_oob(pkl, data, buffers)
     return data, buffers
 
 cdef object cloads_oob(Pickle pkl, object data, object buffers):
@@ -178,30 +236,314 @@ cdef object cloads_oob(Pickle pkl, object data, object buffers):
             if not import_pickle5():
                 return cloads(pkl, data)
             pkl_loads = PyPickle5_loads
+    if pkl_loads is PyPickle_loads or pkl.ob_CODEC is not None:
+        buffers = list(buffers)
+        data = decompress_oob(pkl, data, buffers)
+        data = decompress_data(pkl, data)
     return pkl_loads(data, buffers=buffers)
 
 
 # -----------------------------------------------------------------------------
 
 cdef object cdumps(Pickle pkl, object obj):
+    cdef object data
     if pkl.ob_PROTO is not None:
-        return pkl.ob_dumps(obj, pkl.ob_PROTO)
+        data = pkl.ob_dumps(obj, pkl.ob_PROTO)
     else:
-        return pkl.ob_dumps(obj)
+        data = pkl.ob_dumps(obj)
+    if pkl.ob_CODEC is not None:
+        data = compress_data(pkl, data)
+    return data
 
 cdef object cloads(Pickle pkl, object buf):
+    if pkl.ob_loads is PyPickle_loads or pkl.ob_CODEC is not None:
+        buf = decompress_data(pkl, buf)
     return pkl.ob_loads(buf)
 
 
+# Pickle data streams and out-of-band buffers larger than a threshold
+# are compressed if that reduces their size. Compressed data starts with
+# a marker byte that never starts a pickle data stream, followed by the
+# identifier of the codec, thus receivers decompress it unambiguously.
+# Out-of-band buffers are flagged in a header prepended to the data.
+
+cdef enum:
+    PyMPI_ZIP_MARK = 0xFE
+    PyMPI_OOB_MARK = 0xFD
+
+cdef tuple PyPickle_CODECS = ('zlib', 'bz2', 'lzma')
+cdef dict  codec_modules = {}
+
+cdef object codec_import(int cid):
+    cdef object module = codec_modules.get(cid)
+    if module is None:
+        name = PyPickle_CODECS[cid - 1]
+        module = codec_modules[cid] = __import__(name)
+    return module
+
+cdef object codec_lookup(object compress, int *cid):
+    cid[0] = -1
+    if compress is None:
+        return None
+    if isinstance(compress, str):
+        if compress not in PyPickle_CODECS: raise ValueError(
+            f"unsupported compression codec {compress!r}")
+        cid[0] = PyPickle_CODECS.index(compress) + 1
+        return codec_import(cid[0])
+    if not (hasattr(compress, 'compress') and
+            hasattr(compress, 'decompress')): raise TypeError(
+        "compression codec must provide 'compress' and 'decompress'")
+    name = getattr(compress, '__name__', None)
+    if name in PyPickle_CODECS:
+        if compress is codec_import(PyPickle_CODECS.index(name) + 1):
+            cid[0] = PyPickle_CODECS.index(name) + 1
+            return compress
+    cid[0] = 0
+    return compress
+
+cdef object codec_get(Pickle pkl, int cid):
+    if 0 < cid <= len(PyPickle_CODECS):
+        return codec_import(cid)
+    if cid == 0:
+        if pkl.ob_ZCID == 0: return pkl.ob_CODEC
+        raise ValueError(
+            "cannot decompress data, no custom codec configured")
+    raise ValueError(
+        f"cannot decompress data, unknown codec identifier {cid}")
+
+cdef object compress_data(Pickle pkl, object data):
+    cdef Py_ssize_t threshold = pkl.ob_ZTHRES
+    cdef Py_ssize_t n = len(data)
+    if n < threshold: return data
+    cdef object zdata = pkl.ob_CODEC.compress(data)
+    if len(zdata) + 2 >= n: return data
+    cdef unsigned char header[2]
+    header[0] = PyMPI_ZIP_MARK
+    header[1] = <unsigned char> pkl.ob_ZCID
+    return PyBytes_Join(b'', [
+        PyBytes_FromStringAndSize(<char*> header, 2), zdata])
+
+cdef object decompress_data(Pickle pkl, object data):
+    cdef memory m = getbuffer(data, 1, 0)
+    cdef const unsigned char *p = <const unsigned char*> m.view.buf
+    if m.view.len < 2 or p[0] != PyMPI_ZIP_MARK: return data
+    return codec_get(pkl, p[1]).decompress(m[2:])
+
+cdef object compress_oob(Pickle pkl, object data, list buffers):
+    cdef Py_ssize_t threshold = pkl.ob_ZTHRES
+    cdef Py_ssize_t i, n = len(buffers)
+    cdef object flags = PyBytes_FromStringAndSize(NULL, 6 + n)
+    cdef unsigned char *p = <unsigned char*> PyBytes_AsString(flags)
+    cdef memory buf
+    cdef bint zipped = 0
+    p[0] = PyMPI_OOB_MARK
+    p[1] = <unsigned char> pkl.ob_ZCID
+    fast_put(p + 2, <unsigned long long> n, 4)
+    for i in range(n):
+        p[6 + i] = 0
+        buf = buffers[i]
+        if buf.view.len < threshold: continue
+        zdata = pkl.ob_CODEC.compress(buf)
+        if len(zdata) >= buf.view.len: continue
+        buffers[i] = getbuffer(zdata, 1, 0)
+        p[6 + i] = 1
+        zipped = 1
+    data = compress_data(pkl, data)
+    if not zipped: return data
+    return PyBytes_Join(b'', [flags, data])
+
+cdef object decompress_oob(Pickle pkl, object data, list buffers):
+    cdef memory m = getbuffer(data, 1, 0)
+    cdef const unsigned char *p = <const unsigned char*> m.view.buf
+    if m.view.len < 6 or p[0] != PyMPI_OOB_MARK: return data
+    cdef Py_ssize_t i, n = <Py_ssize_t> fast_get(p + 2, 4)
+    if m.view.len < 6 + n or len(buffers) != n: raise ValueError(
+        f"expecting {n} out-of-band buffers, got {len(buffers)}")
+    cdef object codec = codec_get(pkl, p[1])
+    for i in range(n):
+        if p[6 + i]:
+            buffers[i] = bytearray(codec.decompress(buffers[i]))
+    return m[6 + n:]
+
+
+# Small objects made of common builtin types (None, bool, int, float,
+# str, bytes, and tuples or lists of them) bypass pickle and use a tagged
+# binary encoding. The encoded data starts with a marker byte that never
+# starts a pickle data stream, thus receivers decode it unambiguously.
+
+cdef enum:
+    PyMPI_FAST_MARK    = 0xFF
+    PyMPI_FAST_MAXSIZE = 1024
+
+cdef inline void fast_put(unsigned char *p, unsigned long long v, int n) nogil:
+    cdef int i
+    for i in range(n):
+        p[i] = <unsigned char> (v >> (8 * i))
+
+cdef inline unsigned long long fast_get(const unsigned char *p, int n) nogil:
+    cdef unsigned long long v = 0
+    cdef int i
+    for i in range(n):
+        v |= (<unsigned long long> p[i]) << (8 * i)
+    return v
+
+cdef Py_ssize_t fast_size(object obj, bint nested) except -2:
+    cdef type cls = type(obj)
+    cdef Py_ssize_t size = 0, item = 0
+    cdef int overflow = 0
+    if obj is None or obj is True or obj is False:
+        return 1
+    if cls is int:
+        <void> PyLong_AsLongLongAndOverflow(obj, &overflow)
+        return -1 if overflow else 9
+    if cls is float:
+        return 9
+    if cls is str:
+        if PyUnicode_GET_LENGTH(obj) > PyMPI_FAST_MAXSIZE: return -1
+        try: <void> PyUnicode_AsUTF8AndSize(obj, &size)
+        except UnicodeError: return -1
+        return 5 + size
+    if cls is bytes:
+        return 5 + PyBytes_Size(obj)
+    if (cls is tuple or cls is list) and not nested:
+        size = 5
+        for item_obj in obj:
+            item = fast_size(item_obj, 1)
+            if item < 0: return -1
+            size += item
+            if size > PyMPI_FAST_MAXSIZE: return -1
+        return size
+    return -1
+
+cdef unsigned char *fast_write(object obj, unsigned char *p) except NULL:
+    cdef type cls = type(obj)
+    cdef const char *s = NULL
+    cdef Py_ssize_t n = 0
+    cdef double d = 0
+    cdef unsigned long long u = 0
+    if obj is None:
+        p[0] = c'N'; return p + 1
+    if obj is True:
+        p[0] = c'T'; return p + 1
+    if obj is False:
+        p[0] = c'F'; return p + 1
+    if cls is int:
+        u = <unsigned long long> <long long> obj
+        p[0] = c'i'; fast_put(p + 1, u, 8)
+        return p + 9
+    if cls is float:
+        d = PyFloat_AS_DOUBLE(obj)
+        memcpy(&u, &d, 8)
+        p[0] = c'f'; fast_put(p + 1, u, 8)
+        return p + 9
+    if cls is str:
+        s = PyUnicode_AsUTF8AndSize(obj, &n)
+        p[0] = c's'
+    elif cls is bytes:
+        s = PyBytes_AsString(obj)
+        n = PyBytes_Size(obj)
+        p[0] = c'b'
+    else:
+        p[0] = c't' if cls is tuple else c'l'
+        fast_put(p + 1, <unsigned long long> len(obj), 4)
+        p += 5
+        for item in obj:
+            p = fast_write(item, p)
+        return p
+    fast_put(p + 1, <unsigned long long> n, 4)
+    memcpy(p + 5, s, <size_t> n)
+    return p + 5 + n
+
+cdef object fast_dumps(object obj):
+    cdef Py_ssize_t size = fast_size(obj, 0)
+    if size < 0 or size >= PyMPI_FAST_MAXSIZE: return None
+    cdef object buf = PyBytes_FromStringAndSize(NULL, 1 + size)
+    cdef unsigned char *p = <unsigned char*> PyBytes_AsString(buf)
+    p[0] = PyMPI_FAST_MARK
+    fast_write(obj, p + 1)
+    return buf
+
+cdef object fast_read(const unsigned char **pp,
+                      const unsigned char *end,
+                      bint nested):
+    cdef const unsigned char *p = pp[0]
+    cdef unsigned long long u = 0
+    cdef Py_ssize_t i = 0, n = 0
+    cdef double d = 0
+    cdef object obj
+    if p >= end: raise ValueError("truncated message data")
+    cdef unsigned char tag = p[0]
+    p += 1
+    if tag == c'N':
+        obj = None
+    elif tag == c'T':
+        obj = True
+    elif tag == c'F':
+        obj = False
+    elif tag == c'i' or tag == c'f':
+        if end - p < 8: raise ValueError("truncated message data")
+        u = fast_get(p, 8)
+        p += 8
+        if tag == c'i':
+            obj = <long long> u
+        else:
+            memcpy(&d, &u, 8)
+            obj = d
+    elif tag == c's' or tag == c'b' or (
+        (tag == c't' or tag == c'l') and not nested
+    ):
+        if end - p < 4: raise ValueError("truncated message data")
+        n = <Py_ssize_t> fast_get(p, 4)
+        p += 4
+        if end - p < n: raise ValueError("truncated message data")
+        if tag == c't' or tag == c'l':
+            obj = [None] * n
+            for i in range(n):
+                obj[i] = fast_read(&p, end, 1)
+            if tag == c't':
+                obj = tuple(obj)
+        else:
+            if tag == c's':
+                obj = PyUnicode_DecodeUTF8(<const char*> p, n, NULL)
+            else:
+                obj = PyBytes_FromStringAndSize(<char*> p, n)
+            p += n
+    else:
+        raise ValueError("invalid message data")
+    pp[0] = p
+    return obj
+
+cdef object fast_loads(const unsigned char *p, Py_ssize_t n):
+    cdef const unsigned char *end = p + n
+    p += 1
+    cdef object obj = fast_read(&p, end, 0)
+    if p != end: raise ValueError("invalid message data")
+    return obj
+
+
 cdef object pickle_dump(Pickle pkl, object obj, void **p, MPI_Count *n):
-    cdef object buf = cdumps(pkl, obj)
+    cdef double t = trace_pickle_start()
+    cdef object buf = None
+    if pkl.ob_dumps is PyPickle_dumps:
+        buf = fast_dumps(obj)
+    if buf is None:
+        buf = cdumps(pkl, obj)
     p[0] = PyBytes_AsString(buf)
     n[0] = PyBytes_Size(buf)
+    trace_pickle_stop(t, n[0])
     return buf
 
 cdef object pickle_load(Pickle pkl, void *p, MPI_Count n):
     if p == NULL or n == 0: return None
-    return cloads(pkl, mpibuf(p, n))
+    cdef double t = trace_pickle_start()
+    cdef object obj
+    if ((<unsigned char*> p)[0] == PyMPI_FAST_MARK and
+        pkl.ob_loads is PyPickle_loads):
+        obj = fast_loads(<const unsigned char*> p, <Py_ssize_t> n)
+    else:
+        obj = cloads(pkl, mpibuf(p, n))
+    trace_pickle_stop(t, n)
+    return obj
 
 
 cdef object pickle_dumpv(Pickle pkl, object obj, void **p, int n, MPI_Count cnt[], MPI_Aint dsp[]):
@@ -242,6 +584,64 @@ cdef object pickle_allocv(void **p, int n, MPI_Count cnt[], MPI_Aint dsp[]):
         d += cnt[i]
     return pickle_alloc(p, d)
 
+# -----------------------------------------------------------------------------
+
+# Receive buffers for pickled messages are recycled through a pool of
+# power-of-two size classes. Buffers are recycled only when no other
+# references to them exist after the received object has been loaded.
+
+cdef enum:
+    PyMPI_RBUF_MINSHIFT = 8   # 256 B
+    PyMPI_RBUF_MAXSHIFT = 22  # 4 MiB
+    PyMPI_RBUF_DEPTH    = 4
+
+cdef list rbuf_pool = [[] for _ in range(1+PyMPI_RBUF_MAXSHIFT)]
+cdef MPI_Count rbuf_hint = (1<<15)
+
+cdef inline int rbuf_class(MPI_Count n):
+    cdef int k = PyMPI_RBUF_MINSHIFT
+    while k < PyMPI_RBUF_MAXSHIFT and ((<MPI_Count>1) << k) < n: k += 1
+    return k
+
+cdef object rbuf_alloc(void **p, MPI_Count n):
+    if n > ((<MPI_Count>1) << PyMPI_RBUF_MAXSHIFT):
+        return pickle_alloc(p, n)
+    cdef list pool = <list> rbuf_pool[rbuf_class(n)]
+    if not pool:
+        return pickle_alloc(p, (<MPI_Count>1) << rbuf_class(n))
+    cdef object buf = pool.pop()
+    p[0] = PyBytes_AsString(buf)
+    return buf
+
+cdef int rbuf_free(object buf) except -1:
+    if not PyBytes_CheckExact(buf): return 0
+    if Py_REFCNT(buf) != 1: return 0
+    cdef MPI_Count n = <MPI_Count> PyBytes_Size(buf)
+    cdef int k = rbuf_class(n)
+    if n != ((<MPI_Count>1) << k): return 0
+    cdef list pool = <list> rbuf_pool[k]
+    if len(pool) < PyMPI_RBUF_DEPTH:
+        pool.append(buf)
+    return 0
+
+cdef int rbuf_adapt(MPI_Count n) except -1:
+    # grow the receive size used by irecv() without a size hint,
+    # up to the largest size class recycled through the pool
+    global rbuf_hint
+    if n > ((<MPI_Count>1) << PyMPI_RBUF_MAXSHIFT):
+        n = ((<MPI_Count>1) << PyMPI_RBUF_MAXSHIFT)
+    if n > rbuf_hint:
+        rbuf_hint = (<MPI_Count>1) << rbuf_class(n)
+    return 0
+
+cdef object rbuf_load(Pickle pickle, memory buf, MPI_Count n):
+    cdef object base = <object> buf.view.obj if buf.view.obj else None
+    cdef object result = pickle_load(pickle, buf.view.buf, n)
+    if PyBytes_CheckExact(base):
+        buf.release()
+        rbuf_free(base)
+    return result
+
 
 cdef inline object allocate_count_displ(int n, MPI_Count **p, MPI_Aint **q):
     cdef object mem1 = allocate(n, sizeof(MPI_Count), p)
@@ -259,6 +659,7 @@ cdef object PyMPI_send(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object tmps = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         tmps = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Send_c(
@@ -276,6 +677,7 @@ cdef object PyMPI_bsend(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object tmps = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         tmps = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Bsend_c(
@@ -293,6 +695,7 @@ cdef object PyMPI_ssend(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object tmps = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         tmps = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Ssend_c(
@@ -354,13 +757,15 @@ cdef object PyMPI_recv_match(object obj, int source, int tag,
     with nogil:
         CHKERR( MPI_Mprobe(source, tag, comm, &match, &rsts) )
         CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
-    cdef object tmpr = pickle_alloc(&rbuf, rcount)
+    cdef object tmpr = rbuf_alloc(&rbuf, rcount)
     with nogil:
         CHKERR( MPI_Mrecv_c(
             rbuf, rcount, rtype, &match, status) )
     #
     if rcount <= 0: return None
-    return pickle_load(pickle, rbuf, rcount)
+    cdef object robj = pickle_load(pickle, rbuf, rcount)
+    rbuf_free(tmpr)
+    return robj
 
 
 cdef object PyMPI_recv_probe(object obj, int source, int tag,
@@ -381,18 +786,21 @@ cdef object PyMPI_recv_probe(object obj, int source, int tag,
             CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
             CHKERR( PyMPI_Status_get_source(&rsts, &source) )
             CHKERR( PyMPI_Status_get_tag(&rsts, &tag) )
-        tmpr = pickle_alloc(&rbuf, rcount)
+        tmpr = rbuf_alloc(&rbuf, rcount)
         with nogil:
             CHKERR( MPI_Recv_c(
                 rbuf, rcount, rtype,
                 source, tag, comm, status) )
     #
     if rcount <= 0: return None
-    return pickle_load(pickle, rbuf, rcount)
+    cdef object robj = pickle_load(pickle, rbuf, rcount)
+    rbuf_free(tmpr)
+    return robj
 
 
 cdef object PyMPI_recv(object obj, int source, int tag,
                        MPI_Comm comm, MPI_Status *status):
+    trace_message(source, 0, MPI_BYTE)
     if obj is not None:
         return PyMPI_recv_obarg(obj, source, tag, comm, status)
     elif options.recv_mprobe:
@@ -411,6 +819,7 @@ cdef object PyMPI_isend(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object smsg = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         smsg = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Isend_c(
@@ -428,6 +837,7 @@ cdef object PyMPI_ibsend(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object smsg = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         smsg = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Ibsend_c(
@@ -445,6 +855,7 @@ cdef object PyMPI_issend(object obj, int dest, int tag,
     cdef MPI_Datatype stype = MPI_BYTE
     #
     cdef object smsg = None
+    trace_message(dest, 0, MPI_BYTE)
     if dest != MPI_PROC_NULL:
         smsg = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Issend_c(
@@ -461,11 +872,30 @@ cdef object PyMPI_irecv(object obj, int source, int tag,
     cdef MPI_Count rcount = 0
     cdef MPI_Datatype rtype = MPI_BYTE
     #
+    cdef MPI_Message match = MPI_MESSAGE_NULL
+    cdef MPI_Status rsts
+    cdef int flag = 0
+    #
     cdef object rmsg = None
+    trace_message(source, 0, MPI_BYTE)
     if source != MPI_PROC_NULL:
         if obj is None:
-            rcount = <MPI_Count> (1<<15)
-            obj = pickle_alloc(&rbuf, rcount)
+            if options.recv_mprobe:
+                # a message already available is received with a buffer
+                # of the exact size, as MPI_Irecv() would have matched it
+                with nogil: CHKERR( MPI_Improbe(
+                    source, tag, comm, &flag, &match, &rsts) )
+            if flag:
+                CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
+                rbuf_adapt(rcount)
+                obj = rbuf_alloc(&rbuf, rcount)
+                rmsg = asbuffer_r(obj, NULL, NULL)
+                with nogil: CHKERR( MPI_Imrecv_c(
+                    rbuf, rcount, rtype,
+                    &match, request) )
+                return rmsg
+            rcount = rbuf_hint
+            obj = rbuf_alloc(&rbuf, rcount)
             rmsg = asbuffer_r(obj, NULL, NULL)
         elif is_integral(obj):
             rcount = <MPI_Count> obj
@@ -496,17 +926,18 @@ cdef object PyMPI_load(MPI_Status *status, object ob):
     cdef Pickle pickle = PyMPI_PICKLE
     cdef MPI_Count rcount = 0
     cdef MPI_Datatype rtype = MPI_BYTE
+    if type(ob) is _p_icoll: return (<_p_icoll>ob).load()
     if type(ob) is not memory: return None
     CHKERR( MPI_Get_count_c(status, rtype, &rcount) )
     if rcount <= 0: return None
-    cdef void *rbuf = (<memory>ob).view.buf
-    return pickle_load(pickle, rbuf, rcount)
+    return rbuf_load(pickle, <memory>ob, rcount)
 
 
 cdef object PyMPI_wait(Request request, Status status):
     cdef object buf
     #
     cdef MPI_Status rsts
+    if icoll_pending(request): icoll_advance(request, 1)
     with nogil: CHKERR( MPI_Wait(&request.ob_mpi, &rsts) )
     buf = request.ob_buf
     if status is not None:
@@ -521,6 +952,10 @@ cdef object PyMPI_test(Request request, int *flag, Status status):
     cdef object buf = None
     #
     cdef MPI_Status rsts
+    if icoll_pending(request):
+        if not icoll_advance(request, 0):
+            flag[0] = 0
+            return None
     with nogil: CHKERR( MPI_Test(&request.ob_mpi, flag, &rsts) )
     if flag[0]:
         buf = request.ob_buf
@@ -540,6 +975,7 @@ cdef object PyMPI_waitany(requests, int *index, Status status):
     cdef MPI_Request *irequests = NULL
     cdef MPI_Status rsts
     #
+    icoll_advance_all(requests, 1)
     cdef tmp = acquire_rs(requests, None, &count, &irequests, NULL)
     try:
         with nogil: CHKERR( MPI_Waitany(count, irequests, index, &rsts) )
@@ -560,15 +996,21 @@ cdef object PyMPI_testany(requests, int *index, int *flag, Status status):
     cdef int count = 0
     cdef MPI_Request *irequests = NULL
     cdef MPI_Status rsts
+    cdef object pending = None
     #
+    icoll_advance_all(requests, 0)
     cdef tmp = acquire_rs(requests, None, &count, &irequests, NULL)
     try:
+        pending = icoll_mask(requests, irequests)
         with nogil: CHKERR( MPI_Testany(count, irequests, index, flag, &rsts) )
+        if pending and index[0] == MPI_UNDEFINED:
+            flag[0] = 0
         if index[0] != MPI_UNDEFINED:
             buf = (<Request>requests[index[0]]).ob_buf
         if status is not None:
             status.ob_mpi = rsts
     finally:
+        icoll_unmask(requests, irequests, pending)
         release_rs(requests, None, count, irequests, 0, NULL)
     #
     if index[0] == MPI_UNDEFINED: return None
@@ -582,6 +1024,7 @@ cdef object PyMPI_waitall(requests, statuses):
     cdef MPI_Request *irequests = NULL
     cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
     #
+    icoll_advance_all(requests, 1)
     cdef tmp = acquire_rs(requests, True, &count, &irequests, &istatuses)
     try:
         with nogil: CHKERR( MPI_Waitall(count, irequests, istatuses) )
@@ -598,6 +1041,9 @@ cdef object PyMPI_testall(requests, int *flag, statuses):
     cdef MPI_Request *irequests = NULL
     cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
     #
+    if not icoll_advance_all(requests, 0):
+        flag[0] = 0
+        return None
     cdef tmp = acquire_rs(requests, True, &count, &irequests, &istatuses)
     try:
         with nogil: CHKERR( MPI_Testall(count, irequests, flag, istatuses) )
@@ -619,6 +1065,7 @@ cdef object PyMPI_waitsome(requests, statuses):
     cdef int outcount = MPI_UNDEFINED, *iindices = NULL
     cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
     #
+    icoll_advance_all(requests, 1)
     cdef tmp1 = acquire_rs(requests, True, &incount, &irequests, &istatuses)
     cdef tmp2 = newarray(incount, &iindices)
     try:
@@ -647,17 +1094,24 @@ cdef object PyMPI_testsome(requests, statuses):
     cdef int outcount = MPI_UNDEFINED, *iindices = NULL
     cdef MPI_Status *istatuses = MPI_STATUSES_IGNORE
     #
+    cdef object pending = None
+    #
+    icoll_advance_all(requests, 0)
     cdef tmp1 = acquire_rs(requests, True, &incount, &irequests, &istatuses)
     cdef tmp2 = newarray(incount, &iindices)
     try:
+        pending = icoll_mask(requests, irequests)
         with nogil: CHKERR( MPI_Testsome(
             incount, irequests, &outcount, iindices, istatuses) )
+        if pending and outcount == MPI_UNDEFINED:
+            outcount = 0
         if outcount != MPI_UNDEFINED:
             bufs = [
                 (<Request>requests[iindices[i]]).ob_buf
                 for i in range(outcount)
             ]
     finally:
+        icoll_unmask(requests, irequests, pending)
         release_rs(requests, statuses, incount, irequests, outcount, istatuses)
     #
     if outcount != MPI_UNDEFINED:
@@ -1366,6 +1820,157 @@ cdef object PyMPI_exscan_intra(object sendobj, object op, MPI_Comm comm):
 
 # -----
 
+# Sparse dynamic data exchange with the nonblocking consensus (NBX)
+# algorithm. Synchronous sends complete only after being matched by a
+# receive, thus a process enters a nonblocking barrier once all its
+# messages were received, and the exchange is complete once the barrier
+# completes. Every call uses a fresh tag in the communicator context,
+# thus messages from consecutive calls are never mixed up. Errors while
+# packing, sending, or receiving are raised only after completing the
+# exchange, thus other processes do not hang and send buffers are not
+# released while in use.
+
+ctypedef object (*PyMPI_nbx_recv_fn)(object, MPI_Message*, MPI_Status*)
+
+cdef dict PyMPI_nbx(Py_ssize_t n, MPI_Request requests[],
+                    PyMPI_nbx_recv_fn recv, object arg,
+                    int tag, MPI_Comm comm, object error):
+    cdef dict result = {}
+    cdef int flag = 0, active = 0, done = 0
+    cdef MPI_Request barrier = MPI_REQUEST_NULL
+    cdef MPI_Message message = MPI_MESSAGE_NULL
+    cdef MPI_Status status
+    cdef MPI_Count rcount = 0
+    cdef void *rbuf = NULL
+    cdef object tmpr
+    while not done:
+        with nogil: CHKERR( MPI_Improbe(
+            MPI_ANY_SOURCE, tag, comm, &flag, &message, &status) )
+        if flag:
+            try:
+                result[status.MPI_SOURCE] = recv(arg, &message, &status)
+            except BaseException as exc:
+                if error is None: error = exc
+            if message != MPI_MESSAGE_NULL:
+                CHKERR( MPI_Get_count_c(&status, MPI_BYTE, &rcount) )
+                tmpr = pickle_alloc(&rbuf, rcount)
+                with nogil: CHKERR( MPI_Mrecv_c(
+                    rbuf, rcount, MPI_BYTE, &message, MPI_STATUS_IGNORE) )
+        if active:
+            with nogil: CHKERR( MPI_Test(
+                &barrier, &done, MPI_STATUS_IGNORE) )
+        else:
+            with nogil: CHKERR( MPI_Testall(
+                <int>n, requests, &flag, MPI_STATUSES_IGNORE) )
+            if flag:
+                with nogil: CHKERR( MPI_Ibarrier(comm, &barrier) )
+                active = 1
+    if error is not None:
+        raise error
+    return result
+
+cdef object PyMPI_nbx_recv_obj(object arg, MPI_Message *message,
+                               MPI_Status *status):
+    cdef Pickle pickle = <Pickle> arg
+    cdef void *rbuf = NULL
+    cdef MPI_Count rcount = 0
+    CHKERR( MPI_Get_count_c(status, MPI_BYTE, &rcount) )
+    cdef object tmpr = pickle_alloc(&rbuf, rcount)
+    with nogil: CHKERR( MPI_Mrecv_c(
+        rbuf, rcount, MPI_BYTE, message, MPI_STATUS_IGNORE) )
+    return pickle_load(pickle, rbuf, rcount)
+
+cdef object PyMPI_nbx_recv_buf(object arg, MPI_Message *message,
+                               MPI_Status *status):
+    cdef MPI_Datatype rtype = (<Datatype> arg).ob_mpi
+    cdef MPI_Count rcount = 0, nbytes = 0
+    cdef MPI_Count lb = 0, extent = 0, tlb = 0, textent = 0
+    CHKERR( MPI_Get_count_c(status, rtype, &rcount) )
+    if rcount == MPI_UNDEFINED: raise ValueError(
+        "received message size is not a multiple of the datatype size")
+    CHKERR( MPI_Type_get_extent_c(rtype, &lb, &extent) )
+    CHKERR( MPI_Type_get_true_extent_c(rtype, &tlb, &textent) )
+    if rcount > 0: nbytes = (rcount - 1) * extent + textent
+    cdef memory rbuf = memory.allocate(nbytes)
+    cdef char *rptr = <char*> rbuf.view.buf - tlb
+    with nogil: CHKERR( MPI_Mrecv_c(
+        rptr, rcount, rtype, message, MPI_STATUS_IGNORE) )
+    return rbuf
+
+cdef object PyMPI_sparse_exchange_obj(object sendobj, MPI_Comm comm):
+    cdef int tag = MPI_UNDEFINED
+    PyMPI_Commctx_INTRA(comm, &comm, &tag)
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef object error = None
+    cdef Py_ssize_t i = 0, m = 0, n = 0
+    cdef MPI_Request *requests = NULL
+    cdef int *dests = NULL
+    cdef void **sbufs = NULL
+    cdef MPI_Count *scounts = NULL
+    cdef list tmp = []
+    try:
+        items = list(sendobj.items())
+        m = len(items)
+        tmp.append(allocate(m, sizeof(MPI_Request), &requests))
+        tmp.append(allocate(m, sizeof(int), &dests))
+        tmp.append(allocate(m, sizeof(void*), &sbufs))
+        tmp.append(allocate(m, sizeof(MPI_Count), &scounts))
+        for i in range(m):
+            dests[i] = items[i][0]
+            tmp.append(pickle_dump(pickle, items[i][1],
+                                   &sbufs[i], &scounts[i]))
+    except BaseException as exc:
+        error = exc
+        m = 0
+    for i in range(m):
+        try:
+            with nogil: CHKERR( MPI_Issend_c(
+                sbufs[i], scounts[i], MPI_BYTE, dests[i], tag,
+                comm, &requests[i]) )
+        except BaseException as exc:
+            error = exc
+            break
+        n += 1
+    return PyMPI_nbx(n, requests, PyMPI_nbx_recv_obj, pickle,
+                     tag, comm, error)
+
+cdef object PyMPI_sparse_exchange_buf(object sendbufs, Datatype recvtype,
+                                      MPI_Comm comm):
+    cdef int tag = MPI_UNDEFINED
+    PyMPI_Commctx_INTRA(comm, &comm, &tag)
+    cdef object error = None
+    cdef Py_ssize_t i = 0, m = 0, n = 0
+    cdef MPI_Request *requests = NULL
+    cdef int *dests = NULL
+    cdef object tmpreq = None
+    cdef list tmpbuf = []
+    cdef _p_msg_p2p smsg
+    try:
+        items = list(sendbufs.items())
+        m = len(items)
+        tmpreq = allocate(m, sizeof(MPI_Request), &requests)
+        tmpbuf.append(allocate(m, sizeof(int), &dests))
+        for i in range(m):
+            dests[i] = items[i][0]
+            tmpbuf.append(message_p2p_send(items[i][1], dests[i]))
+    except BaseException as exc:
+        error = exc
+        m = 0
+    for i in range(m):
+        smsg = tmpbuf[1+i]
+        try:
+            with nogil: CHKERR( MPI_Issend_c(
+                smsg.buf, smsg.count, smsg.dtype, dests[i], tag,
+                comm, &requests[i]) )
+        except BaseException as exc:
+            error = exc
+            break
+        n += 1
+    return PyMPI_nbx(n, requests, PyMPI_nbx_recv_buf, recvtype,
+                     tag, comm, error)
+
+# -----
+
 cdef inline bint comm_is_intra(MPI_Comm comm) nogil except -1:
     cdef int inter = 0
     CHKERR( MPI_Comm_test_inter(comm, &inter) )
@@ -1373,35 +1978,584 @@ cdef inline bint comm_is_intra(MPI_Comm comm) nogil except -1:
     else:     return 1
 
 
+cdef enum PyMPI_vec_coll:
+    PyMPI_VEC_REDUCE
+    PyMPI_VEC_ALLREDUCE
+    PyMPI_VEC_SCAN
+    PyMPI_VEC_EXSCAN
+
+cdef union PyMPI_vec_scalar:
+    long long i
+    double d
+    double z[2]
+
+cdef tuple vec_typecodes = (
+    'b', 'h', 'i', 'l', 'q',  # signed integer
+    'B', 'H', 'I', 'L', 'Q',  # unsigned integer
+    'f', 'd', 'g',            # floating point
+    'Zf', 'Zd', 'Zg',         # complex
+)
+
+cdef inline int vec_opkind(object op):
+    # 3 -> SUM/PROD, 2 -> MAX/MIN, 1 -> BAND/BOR/BXOR, 0 -> other
+    if type(op) is not Op: return 0
+    cdef MPI_Op mop = (<Op>op).ob_mpi
+    if mop == MPI_SUM  or mop == MPI_PROD: return 3
+    if mop == MPI_MAX  or mop == MPI_MIN:  return 2
+    if mop == MPI_BAND or mop == MPI_BOR or mop == MPI_BXOR: return 1
+    return 0
+
+cdef inline int vec_typekind(Py_ssize_t index):
+    # 1 -> integer, 2 -> floating point, 3 -> complex
+    if index < 10: return 1
+    if index < 13: return 2
+    return 3
+
+cdef inline bint vec_is_ndarray(object obj):
+    cdef type cls = type(obj)
+    return cls.__name__ == 'ndarray' and cls.__module__ == 'numpy'
+
+cdef int vec_signature(object obj, int opkind, long long sig[]) except -1:
+    # sig = [typecode index + 1, item count, shape hash, int bit length]
+    cdef object code = None, view, fmt
+    cdef type cls = type(obj)
+    sig[0] = sig[1] = sig[2] = sig[3] = 0
+    if cls is int:
+        sig[3] = obj.bit_length()
+        if sig[3] > 62: return 0
+        code = 'q'; sig[1] = 1
+    elif cls is float:
+        code = 'd'; sig[1] = 1
+    elif cls is complex:
+        code = 'Zd'; sig[1] = 1
+    elif vec_is_ndarray(obj):
+        try:
+            view = memoryview(obj)
+        except (TypeError, ValueError, BufferError):
+            return 0
+        fmt = view.format
+        if fmt[:1] in ('<', '>'):
+            if (fmt[0] == '<') != is_little_endian(): return 0
+            fmt = fmt[1:]
+        elif fmt[:1] in ('@', '='):
+            fmt = fmt[1:]
+        code = fmt
+        sig[1] = view.nbytes // view.itemsize
+        sig[2] = hash(view.shape)
+    if code not in vec_typecodes: return 0
+    cdef Py_ssize_t index = vec_typecodes.index(code)
+    if vec_typekind(index) > opkind: return 0
+    sig[0] = index + 1
+    return 0
+
+cdef Datatype vec_match(object sendobj, object op,
+                        MPI_Comm comm, MPI_Count *count):
+    # Agree on a common predefined datatype and item count for all
+    # operands, or return None to fall back to the pickle-based path;
+    # every process takes part, operands without a signature vote no
+    cdef int opkind = vec_opkind(op)
+    cdef long long sig[7]
+    vec_signature(sendobj, opkind, sig)
+    sig[6] = sig[3]
+    for i in range(3): sig[3+i] = ~sig[i]
+    with nogil: CHKERR( MPI_Allreduce(
+        MPI_IN_PLACE, sig, 7, MPI_LONG_LONG, MPI_MAX, comm) )
+    if sig[0] == 0: return None
+    for i in range(3):
+        if sig[i] != ~sig[3+i]: return None
+    cdef int size = 0
+    cdef long long bits = sig[6]
+    cdef MPI_Op mop = (<Op>op).ob_mpi
+    if type(sendobj) is int:
+        # Python integers must not overflow the 64-bit representation
+        CHKERR( MPI_Comm_size(comm, &size) )
+        if mop == MPI_SUM and bits + size.bit_length() > 62:
+            return None
+        if mop == MPI_PROD and bits > 1 and bits * size > 62:
+            return None
+    count[0] = <MPI_Count> sig[1]
+    return TypeDict[vec_typecodes[sig[0]-1]]
+
+cdef object PyMPI_reduce_vec(object sendobj, object op, int root,
+                             MPI_Comm comm, PyMPI_vec_coll coll):
+    if vec_opkind(op) == 0: return NotImplemented
+    cdef int tag = MPI_UNDEFINED, rank = 0, size = 0
+    PyMPI_Commctx_INTRA(comm, &comm, &tag)
+    CHKERR( MPI_Comm_rank(comm, &rank) )
+    CHKERR( MPI_Comm_size(comm, &size) )
+    #
+    cdef PyMPI_vec_scalar scalar
+    cdef Datatype datatype
+    cdef type cls = type(sendobj)
+    cdef object result = None
+    cdef memory rmem = None
+    cdef void *sbuf = MPI_IN_PLACE
+    cdef void *rbuf = &scalar
+    cdef MPI_Count count = 1
+    cdef MPI_Datatype dtype = MPI_DATATYPE_NULL
+    cdef MPI_Op mop = (<Op>op).ob_mpi
+    #
+    with PyMPI_Lock(comm, "@reduce_vec@"):
+        datatype = vec_match(sendobj, op, comm, &count)
+        if datatype is None: return NotImplemented
+        dtype = datatype.ob_mpi
+        if cls is int:
+            scalar.i = sendobj
+        elif cls is float:
+            scalar.d = sendobj
+        elif cls is complex:
+            scalar.z[0] = sendobj.real
+            scalar.z[1] = sendobj.imag
+        else:
+            result = sendobj.copy()
+            rmem = getbuffer(result, 0, 0)
+            rbuf = rmem.view.buf
+        if coll == PyMPI_VEC_REDUCE:
+            if rank != root: sbuf, rbuf = rbuf, NULL
+            with nogil: CHKERR( MPI_Reduce_c(
+                sbuf, rbuf, count, dtype, mop, root, comm) )
+        elif coll == PyMPI_VEC_ALLREDUCE:
+            with nogil: CHKERR( MPI_Allreduce_c(
+                sbuf, rbuf, count, dtype, mop, comm) )
+        elif coll == PyMPI_VEC_SCAN:
+            with nogil: CHKERR( MPI_Scan_c(
+                sbuf, rbuf, count, dtype, mop, comm) )
+        elif coll == PyMPI_VEC_EXSCAN:
+            with nogil: CHKERR( MPI_Exscan_c(
+                sbuf, rbuf, count, dtype, mop, comm) )
+    #
+    if coll == PyMPI_VEC_REDUCE and rank != root: return None
+    if coll == PyMPI_VEC_EXSCAN and rank == 0: return None
+    if cls is int: return scalar.i
+    if cls is float: return scalar.d
+    if cls is complex: return complex(scalar.z[0], scalar.z[1])
+    # NumPy returns scalars when combining 0-d arrays
+    cdef int nops = size
+    if coll == PyMPI_VEC_SCAN: nops = rank + 1
+    if coll == PyMPI_VEC_EXSCAN: nops = rank
+    if nops > 1 and result.ndim == 0: return result[()]
+    return result
+
+
 cdef object PyMPI_reduce(object sendobj, object op, int root, MPI_Comm comm):
+    cdef object result
     if not options.fast_reduce:
         return PyMPI_reduce_naive(sendobj, op, root, comm)
     elif comm_is_intra(comm):
+        result = PyMPI_reduce_vec(sendobj, op, root, comm, PyMPI_VEC_REDUCE)
+        if result is not NotImplemented: return result
         return PyMPI_reduce_intra(sendobj, op, root, comm)
     else:
         return PyMPI_reduce_inter(sendobj, op, root, comm)
 
 
 cdef object PyMPI_allreduce(object sendobj, object op, MPI_Comm comm):
+    cdef object result
     if not options.fast_reduce:
         return PyMPI_allreduce_naive(sendobj, op, comm)
     elif comm_is_intra(comm):
+        result = PyMPI_reduce_vec(sendobj, op, 0, comm, PyMPI_VEC_ALLREDUCE)
+        if result is not NotImplemented: return result
         return PyMPI_allreduce_intra(sendobj, op, comm)
     else:
         return PyMPI_allreduce_inter(sendobj, op, comm)
 
 
 cdef object PyMPI_scan(object sendobj, object op, MPI_Comm comm):
+    cdef object result
     if not options.fast_reduce:
         return PyMPI_scan_naive(sendobj, op, comm)
     else:
+        result = PyMPI_reduce_vec(sendobj, op, 0, comm, PyMPI_VEC_SCAN)
+        if result is not NotImplemented: return result
         return PyMPI_scan_intra(sendobj, op, comm)
 
 
 cdef object PyMPI_exscan(object sendobj, object op, MPI_Comm comm):
+    cdef object result
     if not options.fast_reduce:
         return PyMPI_exscan_naive(sendobj, op, comm)
     else:
+        result = PyMPI_reduce_vec(sendobj, op, 0, comm, PyMPI_VEC_EXSCAN)
+        if result is not NotImplemented: return result
         return PyMPI_exscan_intra(sendobj, op, comm)
 
 # -----------------------------------------------------------------------------
+
+cdef extern from *:
+    int PyMPI_Commctx_nbc(MPI_Comm,MPI_Comm*) nogil
+    int PyMPI_Commctx_nbc_ready(MPI_Comm,int,int*) nogil
+
+cdef enum PyMPI_icoll_kind:
+    PyMPI_ICOLL_BCAST
+    PyMPI_ICOLL_GATHER
+    PyMPI_ICOLL_SCATTER
+    PyMPI_ICOLL_ALLGATHER
+    PyMPI_ICOLL_ALLTOALL
+    PyMPI_ICOLL_ALLREDUCE
+
+cdef dict icoll_queue = {}
+
+cdef inline object copy_count_displ(int n,
+                                    MPI_Count *cnt, MPI_Aint *dsp,
+                                    MPI_Count **p, MPI_Aint **q):
+    if cnt == NULL or dsp == NULL: return None
+    cdef object mem = allocate_count_displ(n, p, q)
+    for i in range(n):
+        p[0][i] = cnt[i]
+        q[0][i] = dsp[i]
+    return mem
+
+
+@cython.final
+@cython.internal
+cdef class _p_icoll:
+
+    cdef PyMPI_icoll_kind kind
+    cdef int phase
+    cdef MPI_Comm base
+    cdef MPI_Comm comm
+    cdef int root, size
+    cdef int dosend, dorecv
+    cdef object op
+    #
+    cdef void *sbuf
+    cdef MPI_Count scount
+    cdef MPI_Count *scounts
+    cdef MPI_Aint  *sdispls
+    cdef void *rbuf
+    cdef MPI_Count rcount
+    cdef MPI_Count *rcounts
+    cdef MPI_Aint  *rdispls
+    cdef MPI_Count *pcounts
+    cdef MPI_Aint  *pdispls
+    #
+    cdef object smsg, rmsg
+    cdef object tmp1, tmp2, tmp3
+
+    cdef int setup(self, MPI_Comm comm, int root, int mode) except -1:
+        # mode: 0 -> no root, 1 -> root sends, 2 -> root receives
+        cdef int inter=0, rank=0
+        CHKERR( MPI_Comm_test_inter(comm, &inter) )
+        if inter:
+            CHKERR( MPI_Comm_remote_size(comm, &self.size) )
+            if mode == 0:
+                self.dosend=1; self.dorecv=1;
+            elif root == MPI_PROC_NULL:
+                self.dosend=0; self.dorecv=0;
+            elif root == MPI_ROOT:
+                self.dosend=(mode==1); self.dorecv=(mode==2);
+            else:
+                self.dosend=(mode==2); self.dorecv=(mode==1);
+        else:
+            CHKERR( MPI_Comm_size(comm, &self.size) )
+            CHKERR( MPI_Comm_rank(comm, &rank) )
+            if mode == 0 or root == rank:
+                self.dosend=1; self.dorecv=1;
+            else:
+                self.dosend=(mode==2); self.dorecv=(mode==1);
+        self.root = root
+        self.base = comm
+        PyMPI_Commctx_NBC(comm, &self.comm)
+        return 0
+
+    cdef int start(self, MPI_Request *request) except -1:
+        # Data exchange, collective over the dedicated communicator
+        cdef PyMPI_icoll_kind kind = self.kind
+        cdef MPI_Comm comm = self.comm
+        cdef int root = self.root, size = self.size
+        cdef MPI_Datatype dtype = MPI_BYTE
+        cdef void *sbuf = self.sbuf, *rbuf = NULL
+        cdef MPI_Count scount = self.scount, rcount = self.rcount
+        cdef MPI_Count *scounts = self.scounts, *rcounts = NULL
+        cdef MPI_Aint  *sdispls = self.sdispls, *rdispls = NULL
+        if kind == PyMPI_ICOLL_BCAST:
+            if self.dorecv and not self.dosend:
+                self.rmsg = pickle_alloc(&self.rbuf, scount)
+                sbuf = self.rbuf
+            with nogil: CHKERR( MPI_Ibcast_c(
+                sbuf, scount, dtype,
+                root, comm, request) )
+        elif kind == PyMPI_ICOLL_GATHER:
+            if self.dorecv:
+                self.rmsg = pickle_allocv(&self.rbuf, size,
+                                          self.rcounts, self.rdispls)
+                self.tmp3 = copy_count_displ(size, self.rcounts, self.rdispls,
+                                             &self.pcounts, &self.pdispls)
+            rbuf = self.rbuf; rcounts = self.pcounts; rdispls = self.pdispls
+            with nogil: CHKERR( MPI_Igatherv_c(
+                sbuf, scount,           dtype,
+                rbuf, rcounts, rdispls, dtype,
+                root, comm, request) )
+        elif kind == PyMPI_ICOLL_SCATTER:
+            if self.dorecv:
+                self.rmsg = pickle_alloc(&self.rbuf, rcount)
+            rbuf = self.rbuf
+            with nogil: CHKERR( MPI_Iscatterv_c(
+                sbuf, scounts, sdispls, dtype,
+                rbuf, rcount,           dtype,
+                root, comm, request) )
+        elif kind == PyMPI_ICOLL_ALLTOALL:
+            self.rmsg = pickle_allocv(&self.rbuf, size,
+                                      self.rcounts, self.rdispls)
+            self.tmp3 = copy_count_displ(size, self.rcounts, self.rdispls,
+                                         &self.pcounts, &self.pdispls)
+            rbuf = self.rbuf; rcounts = self.pcounts; rdispls = self.pdispls
+            with nogil: CHKERR( MPI_Ialltoallv_c(
+                sbuf, scounts, sdispls, dtype,
+                rbuf, rcounts, rdispls, dtype,
+                comm, request) )
+        else:
+            self.rmsg = pickle_allocv(&self.rbuf, size,
+                                      self.rcounts, self.rdispls)
+            self.tmp3 = copy_count_displ(size, self.rcounts, self.rdispls,
+                                         &self.pcounts, &self.pdispls)
+            rbuf = self.rbuf; rcounts = self.pcounts; rdispls = self.pdispls
+            with nogil: CHKERR( MPI_Iallgatherv_c(
+                sbuf, scount,           dtype,
+                rbuf, rcounts, rdispls, dtype,
+                comm, request) )
+        self.phase = 1
+        return 0
+
+    cdef object load(self):
+        cdef Pickle pickle = PyMPI_PICKLE
+        cdef PyMPI_icoll_kind kind = self.kind
+        cdef object result = None
+        if not self.dorecv:
+            result = None
+        elif kind == PyMPI_ICOLL_BCAST:
+            if self.dosend:
+                result = pickle_load(pickle, self.sbuf, self.scount)
+            else:
+                result = pickle_load(pickle, self.rbuf, self.scount)
+        elif kind == PyMPI_ICOLL_SCATTER:
+            result = pickle_load(pickle, self.rbuf, self.rcount)
+        else:
+            result = pickle_loadv(pickle, self.rbuf, self.size,
+                                  self.rcounts, self.rdispls)
+            if kind == PyMPI_ICOLL_ALLREDUCE:
+                result = _py_reduce(result, self.op)
+        self.smsg = self.rmsg = None
+        self.tmp1 = self.tmp2 = self.tmp3 = None
+        return result
+
+
+cdef int PyMPI_Commctx_NBC(MPI_Comm comm,
+                           MPI_Comm *nbccomm) except -1:
+    with PyMPI_Lock(comm, "@commctx_nbc"):
+        CHKERR( PyMPI_Commctx_nbc(comm, nbccomm) )
+    return 0
+
+
+cdef inline bint icoll_pending(Request request):
+    cdef object state = request.ob_buf
+    if type(state) is not _p_icoll: return 0
+    return (<_p_icoll>state).phase == 0
+
+
+cdef int icoll_enqueue(Request request) except -1:
+    cdef _p_icoll state = <_p_icoll> request.ob_buf
+    cdef Py_uintptr_t key = <Py_uintptr_t> state.base
+    cdef list queue
+    with PyMPI_Lock(state.base, "@icoll"):
+        queue = icoll_queue.get(key)
+        if queue is None:
+            icoll_queue[key] = queue = []
+        queue.append(request)
+    return 0
+
+
+cdef int icoll_advance(Request request, bint blocking) except -1:
+    # The data exchange of pending requests is started in creation
+    # order (consistent across processes) over a dedicated communicator,
+    # once its nonblocking duplication has completed
+    cdef _p_icoll state = <_p_icoll> request.ob_buf
+    cdef MPI_Comm base = state.base
+    cdef Py_uintptr_t key = <Py_uintptr_t> base
+    cdef list queue
+    cdef Request head
+    cdef int flag = 0
+    with PyMPI_Lock(base, "@icoll"):
+        queue = icoll_queue.get(key)
+        while state.phase == 0:
+            head = <Request> queue[0]
+            if blocking:
+                with nogil: CHKERR( MPI_Wait(
+                    &head.ob_mpi, MPI_STATUS_IGNORE) )
+            else:
+                with nogil: CHKERR( MPI_Test(
+                    &head.ob_mpi, &flag, MPI_STATUS_IGNORE) )
+                if not flag: break
+            with nogil: CHKERR( PyMPI_Commctx_nbc_ready(
+                base, blocking, &flag) )
+            if not flag: break
+            (<_p_icoll>head.ob_buf).start(&head.ob_mpi)
+            del queue[0]
+        if queue is not None and not queue:
+            del icoll_queue[key]
+    return state.phase != 0
+
+
+cdef int icoll_discard(Request request) except -1:
+    # Drop a freed request from the queue; its state is kept alive
+    # by the request object and is never started
+    cdef _p_icoll state = <_p_icoll> request.ob_buf
+    cdef Py_uintptr_t key = <Py_uintptr_t> state.base
+    cdef list queue
+    with PyMPI_Lock(state.base, "@icoll"):
+        queue = icoll_queue.get(key)
+        if queue is not None:
+            queue.remove(request)
+            if not queue:
+                del icoll_queue[key]
+    state.phase = -1
+    return 0
+
+
+cdef int icoll_advance_all(object requests, bint blocking) except -1:
+    cdef int flag = 1
+    for request in requests:
+        if icoll_pending(<Request?>request):
+            if not icoll_advance(<Request>request, blocking):
+                flag = 0
+    return flag
+
+
+cdef object icoll_mask(object requests, MPI_Request irequests[]):
+    cdef list pending = []
+    cdef Py_ssize_t i
+    for i in range(len(requests)):
+        if icoll_pending(<Request>requests[i]):
+            irequests[i] = MPI_REQUEST_NULL
+            pending.append(i)
+    return pending
+
+
+cdef int icoll_unmask(object requests, MPI_Request irequests[],
+                      object pending) except -1:
+    if pending is None: return 0
+    cdef Py_ssize_t i
+    for i in pending:
+        irequests[i] = (<Request>requests[i]).ob_mpi
+    return 0
+
+
+cdef _p_icoll PyMPI_icoll_new(PyMPI_icoll_kind kind,
+                              int root, int mode,
+                              MPI_Comm comm):
+    cdef _p_icoll state = _p_icoll.__new__(_p_icoll)
+    state.kind = kind
+    state.setup(comm, root, mode)
+    return state
+
+
+cdef int PyMPI_icoll_post(_p_icoll state, Request request) except -1:
+    request.ob_buf = state
+    icoll_enqueue(request)
+    return 0
+
+
+cdef object PyMPI_ibcast(object obj, int root,
+                         MPI_Comm comm, Request request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_icoll state = PyMPI_icoll_new(
+        PyMPI_ICOLL_BCAST, root, 1, comm)
+    if state.dosend:
+        state.smsg = pickle_dump(pickle, obj, &state.sbuf, &state.scount)
+    cdef MPI_Count *count = &state.scount
+    with nogil: CHKERR( MPI_Ibcast_c(
+        count, 1, MPI_COUNT,
+        root, comm, &request.ob_mpi) )
+    PyMPI_icoll_post(state, request)
+    return None
+
+
+cdef object PyMPI_igather(object sendobj, int root,
+                          MPI_Comm comm, Request request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_icoll state = PyMPI_icoll_new(
+        PyMPI_ICOLL_GATHER, root, 2, comm)
+    if state.dorecv:
+        state.tmp1 = allocate_count_displ(
+            state.size, &state.rcounts, &state.rdispls)
+    if state.dosend:
+        state.smsg = pickle_dump(pickle, sendobj, &state.sbuf, &state.scount)
+    cdef MPI_Count *scount = &state.scount
+    cdef MPI_Count *rcounts = state.rcounts
+    with nogil: CHKERR( MPI_Igather_c(
+        scount,  1, MPI_COUNT,
+        rcounts, 1, MPI_COUNT,
+        root, comm, &request.ob_mpi) )
+    PyMPI_icoll_post(state, request)
+    return None
+
+
+cdef object PyMPI_iscatter(object sendobj, int root,
+                           MPI_Comm comm, Request request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_icoll state = PyMPI_icoll_new(
+        PyMPI_ICOLL_SCATTER, root, 1, comm)
+    if state.dosend:
+        state.tmp1 = allocate_count_displ(
+            state.size, &state.scounts, &state.sdispls)
+        state.smsg = pickle_dumpv(pickle, sendobj, &state.sbuf, state.size,
+                                  state.scounts, state.sdispls)
+    cdef MPI_Count *scounts = state.scounts
+    cdef MPI_Count *rcount = &state.rcount
+    with nogil: CHKERR( MPI_Iscatter_c(
+        scounts, 1, MPI_COUNT,
+        rcount,  1, MPI_COUNT,
+        root, comm, &request.ob_mpi) )
+    PyMPI_icoll_post(state, request)
+    return None
+
+
+cdef object PyMPI_iallgather(object sendobj,
+                             MPI_Comm comm, Request request,
+                             object op=None):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_icoll state = PyMPI_icoll_new(
+        PyMPI_ICOLL_ALLGATHER, MPI_PROC_NULL, 0, comm)
+    if op is not None:
+        state.kind = PyMPI_ICOLL_ALLREDUCE
+        state.op = op
+    state.tmp1 = allocate_count_displ(
+        state.size, &state.rcounts, &state.rdispls)
+    state.smsg = pickle_dump(pickle, sendobj, &state.sbuf, &state.scount)
+    cdef MPI_Count *scount = &state.scount
+    cdef MPI_Count *rcounts = state.rcounts
+    with nogil: CHKERR( MPI_Iallgather_c(
+        scount,  1, MPI_COUNT,
+        rcounts, 1, MPI_COUNT,
+        comm, &request.ob_mpi) )
+    PyMPI_icoll_post(state, request)
+    return None
+
+
+cdef object PyMPI_ialltoall(object sendobj,
+                            MPI_Comm comm, Request request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_icoll state = PyMPI_icoll_new(
+        PyMPI_ICOLL_ALLTOALL, MPI_PROC_NULL, 0, comm)
+    state.tmp1 = allocate_count_displ(
+        state.size, &state.scounts, &state.sdispls)
+    state.tmp2 = allocate_count_displ(
+        state.size, &state.rcounts, &state.rdispls)
+    state.smsg = pickle_dumpv(pickle, sendobj, &state.sbuf, state.size,
+                              state.scounts, state.sdispls)
+    cdef MPI_Count *scounts = state.scounts
+    cdef MPI_Count *rcounts = state.rcounts
+    with nogil: CHKERR( MPI_Ialltoall_c(
+        scounts, 1, MPI_COUNT,
+        rcounts, 1, MPI_COUNT,
+        comm, &request.ob_mpi) )
+    PyMPI_icoll_post(state, request)
+    return None
+
+
+cdef object PyMPI_iallreduce(object sendobj, object op,
+                             MPI_Comm comm, Request request):
+    return PyMPI_iallgather(sendobj, comm, request, op)
+
+# -----------------------------------------------------------------------------
@@ -84,22 +84,76 @@ cdef object op_NO_OP(object x, object y):
 
 # -----------------------------------------------------------------------------
 
-cdef list op_user_registry = [None]*(1+32)
+cdef enum:
+    PyMPI_OP_USER_STATIC = 32
+
+cdef list op_user_registry = [None]*(1+PyMPI_OP_USER_STATIC)
+cdef list op_user_refcount = [0]*(1+PyMPI_OP_USER_STATIC)
+cdef list op_user_cache    = [None]*(1+PyMPI_OP_USER_STATIC)
 
 cdef inline object op_user_py(int index, object x, object y, object dt):
     return op_user_registry[index](x, y, dt)
 
+cdef inline const char *op_user_format(MPI_Datatype t) nogil:
+    # PEP 3118 format of basic numeric datatypes
+    cdef const char *tc = DatatypeChar(t)
+    if tc == NULL or tc[0] == 0 or tc[1] != 0: return NULL
+    cdef char c = tc[0]
+    if c == c'F': return "Zf"
+    if c == c'D': return "Zd"
+    if c == c'G': return "Zg"
+    if (c == c'?' or
+        c == c'b' or c == c'h' or c == c'i' or c == c'l' or c == c'q' or
+        c == c'B' or c == c'H' or c == c'I' or c == c'L' or c == c'Q' or
+        c == c'f' or c == c'd' or c == c'g'): return tc
+    return NULL
+
+cdef inline int op_user_buf(
+    memory buf, void *base, MPI_Count count,
+    const char *format, MPI_Count itemsize,
+) except -1:
+    cdef MPI_Aint size = <MPI_Aint>count
+    if count != <MPI_Count>size:
+        raise OverflowError(f"integer {count} does not fit in 'MPI_Aint'")
+    PyBuffer_Release(&buf.view)
+    PyBuffer_FillInfo(&buf.view, <object>NULL, base, size, 0, PyBUF_SIMPLE)
+    if format != NULL:
+        buf.view.format = <char*>format
+        buf.view.itemsize = <Py_ssize_t>itemsize
+    return 0
+
 cdef inline void op_user_mpi(
-    int index, void *a, void *b, MPI_Count n, MPI_Datatype t) with gil:
+    int index, void *a, void *b, MPI_Count n, MPI_Datatype t,
+    const char *format, MPI_Count itemsize) with gil:
+    cdef object cache
     cdef Datatype datatype
+    cdef memory abuf, bbuf
     # errors in user-defined reduction operations are unrecoverable
     try:
-        datatype = Datatype.__new__(Datatype)
+        # reuse the wrapper objects from the previous call
+        cache = op_user_cache[index]
+        op_user_cache[index] = None
+        if cache is not None:
+            datatype, abuf, bbuf = cache
+            cache = None
+        else:
+            datatype = Datatype.__new__(Datatype)
+            abuf = newbuffer()
+            bbuf = newbuffer()
         datatype.ob_mpi = t
         try:
-            op_user_py(index, mpibuf(a, n), mpibuf(b, n), datatype)
+            op_user_buf(abuf, a, n, format, itemsize)
+            op_user_buf(bbuf, b, n, format, itemsize)
+            op_user_py(index, abuf, bbuf, datatype)
         finally:
             datatype.ob_mpi = MPI_DATATYPE_NULL
+        # cache the wrapper objects unless the callback kept references
+        if (Py_REFCNT(datatype) == 1 and
+            Py_REFCNT(abuf) == 1 and
+            Py_REFCNT(bbuf) == 1):
+            op_user_buf(abuf, NULL, 0, NULL, 1)
+            op_user_buf(bbuf, NULL, 0, NULL, 1)
+            op_user_cache[index] = (datatype, abuf, bbuf)
     except:
         # print the full exception traceback and abort.
         PySys_WriteStderr(
@@ -120,11 +174,16 @@ cdef inline void op_user_call(
     if (<void*>op_user_registry) == NULL:
         <void>MPI_Abort(MPI_COMM_WORLD, 1)
     # compute the byte-size of memory buffers
-    cdef MPI_Count lb=0, extent=0
+    cdef MPI_Count lb=0, extent=0, size=0
     <void>MPI_Type_get_extent_c(t, &lb, &extent)
+    <void>MPI_Type_size_c(t, &size)
     cdef MPI_Count n = count * extent
+    # typed memory buffers for basic datatypes
+    cdef const char *format = NULL
+    if lb == 0 and extent == size and extent > 0:
+        format = op_user_format(t)
     # make the actual GIL-safe Python call
-    op_user_mpi(index, a, b, n, t)
+    op_user_mpi(index, a, b, n, t, format, extent)
 
 ctypedef fused op_count_t:
     int
@@ -266,33 +325,114 @@ cdef void op_user_map(int index, op_usrfn_t **fn) nogil:
     elif index == 32: fn[0] = op_user_32
     else:             fn[0] = NULL
 
+# Slots beyond the statically generated C functions above are served by
+# C callbacks created at runtime with ctypes (libffi closures). Closures
+# are created once per slot and kept alive, as MPI may still refer to
+# them after a freed operation released its slot.
+
+@cython.final
+@cython.internal
+cdef class _p_op_thunk:
+
+    cdef int index
+    cdef bint large
+
+    def __call__(self, a, b, n, t):
+        cdef void *pa = <void*><Py_uintptr_t>(a or 0)
+        cdef void *pb = <void*><Py_uintptr_t>(b or 0)
+        cdef void *pn = <void*><Py_uintptr_t>(n or 0)
+        cdef void *pt = <void*><Py_uintptr_t>(t or 0)
+        cdef MPI_Count count = 0
+        if self.large: count = (<MPI_Count*>pn)[0]
+        else:          count = (<int*>pn)[0]
+        op_user_call(self.index, pa, pb, count, (<MPI_Datatype*>pt)[0])
+
+cdef object op_user_ctypes = None
+cdef dict   op_user_thunks = {}
+
+cdef int op_user_thunk(int index,
+                       MPI_User_function   **fn_i,
+                       MPI_User_function_c **fn_c,
+                       ) except -1:
+    global op_user_ctypes
+    cdef _p_op_thunk thunk_i, thunk_c
+    cdef object cfunc_i, cfunc_c
+    cdef Py_uintptr_t addr_i = 0, addr_c = 0
+    if op_user_ctypes is None:
+        try:
+            import ctypes as op_user_ctypes
+        except ImportError:
+            raise RuntimeError("cannot create too many "
+                               "user-defined reduction operations")
+    ctypes = op_user_ctypes
+    if index not in op_user_thunks:
+        functype = ctypes.CFUNCTYPE(
+            None,
+            ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_void_p, ctypes.c_void_p,
+        )
+        thunk_i = _p_op_thunk.__new__(_p_op_thunk)
+        thunk_i.index = index; thunk_i.large = 0
+        thunk_c = _p_op_thunk.__new__(_p_op_thunk)
+        thunk_c.index = index; thunk_c.large = 1
+        cfunc_i = functype(thunk_i)
+        cfunc_c = functype(thunk_c)
+        op_user_thunks[index] = (cfunc_i, cfunc_c)
+    cfunc_i, cfunc_c = op_user_thunks[index]
+    addr_i = ctypes.cast(cfunc_i, ctypes.c_void_p).value
+    addr_c = ctypes.cast(cfunc_c, ctypes.c_void_p).value
+    fn_i[0] = <MPI_User_function*>   addr_i
+    fn_c[0] = <MPI_User_function_c*> addr_c
+    return 0
+
 cdef int op_user_new(object function,
                      MPI_User_function   **fn_i,
                      MPI_User_function_c **fn_c,
                      ) except -1:
-    # find a free slot in the registry
-    cdef int index = 0
-    try:
-        index = op_user_registry.index(None, 1)
-    except ValueError:
-        raise RuntimeError("cannot create too many "
-                           "user-defined reduction operations")
     # the line below will fail
     # if the function is not callable
     function.__call__
+    # operations created from the same Python
+    # function share their slot in the registry
+    cdef int index = 0
+    for i in range(1, len(op_user_registry)):
+        if op_user_registry[i] is function:
+            index = i
+            break
+    # otherwise find a free slot in the registry,
+    # growing the registry if all slots are in use
+    if index == 0:
+        try:
+            index = op_user_registry.index(None, 1)
+        except ValueError:
+            index = len(op_user_registry)
+            op_user_thunk(index, fn_i, fn_c)
+            op_user_registry.append(None)
+            op_user_refcount.append(0)
+            op_user_cache.append(None)
+    # map the slot to the associated C function
+    if index <= PyMPI_OP_USER_STATIC:
+        op_user_map(index, fn_i)
+        op_user_map(index, fn_c)
+    else:
+        op_user_thunk(index, fn_i, fn_c)
     # register the Python function,
-    # map it to the associated C function,
     # and return the slot index in registry
     op_user_registry[index] = function
-    op_user_map(index, fn_i)
-    op_user_map(index, fn_c)
+    op_user_refcount[index] += 1
     return index
 
 cdef int op_user_del(int *indexp) except -1:
     # free slot in the registry
+    # once no operation refers to it
     cdef int index = indexp[0]
     indexp[0] = 0 # clear the value
-    op_user_registry[index] = None
+    if index <= 0: return 0
+    op_user_refcount[index] -= 1
+    if op_user_refcount[index] <= 0:
+        op_user_refcount[index] = 0
+        op_user_registry[index] = None
+        op_user_cache[index] = None
     return 0
 
 # -----------------------------------------------------------------------------
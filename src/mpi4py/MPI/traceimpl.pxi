@@ -0,0 +1,261 @@
+# -----------------------------------------------------------------------------
+
+# Tracing of calls to methods of Comm, Win, File, and Request instances.
+# While tracing is enabled, the method descriptors of these types are
+# replaced with wrappers recording the wall time of every call into a
+# ring buffer. The message layers annotate the call in progress with the
+# peer process, the number of bytes described by message buffers, and
+# the time spent pickling and unpickling Python objects.
+
+cdef extern from "Python.h":
+    """
+    #if !defined(PYPY_VERSION)
+    #define PyMPI_HAVE_TRACE 1
+    #define PyMPI_Type_Dict(t) (((PyTypeObject*)(t))->tp_dict)
+    #else
+    #define PyMPI_HAVE_TRACE 0
+    #define PyMPI_Type_Dict(t) ((void)(t), (PyObject*)NULL)
+    #endif
+    #define PyMPI_Type_Modified(t) PyType_Modified((PyTypeObject*)(t))
+    """
+    enum: PyMPI_HAVE_TRACE
+    PyObject *PyMPI_Type_Dict(object)
+    void PyMPI_Type_Modified(object)
+    unsigned long PyThread_get_thread_ident() nogil
+
+ctypedef struct PyMPI_TraceEvent:
+    double    start
+    double    stop
+    double    pickle
+    MPI_Count nbytes
+    int       peer
+    int       kind
+    int       name
+    int       label
+
+cdef enum:
+    PyMPI_TRACE_SIZE = 65536
+
+cdef tuple trace_kinds = ('Comm', 'Win', 'File', 'Request')
+
+cdef object trace_mem = None
+cdef PyMPI_TraceEvent *trace_buf = NULL
+cdef PyMPI_TraceEvent *trace_cur = NULL
+cdef unsigned long trace_owner = 0
+cdef Py_ssize_t    trace_size  = 0
+cdef Py_ssize_t    trace_count = 0
+cdef bint          trace_on    = 0
+
+cdef list trace_saved  = []
+cdef dict trace_names  = {}
+cdef list trace_nlist  = []
+cdef dict trace_labels = {}
+cdef list trace_llist  = []
+
+
+cdef int trace_name(object name) except -1:
+    cdef object index = trace_names.get(name)
+    if index is None:
+        index = trace_names[name] = len(trace_nlist)
+        trace_nlist.append(name)
+    return index
+
+cdef int trace_label(int kind, object ob) except -1:
+    cdef object key = _handleof(ob) if kind != 3 else None
+    cdef object index = trace_labels.get(key)
+    cdef char name[MPI_MAX_OBJECT_NAME+1]
+    cdef int nlen = 0, ierr = MPI_ERR_ARG
+    if index is None:
+        label = ''
+        if kind == 0:
+            ierr = MPI_Comm_get_name((<Comm>ob).ob_mpi, name, &nlen)
+        if kind == 1:
+            ierr = MPI_Win_get_name((<Win>ob).ob_mpi, name, &nlen)
+        if ierr == MPI_SUCCESS:
+            label = tompistr(name, nlen)
+        if not label and key is not None:
+            label = f"{trace_kinds[kind]}(0x{key:x})"
+        index = trace_labels[key] = len(trace_llist)
+        trace_llist.append(label)
+    return index
+
+
+@cython.final
+@cython.internal
+cdef class _p_trace_method:
+
+    cdef object method
+    cdef int    kind
+    cdef int    name
+
+    def __get__(self, obj, cls):
+        if obj is None: return self.method
+        cdef _p_trace_call call = _p_trace_call.__new__(_p_trace_call)
+        call.method = self
+        call.obj = obj
+        return call
+
+
+@cython.final
+@cython.internal
+cdef class _p_trace_call:
+
+    cdef _p_trace_method method
+    cdef object obj
+
+    def __call__(self, *args, **kwargs):
+        global trace_cur, trace_owner, trace_count
+        cdef object call = self.method.method.__get__(self.obj)
+        cdef unsigned long ident = PyThread_get_thread_ident()
+        if not trace_on or (trace_cur != NULL and trace_owner == ident):
+            return call(*args, **kwargs)
+        cdef PyMPI_TraceEvent event
+        event.kind   = self.method.kind
+        event.name   = self.method.name
+        event.label  = trace_label(event.kind, self.obj)
+        event.peer   = MPI_UNDEFINED
+        event.nbytes = 0
+        event.pickle = 0.0
+        cdef bint owner = (trace_cur == NULL)
+        if owner:
+            trace_cur = &event
+            trace_owner = ident
+        event.start = MPI_Wtime()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            event.stop = MPI_Wtime()
+            if owner:
+                trace_cur = NULL
+                trace_owner = 0
+            if trace_on:
+                trace_buf[trace_count % trace_size] = event
+                trace_count += 1
+
+
+cdef inline PyMPI_TraceEvent *trace_event() nogil:
+    if trace_cur == NULL: return NULL
+    if trace_owner != PyThread_get_thread_ident(): return NULL
+    return trace_cur
+
+cdef inline void trace_message(
+    int peer, MPI_Count count, MPI_Datatype datatype,
+) nogil:
+    cdef PyMPI_TraceEvent *event = trace_event()
+    if event == NULL: return
+    if peer != MPI_UNDEFINED and peer >= 0:
+        event.peer = peer
+    cdef MPI_Count size = 0
+    if count > 0 and datatype != MPI_DATATYPE_NULL:
+        if MPI_Type_size_c(datatype, &size) == MPI_SUCCESS:
+            event.nbytes += count * size
+
+cdef inline double trace_pickle_start() nogil:
+    if trace_event() == NULL: return 0.0
+    return MPI_Wtime()
+
+cdef inline void trace_pickle_stop(
+    double start, MPI_Count nbytes,
+) nogil:
+    cdef PyMPI_TraceEvent *event = trace_event()
+    if event == NULL: return
+    event.pickle += MPI_Wtime() - start
+    event.nbytes += nbytes
+
+cdef int trace_install() except -1:
+    cdef object kind, cls, name, attr
+    cdef dict tdict
+    cdef _p_trace_method method
+    cdef list classes = [Comm, Win, File, Request]
+    cdef object mtype = type(Comm.__dict__['Get_name'])
+    for kind, base in enumerate(classes):
+        pending = [base]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if cls.__module__ != __name__: continue
+            tdict = <dict> PyMPI_Type_Dict(cls)
+            for name, attr in list(tdict.items()):
+                if type(attr) is not mtype: continue
+                method = _p_trace_method.__new__(_p_trace_method)
+                method.method = attr
+                method.kind = kind
+                method.name = trace_name(name)
+                trace_saved.append((cls, name, attr))
+                tdict[name] = method
+            PyMPI_Type_Modified(cls)
+    return 0
+
+cdef int trace_uninstall() except -1:
+    cdef object cls, name, attr
+    for cls, name, attr in trace_saved:
+        (<dict> PyMPI_Type_Dict(cls))[name] = attr
+        PyMPI_Type_Modified(cls)
+    del trace_saved[:]
+    return 0
+
+cdef int trace_start(Py_ssize_t size) except -1:
+    global trace_mem, trace_buf, trace_size, trace_count, trace_on
+    if not PyMPI_HAVE_TRACE: raise NotImplementedError(
+        "tracing is not supported in this Python implementation")
+    if size < 1: raise ValueError(
+        f"size must be positive, got {size}")
+    trace_on = 0
+    trace_mem = allocate(size, sizeof(PyMPI_TraceEvent), &trace_buf)
+    trace_size = size
+    trace_count = 0
+    trace_labels.clear()
+    del trace_llist[:]
+    if not trace_saved: trace_install()
+    trace_on = 1
+    return 0
+
+cdef int trace_stop() except -1:
+    global trace_on
+    trace_on = 0
+    trace_uninstall()
+    return 0
+
+cdef int trace_bootstrap() except -1:
+    if not options.trace: return 0
+    trace_start(PyMPI_TRACE_SIZE)
+    from atexit import register
+    register(_trace_report)
+    return 0
+
+
+def _trace_start(Py_ssize_t size: int = PyMPI_TRACE_SIZE) -> None:
+    "Helper for ``mpi4py.util.trace``"
+    trace_start(size)
+
+def _trace_stop() -> None:
+    "Helper for ``mpi4py.util.trace``"
+    trace_stop()
+
+def _trace_events() -> Tuple[int, List[Tuple]]:
+    "Helper for ``mpi4py.util.trace``"
+    cdef Py_ssize_t count = min(trace_count, trace_size)
+    cdef Py_ssize_t first = trace_count - count
+    cdef PyMPI_TraceEvent *event = NULL
+    cdef Py_ssize_t i
+    cdef list events = []
+    for i in range(first, first + count):
+        event = &trace_buf[i % trace_size]
+        events.append((
+            trace_kinds[event.kind],
+            trace_nlist[event.name],
+            trace_llist[event.label],
+            event.peer if event.peer != MPI_UNDEFINED else None,
+            event.nbytes,
+            event.start,
+            event.stop,
+            event.pickle,
+        ))
+    return (trace_count, events)
+
+def _trace_report() -> None:
+    "Helper for ``mpi4py.rc.trace``"
+    from .util.trace import report
+    report()
+
+# -----------------------------------------------------------------------------
@@ -44,6 +44,10 @@ class Rc:
         Use matched probes to receive objects (default: True).
     errors : {"exception", "default", "abort", "fatal"}
         Error handling policy (default: "exception").
+    trace : bool
+        Trace calls and report statistics at exit (default: False).
+    import_cache : bool
+        Broadcast imported modules in ``mpi4py.run`` (default: False).
 
     """
 
@@ -54,6 +58,8 @@ class Rc:
     fast_reduce = True
     recv_mprobe = True
     errors = 'exception'
+    trace = False
+    import_cache = False
 
     def __init__(self, **kwargs):
         self(**kwargs)
@@ -17,6 +17,8 @@ class Rc:
     fast_reduce: bool = True
     recv_mprobe: bool = True
     errors: str = 'exception'
+    trace: bool = False
+    import_cache: bool = False
     def __init__(self, **kwargs: Any) -> None: ...
     def __setattr__(self, name: str, value: Any) -> None: ...
     def __call__(self, **kwargs: Any) -> None: ...
@@ -161,6 +161,13 @@ def pingpong(comm, args=None, verbose=True):
     parser.add_argument("--threshold", type=int,
                         dest="threshold", default=None,
                         help="size threshold for out-of-band pickle buffers")
+    parser.add_argument("-z", "--compress", action="store",
+                        dest="compress", default=None,
+                        choices=["zlib", "bz2", "lzma"],
+                        help="compress pickle data and buffers")
+    parser.add_argument("--compress-threshold", type=int,
+                        dest="compress_threshold", default=None,
+                        help="size threshold for pickle compression")
     parser.add_argument("--skip-large", type=int,
                         dest="skip_large", default=10)
     parser.add_argument("--loop-large", type=int,
@@ -206,10 +213,12 @@ def pingpong(comm, args=None, verbose=True):
     loop_huge = options.loop_huge
     huge_size = options.huge_size
 
-    use_pickle = options.pickle or options.outband
+    use_pickle = options.pickle or options.outband or options.compress
     use_outband = options.outband
     protocol = options.protocol if use_pickle else None
     threshold = options.threshold if use_outband else None
+    compress = options.compress
+    compress_threshold = options.compress_threshold
 
     if use_outband:
         comm = pkl5.Intracomm(comm)
@@ -217,6 +226,10 @@ def pingpong(comm, args=None, verbose=True):
         MPI.pickle.PROTOCOL = protocol
     if threshold is not None:
         pkl5.pickle.THRESHOLD = threshold
+    if compress is not None:
+        pickle = pkl5.pickle if use_outband else MPI.pickle
+        pickle.COMPRESS = compress
+        pickle.COMPRESS_THRESHOLD = compress_threshold
 
     buf_sizes = [1 << i for i in range(33)]
     buf_sizes = [n for n in buf_sizes if min_size <= n <= max_size]
@@ -242,6 +255,15 @@ def pingpong(comm, args=None, verbose=True):
         else:
             return bytearray(nbytes)
 
+    def fill(buf):
+        data = memoryview(buf).cast('B')
+        size = min(len(data), 256)
+        data[:size] = bytes(range(size))
+        while size < len(data):
+            count = min(size, len(data) - size)
+            data[size:size + count] = data[:count]
+            size += count
+
     def run_pingpong():
         rank = comm.Get_rank()
         size = comm.Get_size()
@@ -270,6 +292,8 @@ def pingpong(comm, args=None, verbose=True):
 
         if use_pickle:
             s_msg = allocate(nbytes)
+            if compress is not None and not (cupy or numba):
+                fill(s_msg)
         else:
             s_msg = [allocate(nbytes), nbytes, MPI.BYTE]
             r_msg = [allocate(nbytes), nbytes, MPI.BYTE]
@@ -304,6 +328,143 @@ def pingpong(comm, args=None, verbose=True):
     return result
 
 
+def reduce(comm, args=None, verbose=True):
+    """Compare user-defined and predefined reduction operations."""
+    # pylint: disable=redefined-builtin
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-statements
+    # pylint: disable=import-outside-toplevel
+    from argparse import ArgumentParser
+    parser = ArgumentParser(prog=_prog("reduce"))
+    parser.add_argument("-q", "--quiet", action="store_false",
+                        dest="verbose", default=verbose,
+                        help="quiet output")
+    parser.add_argument("-m", "--min-count", type=int,
+                        dest="min_count", default=1,
+                        help="minimum number of elements")
+    parser.add_argument("-n", "--max-count", type=int,
+                        dest="max_count", default=1 << 20,
+                        help="maximum number of elements")
+    parser.add_argument("-s", "--skip", type=int,
+                        dest="skip", default=10,
+                        help="number of warm-up iterations")
+    parser.add_argument("-l", "--loop", type=int,
+                        dest="loop", default=1000,
+                        help="number of iterations")
+    parser.add_argument("-a", "--array", action="store",
+                        dest="array", default="numpy",
+                        choices=["numpy", "array"],
+                        help="use NumPy arrays or Python arrays")
+    parser.add_argument("--skip-large", type=int,
+                        dest="skip_large", default=2)
+    parser.add_argument("--loop-large", type=int,
+                        dest="loop_large", default=20)
+    parser.add_argument("--large-count", type=int,
+                        dest="large_count", default=1 << 14)
+    parser.add_argument("--no-header", action="store_false",
+                        dest="print_header", default=True)
+    parser.add_argument("--no-stats", action="store_false",
+                        dest="print_stats", default=True)
+    options = parser.parse_args(args)
+
+    import statistics
+    from . import MPI
+
+    # pylint: disable=import-error
+    numpy = array = None
+    if options.array == 'numpy':
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            import array
+    else:
+        import array
+
+    skip = options.skip
+    loop = options.loop
+    min_count = options.min_count
+    max_count = options.max_count
+    skip_large = options.skip_large
+    loop_large = options.loop_large
+    large_count = options.large_count
+
+    counts = [1 << i for i in range(31)]
+    counts = [n for n in counts if min_count <= n <= max_count]
+
+    def allocate(count):
+        if numpy is not None:
+            return numpy.ones(count, 'd')
+        return array.array('d', [1.0]) * count
+
+    def user_sum(inbuf, inoutbuf, datatype):
+        # pylint: disable=unused-argument
+        if numpy is not None:
+            invec = numpy.frombuffer(inbuf, 'd')
+            inoutvec = numpy.frombuffer(inoutbuf, 'd')
+            numpy.add(invec, inoutvec, out=inoutvec)
+        else:  # pragma: no cover
+            invec = memoryview(inbuf).cast('B').cast('d')
+            inoutvec = memoryview(inoutbuf).cast('B').cast('d')
+            for i, item in enumerate(invec):
+                inoutvec[i] += item
+
+    wtime = MPI.Wtime
+    op_user = MPI.Op.Create(user_sum, commute=True)
+    op_list = [MPI.SUM, op_user]
+
+    def run_reduce(op):
+        t_start = wtime()
+        comm.Allreduce(s_msg, r_msg, op)
+        t_end = wtime()
+        return t_end - t_start
+
+    result = []
+    for count in counts:
+        if count > large_count:
+            skip = min(skip, skip_large)
+            loop = min(loop, loop_large)
+        iterations = list(range(loop + skip))
+
+        s_msg = [allocate(count), count, MPI.DOUBLE]
+        r_msg = [allocate(count), count, MPI.DOUBLE]
+
+        t_stats = []
+        for op in op_list:
+            t_list = []
+            comm.Barrier()
+            for i in iterations:
+                elapsed = run_reduce(op)
+                if i >= skip:
+                    t_list.append(elapsed)
+            t_mean = statistics.mean(t_list) if t_list else float('nan')
+            t_stdev = statistics.stdev(t_list) if len(t_list) > 1 else 0.0
+            t_stats.append((t_mean, t_stdev))
+
+        s_msg = r_msg = None
+
+        (t_mean_mpi, t_stdev_mpi), (t_mean_usr, t_stdev_usr) = t_stats
+        result.append((count, t_mean_mpi, t_mean_usr))
+
+        if options.verbose and comm.rank == 0:
+            if options.print_header:
+                options.print_header = False
+                print("# MPI Allreduce Test - MPI.SUM vs. user-defined Op")
+                header = "#  Count  Time MPI [s]  Time User [s]  Ratio"
+                if options.print_stats:
+                    header += " | StdDev MPI [s]  StdDev User [s]  Samples"
+                print(header, flush=True)
+            ratio = t_mean_usr / t_mean_mpi
+            message = (f"{count:8d}{t_mean_mpi:14.5e}"
+                       f"{t_mean_usr:15.5e}{ratio:7.2f}")
+            if options.print_stats:
+                message += (f" | {t_stdev_mpi:14.4e}"
+                            f"{t_stdev_usr:17.4e}{loop:9d}")
+            print(message, flush=True)
+
+    op_user.Free()
+    return result
+
+
 def _fn_identity(arg):  # pragma: no cover
     return arg
 
@@ -353,6 +514,19 @@ def futures(comm, args=None, verbose=True):
         "-b", "--backoff", help="backoff parameter",
         type=float, dest="backoff", default=0.0,
     )
+    parser.add_argument(
+        "-p", "--prefetch", help="prefetch parameter",
+        type=int, dest="prefetch", default=1,
+    )
+    parser.add_argument(
+        "-P", "--progress", help="progress parameter",
+        action="store", dest="progress", default="poll",
+        choices=["poll", "wait"],
+    )
+    parser.add_argument(
+        "--latency", help="measure task round-trip latency",
+        action="store_true", dest="latency", default=False,
+    )
     parser.add_argument(
         "-o", "--outband", help="use out-of-band pickle",
         action="store_true", dest="outband", default=False,
@@ -409,6 +583,9 @@ def futures(comm, args=None, verbose=True):
     tasks = options.tasks
     allocator = options.allocator
     backoff = options.backoff
+    prefetch = options.prefetch
+    progress = options.progress
+    latency = options.latency
     use_pkl5 = options.outband
     chunksize = options.chunksize
 
@@ -459,6 +636,8 @@ def futures(comm, args=None, verbose=True):
         return MPIPoolExecutor(
             max_workers=workers,
             backoff=backoff,
+            prefetch=prefetch,
+            progress=progress,
             use_pkl5=use_pkl5,
         )
 
@@ -476,9 +655,16 @@ def futures(comm, args=None, verbose=True):
         for _ in iterator:
             pass
 
+    def executor_submit(task, data):
+        for item in data:
+            executor.submit(task, item).result()
+
     def run_futures():
         t_start = wtime()
-        executor_map(_fn_identity, data)
+        if latency:
+            executor_submit(_fn_identity, data)
+        else:
+            executor_map(_fn_identity, data)
         t_end = wtime()
         return t_end - t_start
 
@@ -519,12 +705,19 @@ def futures(comm, args=None, verbose=True):
                     f"{num_workers} workers, "
                     f"{tasks} tasks/worker"
                 )
-                header = "# Size [B]  Tasks/s"
+                if latency:
+                    header = "# Size [B] Latency [us]"
+                else:
+                    header = "# Size [B]  Tasks/s"
                 if options.print_stats:
                     header += " | Time Mean [s] \u00b1 StdDev [s]  Samples"
                 print(header, flush=True)
-            throughput = num_tasks / t_mean
-            message = f"{nbytes:10d}{throughput:9.0f}"
+            if latency:
+                t_task = t_mean / num_tasks * 1e6
+                message = f"{nbytes:10d}{t_task:13.2f}"
+            else:
+                throughput = num_tasks / t_mean
+                message = f"{nbytes:10d}{throughput:9.0f}"
             if options.print_stats:
                 message += f" | {t_mean:.7e} \u00b1 {t_stdev:.4e} {loop:8d}"
             print(message, flush=True)
@@ -579,6 +772,7 @@ main.commands = {  # type: ignore[attr-defined]
     'helloworld': helloworld,
     'ringtest': ringtest,
     'pingpong': pingpong,
+    'reduce': reduce,
     'futures': futures,
 }
 
@@ -123,6 +123,16 @@ def _getopt_backoff(options):
     return float(backoff)
 
 
+PREFETCH = 1
+
+
+def _getopt_prefetch(options):
+    prefetch = options.get('prefetch')
+    if prefetch is None:
+        prefetch = os_environ_get('PREFETCH', PREFETCH)
+    return max(int(prefetch), 1)
+
+
 class Backoff:
 
     def __init__(self, seconds=BACKOFF):
@@ -138,13 +148,88 @@ class Backoff:
         self.tval = min(self.tmax, max(self.tmin, self.tval * 2))
 
 
+PROGRESS = 'poll'
+
+
+def _getopt_progress(options):
+    progress = options.get('progress')
+    if progress is None:
+        progress = os_environ_get('PROGRESS', PROGRESS)
+    if str(progress).lower() in ('poll', 'wait'):
+        return str(progress).lower()
+    warnings.warn(
+        f"futures progress: unexpected value {repr(progress)}",
+        RuntimeWarning, stacklevel=2,
+    )
+    return PROGRESS
+
+
+def _setopt_progress(options):
+    options['progress'] = _getopt_progress(options)
+
+
+class Waker:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ident = threading.get_ident()
+        self.request = None
+        self.done = False
+
+    def arm(self):
+        with self.lock:
+            if self.request is None:
+                self.request = MPI.Grequest.Start(None, None, None)
+                self.done = False
+            return self.request
+
+    def wake(self):
+        if threading.get_ident() == self.ident:
+            return
+        with self.lock:
+            if self.request is not None and not self.done:
+                self.done = True
+                self.request.Complete()
+
+    def reset(self):
+        with self.lock:
+            self.request = None
+
+    def close(self):
+        with self.lock:
+            request, self.request = self.request, None
+            if request is not None:
+                if not self.done:
+                    request.Complete()
+                request.Wait()
+
+
 class TaskQueue(collections.deque):
-    put = collections.deque.append
+    waker = None
     pop = collections.deque.popleft
     add = collections.deque.appendleft
 
+    def put(self, x):
+        self.append(x)
+        waker = self.waker
+        if waker is not None:
+            waker.wake()
+
 
 class WorkerSet(collections.deque):
+    pop = collections.deque.popleft
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.wakers = []
+
+    def add(self, x):
+        self.append(x)
+        for waker in self.wakers:
+            waker.wake()
+
+
+class Batches(collections.deque):
     add = collections.deque.append
     pop = collections.deque.popleft
 
@@ -407,15 +492,18 @@ class SharedPoolCtx:
         self.on_root = None
         self.counter = None
         self.workers = None
+        self.progress = None
         self.threads = weakref.WeakKeyDictionary()
 
     def __call__(self, executor):
         assert SharedPool is self  # noqa: S101
         if self.comm != MPI.COMM_NULL and self.on_root:
             tag = next(self.counter)
+            options = executor._options
             if tag == 0:
-                options = executor._options
                 self.comm = client_comm(self.comm, options)
+                self.progress = _getopt_progress(options)
+            options['progress'] = self.progress
             manager = _manager_shared
             args = (self.comm, tag, self.workers)
         else:
@@ -463,6 +551,7 @@ class SharedPoolCtx:
         self.on_root = None
         self.counter = None
         self.workers = None
+        self.progress = None
         self.threads.clear()
         return False
 
@@ -556,6 +645,7 @@ def bcast_recv(comm):
 def client_sync(comm, options, full=True):
     barrier(comm)
     _setopt_use_pkl5(options)
+    _setopt_progress(options)
     if full:
         options = _sync_get_data(options)
     bcast_send(comm, options)
@@ -578,14 +668,24 @@ def client_exec(comm, options, tag, worker_set, task_queue):
     # pylint: disable=too-many-locals
     # pylint: disable=too-many-statements
     backoff = Backoff(_getopt_backoff(options))
+    prefetch = _getopt_prefetch(options)
+    progress = _getopt_progress(options)
+    batchsize = (prefetch + 1) // 2
 
     status = MPI.Status()
+    header = [None, MPI.BYTE]
     comm_recv = serialized(comm.recv)
     comm_isend = serialized(comm.issend)
     comm_iprobe = serialized(comm.iprobe)
+    comm_irecv = serialized(comm.Irecv)
     request_free = serialized(_get_mpi(comm).Request.Free)
+    request_waitsome = serialized(MPI.Request.Waitsome)
+    request_testsome = serialized(MPI.Request.Testsome)
 
     pending = {}
+    credits = {}
+    partial = {}
+    notify = {} if progress == 'wait' else None
 
     def iprobe():
         pid = MPI.ANY_SOURCE
@@ -597,60 +697,175 @@ def client_exec(comm, options, tag, worker_set, task_queue):
         while not comm_iprobe(pid, tag, status):
             backoff.sleep()
 
-    def recv():
-        pid = MPI.ANY_SOURCE
+    def recv(pid=MPI.ANY_SOURCE):
         try:
             task = comm_recv(None, pid, tag, status)
         except BaseException:
             task = (None, sys_exception())
         pid = status.source
-        worker_set.add(pid)
 
-        future, request = pending.pop(pid)
+        batch = pending[pid]
+        futures, request = batch.pop()
         request_free(request)
-        result, exception = task
-        if exception is None:
-            future.set_result(result)
+        if not batch:
+            del pending[pid]
+        if prefetch == 1:
+            worker_set.add(pid)
         else:
-            future.set_exception(exception)
-
-    def send():
-        item = task_queue.pop()
-        if item is None:
-            return True
+            credits[pid] += len(futures)
+            if pid not in pending:
+                del credits[pid]
+                partial.pop(pid, None)
+                worker_set.add(pid)
+            else:
+                partial[pid] = None
+        if notify is not None and pid in pending:
+            post(pid)
+
+        if not isinstance(task, list):
+            task = [task] * len(futures)
+        for future, (result, exception) in zip(futures, task):
+            if exception is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exception)
 
+    def get_worker():
         try:
             pid = worker_set.pop()
+        except LookupError:
+            if not partial:
+                raise
+            pid = next(iter(partial))
+            del partial[pid]
+            return pid
+        if prefetch > 1:
+            credits[pid] = prefetch
+        return pid
+
+    def put_worker(pid):
+        if prefetch == 1:
+            worker_set.add(pid)
+        elif pid in pending:
+            partial[pid] = None
+        else:
+            del credits[pid]
+            worker_set.add(pid)
+
+    def get_tasks(pid):
+        count = min(credits[pid], batchsize) if prefetch > 1 else 1
+        futures, tasks, stop = [], [], False
+        while len(tasks) < count:
+            try:
+                item = task_queue.pop()
+            except LookupError:
+                break
+            if item is None:
+                stop = True
+                break
+            future, task = item
+            if future.set_running_or_notify_cancel():
+                futures.append(future)
+                tasks.append(task)
+        return futures, tasks, stop
+
+    def send():
+        try:
+            pid = get_worker()
         except LookupError:  # pragma: no cover
-            task_queue.add(item)
             return False
 
-        future, task = item
-        if not future.set_running_or_notify_cancel():
-            worker_set.add(pid)
-            return False
+        futures, tasks, stop = get_tasks(pid)
+        if not futures:
+            put_worker(pid)
+            return stop
 
         try:
+            task = tasks if prefetch > 1 else tasks[0]
             request = comm_isend(task, pid, tag)
-            pending[pid] = (future, request)
+            pending.setdefault(pid, Batches()).add((futures, request))
+            if prefetch > 1:
+                credits[pid] -= len(futures)
+                if credits[pid] > 0:
+                    partial[pid] = None
+            if notify is not None and pid not in notify:
+                post(pid)
         except BaseException:
-            worker_set.add(pid)
-            future.set_exception(sys_exception())
-        return None
+            exception = sys_exception()
+            for future in futures:
+                future.set_exception(exception)
+            put_worker(pid)
+        return stop
+
+    def post(pid):
+        notify[pid] = comm_irecv(header, pid, tag)
+
+    def wait(block, waker=None):
+        pids = list(notify)
+        requests = [notify[pid] for pid in pids]
+        if waker is not None:
+            requests.append(waker.arm())
+        if block:
+            indices = request_waitsome(requests)
+        else:
+            indices = request_testsome(requests)
+        for index in indices or ():
+            if index == len(pids):
+                waker.reset()
+                continue
+            pid = pids[index]
+            del notify[pid]
+            recv(pid)
+        return bool(indices)
+
+    def exec_wait():
+        block = serialized.lock is None
+        waker = Waker() if block else None
+        if waker is not None:
+            task_queue.waker = waker
+            worker_set.wakers.append(waker)
+        try:
+            while True:
+                if waker is not None:
+                    waker.arm()
+                if task_queue and (worker_set or partial):
+                    stop = send()
+                    if stop:
+                        break
+                    continue
+                if wait(block, waker):
+                    backoff.reset()
+                else:
+                    backoff.sleep()
+        finally:
+            if waker is not None:
+                task_queue.waker = None
+                worker_set.wakers.remove(waker)
+                waker.close()
+        backoff.reset()
+        while pending:
+            if not wait(block):
+                backoff.sleep()
 
-    while True:
-        if task_queue and worker_set:
-            backoff.reset()
-            stop = send()
-            if stop:
-                break
-        if pending and iprobe():
-            backoff.reset()
+    def exec_poll():
+        while True:
+            if task_queue and (worker_set or partial):
+                backoff.reset()
+                stop = send()
+                if stop:
+                    break
+            if pending and iprobe():
+                backoff.reset()
+                recv()
+            backoff.sleep()
+        while pending:
+            probe()
             recv()
-        backoff.sleep()
-    while pending:
-        probe()
-        recv()
+
+    if notify is not None:
+        exec_wait()
+    else:
+        exec_poll()
 
 
 def client_close(comm):
@@ -686,12 +901,17 @@ def server_init(comm):
 
 def server_exec(comm, options):
     backoff = Backoff(_getopt_backoff(options))
+    blocking = _getopt_progress(options) == 'wait'
 
     status = MPI.Status()
+    header = [None, MPI.BYTE]
     comm_recv = comm.recv
+    comm_send = comm.Send
     comm_isend = comm.issend
     comm_iprobe = comm.iprobe
     request_test = _get_mpi(comm).Request.test
+    request_wait = _get_mpi(comm).Request.wait
+    pickle_dumps = _get_mpi(comm).pickle.dumps
 
     def exception():
         exc = sys_exception()
@@ -700,10 +920,11 @@ def server_exec(comm, options):
 
     def recv():
         pid, tag = MPI.ANY_SOURCE, MPI.ANY_TAG
-        backoff.reset()
-        while not comm_iprobe(pid, tag, status):
-            backoff.sleep()
-        pid, tag = status.source, status.tag
+        if not blocking:
+            backoff.reset()
+            while not comm_iprobe(pid, tag, status):
+                backoff.sleep()
+            pid, tag = status.source, status.tag
         try:
             task = comm_recv(None, pid, tag, status)
         except BaseException:
@@ -713,6 +934,8 @@ def server_exec(comm, options):
     def call(task):
         if isinstance(task, BaseException):
             return (None, task)
+        if isinstance(task, list):
+            return [call(item) for item in task]
         func, args, kwargs = task
         try:
             result = func(*args, **kwargs)
@@ -720,13 +943,28 @@ def server_exec(comm, options):
         except BaseException:
             return (None, exception())
 
+    def check(item):
+        try:
+            pickle_dumps(item)
+            return item
+        except BaseException:
+            return (None, exception())
+
     def send(task):
         pid, tag = status.source, status.tag
+        if blocking:
+            comm_send(header, pid, tag)
         try:
             request = comm_isend(task, pid, tag)
         except BaseException:
-            task = (None, exception())
+            if isinstance(task, list):
+                task = [check(item) for item in task]
+            else:
+                task = (None, exception())
             request = comm_isend(task, pid, tag)
+        if blocking:
+            request_wait(request)
+            return
         backoff.reset()
         while not request_test(request)[0]:
             backoff.sleep()
@@ -1,6 +1,6 @@
 import weakref
 import threading
-from ..MPI  import Info, Intracomm, Intercomm
+from ..MPI  import Info, Intracomm, Intercomm, Grequest
 from ._core import Executor, Future
 from typing import Any, Generic, Optional, TypeVar, Union
 from typing import Callable, Iterable, Iterator, Sequence, Mapping
@@ -28,12 +28,34 @@ class Backoff:
     def reset(self) -> None: ...
     def sleep(self) -> None: ...
 
+PREFETCH: int = ...
+
+PROGRESS: str = ...
+
+class Waker:
+    lock: threading.Lock
+    ident: int
+    request: Optional[Grequest]
+    done: bool
+    def __init__(self) -> None: ...
+    def arm(self) -> Grequest: ...
+    def wake(self) -> None: ...
+    def reset(self) -> None: ...
+    def close(self) -> None: ...
+
 class TaskQueue(Generic[_T]):
+    waker: Optional[Waker]
     def put(self, x: _T) -> None: ...
     def pop(self) -> _T: ...
     def add(self, x: _T) -> None: ...
 
 class WorkerSet(Generic[_T]):
+    wakers: List[Waker]
+    def __init__(self, iterable: Iterable[_T] = ...) -> None: ...
+    def add(self, x: _T) -> None: ...
+    def pop(self) -> _T: ...
+
+class Batches(Generic[_T]):
     def add(self, x: _T) -> None: ...
     def pop(self) -> _T: ...
 
@@ -75,6 +97,7 @@ class SharedPoolCtx:
     on_root: Optional[bool]
     counter: Iterator[int]
     workers: WorkerSet[int]
+    progress: Optional[str]
     threads: _ThreadQueueMap
     def __init__(self) -> None: ...
     def __call__(self, executor: Executor) -> Pool: ...
@@ -4,12 +4,17 @@
 
 import sys
 import time
+import operator
 import functools
 import itertools
 import threading
+import collections
 
 from ._core import Future
 from ._core import Executor
+from ._core import TimeoutError  # pylint: disable=redefined-builtin
+from ._core import FIRST_COMPLETED
+from ._core import wait
 from ._core import as_completed
 
 from . import _lib
@@ -43,6 +48,9 @@ class MPIPoolExecutor(Executor):
             wdir: Path to set current working directory in workers.
             env: Environment variables to update ``os.environ`` in workers.
             use_pkl5: If ``True``, use pickle5 out-of-band for communication.
+            backoff: Maximum time in seconds to sleep while idle-waiting.
+            prefetch: Maximum number of tasks dispatched ahead to a worker.
+            progress: Either ``'poll'`` or ``'wait'`` for blocking progress.
 
         """
         if max_workers is not None:
@@ -120,7 +128,8 @@ class MPIPoolExecutor(Executor):
         submit.__text_signature__ = '($self, fn, /, *args, **kwargs)'
 
     def map(self, fn, *iterables,
-            timeout=None, chunksize=1, unordered=False):  # noqa: D402
+            timeout=None, chunksize=1, unordered=False,
+            buffersize=None):  # noqa: D402
         """Return an iterator equivalent to ``map(fn, *iterables)``.
 
         Args:
@@ -131,8 +140,12 @@ class MPIPoolExecutor(Executor):
             timeout: The maximum number of seconds to wait. If ``None``, then
                 there is no limit on the wait time.
             chunksize: The size of the chunks the iterable will be broken into
-                before being passed to a worker process.
+                before being passed to a worker process. If ``'auto'``, the
+                size of the chunks is adapted from task execution times.
             unordered: If ``True``, yield results out-of-order, as completed.
+            buffersize: The maximum number of submitted tasks (or chunks)
+                whose results have not yet been yielded. If ``None``, then
+                all tasks are submitted immediately.
 
         Returns:
             An iterator equivalent to built-in ``map(func, *iterables)``
@@ -144,10 +157,16 @@ class MPIPoolExecutor(Executor):
             Exception: If ``fn(*args)`` raises for any values.
 
         """
-        return self.starmap(fn, zip(*iterables), timeout, chunksize, unordered)
+        # pylint: disable=too-many-arguments
+        iterable = zip(*iterables)
+        if chunksize == 'auto':
+            iterable = _SizedIterator(iterable, _length_hint(iterables))
+        return self.starmap(fn, iterable,
+                            timeout, chunksize, unordered, buffersize)
 
     def starmap(self, fn, iterable,
-                timeout=None, chunksize=1, unordered=False):  # noqa: D402
+                timeout=None, chunksize=1, unordered=False,
+                buffersize=None):  # noqa: D402
         """Return an iterator equivalent to ``itertools.starmap(...)``.
 
         Args:
@@ -157,8 +176,12 @@ class MPIPoolExecutor(Executor):
             timeout: The maximum number of seconds to wait. If ``None``, then
                 there is no limit on the wait time.
             chunksize: The size of the chunks the iterable will be broken into
-                before being passed to a worker process.
+                before being passed to a worker process. If ``'auto'``, the
+                size of the chunks is adapted from task execution times.
             unordered: If ``True``, yield results out-of-order, as completed.
+            buffersize: The maximum number of submitted tasks (or chunks)
+                whose results have not yet been yielded. If ``None``, then
+                all tasks are submitted immediately.
 
         Returns:
             An iterator equivalent to ``itertools.starmap(fn, iterable)``
@@ -171,14 +194,24 @@ class MPIPoolExecutor(Executor):
 
         """
         # pylint: disable=too-many-arguments
-        if chunksize < 1:
+        if chunksize != 'auto' and chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
+        if buffersize is not None:
+            if not isinstance(buffersize, int):
+                raise TypeError("buffersize must be an integer or None")
+            if buffersize < 1:
+                raise ValueError("buffersize must be None or >= 1.")
+        if chunksize == 'auto':
+            num_workers = self._max_workers or 1
+            return _starmap_adaptive(self.submit, fn, iterable,
+                                     timeout, unordered, buffersize,
+                                     num_workers)
         if chunksize == 1:
             return _starmap_helper(self.submit, fn, iterable,
-                                   timeout, unordered)
+                                   timeout, unordered, buffersize)
         else:
             return _starmap_chunks(self.submit, fn, iterable,
-                                   timeout, unordered, chunksize)
+                                   timeout, unordered, chunksize, buffersize)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the executor.
@@ -211,7 +244,13 @@ class MPIPoolExecutor(Executor):
             pool.join()
 
 
-def _starmap_helper(submit, function, iterable, timeout, unordered):
+def _starmap_helper(submit, function, iterable,
+                    timeout, unordered, buffersize=None):
+    # pylint: disable=too-many-arguments
+    if buffersize is not None:
+        return _starmap_buffer(submit, function, iterable,
+                               timeout, unordered, buffersize)
+
     if timeout is not None:
         timer = getattr(time, 'monotonic', time.time)
         end_time = timeout + timer()
@@ -246,6 +285,56 @@ def _starmap_helper(submit, function, iterable, timeout, unordered):
     return result_iterator()
 
 
+def _starmap_buffer(submit, function, iterable,
+                    timeout, unordered, buffersize):
+    # pylint: disable=too-many-arguments
+    if timeout is not None:
+        timer = getattr(time, 'monotonic', time.time)
+        end_time = timeout + timer()
+
+    iterable = iter(iterable)
+    futures = set() if unordered else collections.deque()
+    append = futures.add if unordered else futures.append
+
+    def submit_next(count=1):
+        for args in itertools.islice(iterable, count):
+            append(submit(function, *args))
+
+    submit_next(buffersize)
+
+    def result_iterator():
+        try:
+            if unordered:
+                while futures:
+                    if timeout is None:
+                        done = wait(futures, None, FIRST_COMPLETED)[0]
+                    else:
+                        remaining = end_time - timer()
+                        done = wait(futures, remaining, FIRST_COMPLETED)[0]
+                    if not done:
+                        raise TimeoutError(
+                            f"{len(futures)} futures unfinished")
+                    for future in done:
+                        futures.remove(future)
+                        submit_next()
+                        future = [future]
+                        yield future.pop().result()
+            else:
+                while futures:
+                    future = futures.popleft()
+                    submit_next()
+                    future = [future]
+                    if timeout is None:
+                        yield future.pop().result()
+                    else:
+                        yield future.pop().result(end_time - timer())
+        except BaseException:
+            while futures:
+                futures.pop().cancel()
+            raise
+    return result_iterator()
+
+
 def _apply_chunks(function, chunk):
     return [function(*args) for args in chunk]
 
@@ -267,15 +356,132 @@ def _chain_from_iterable_of_lists(iterable):
 
 
 def _starmap_chunks(submit, function, iterable,
-                    timeout, unordered, chunksize):
+                    timeout, unordered, chunksize, buffersize=None):
     # pylint: disable=too-many-arguments
     function = functools.partial(_apply_chunks, function)
     iterable = _build_chunks(chunksize, iterable)
     result = _starmap_helper(submit, function, iterable,
-                             timeout, unordered)
+                             timeout, unordered, buffersize)
     return _chain_from_iterable_of_lists(result)
 
 
+def _apply_chunks_timed(function, chunk):
+    timer = time.perf_counter
+    t_start = timer()
+    results = [function(*args) for args in chunk]
+    return results, timer() - t_start
+
+
+def _length_hint(iterables):
+    lengths = [operator.length_hint(it, -1) for it in iterables]
+    if not lengths or min(lengths) < 0:
+        return None
+    return min(lengths)
+
+
+class _SizedIterator:
+
+    def __init__(self, iterable, length):
+        self.iterable = iter(iterable)
+        self.length = length
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.iterable)
+
+    def __length_hint__(self):
+        if self.length is None:
+            return NotImplemented
+        return self.length
+
+
+class _AutoChunks:
+    """Iterator of chunks sized from the timings of completed chunks.
+
+    Chunk sizes start at one and grow (at most doubling each time) until
+    the time to run a chunk is about ``ratio`` times the per-task overhead
+    of dispatching it and returning its results. When the length of the
+    iterable is known, chunk sizes shrink toward the end following guided
+    self-scheduling, so the last tasks are spread over all workers.
+    """
+
+    ratio = 10
+
+    def __init__(self, iterable, num_workers):
+        length = operator.length_hint(iterable, -1)
+        self.iterable = iter(iterable)
+        self.remaining = length if length >= 0 else None
+        self.num_workers = max(num_workers, 1)
+        self.chunksize = 1
+        self.run_time = 0.0
+        self.run_items = 0
+        self.overhead = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunksize = self.next_chunksize()
+        chunk = tuple(itertools.islice(self.iterable, chunksize))
+        if not chunk:
+            raise StopIteration
+        self.chunksize = len(chunk)
+        if self.remaining is not None:
+            self.remaining = max(self.remaining - len(chunk), 0)
+        return (chunk,)
+
+    def next_chunksize(self):
+        chunksize = self.chunksize
+        if self.run_items and self.overhead is not None:
+            item_time = self.run_time / self.run_items
+            target = self.ratio * self.overhead
+            if item_time > 0:
+                chunksize = -(-target // item_time)
+            else:
+                chunksize = 2 * chunksize
+            chunksize = min(int(chunksize), 2 * self.chunksize)
+        if self.remaining is not None:
+            guided = -(-self.remaining // (2 * self.num_workers))
+            chunksize = min(chunksize, guided)
+        return max(chunksize, 1)
+
+    def record(self, nitems, run_time, total_time):
+        self.run_time += run_time
+        self.run_items += nitems
+        overhead = max(total_time - run_time, 0.0)
+        if self.overhead is None or overhead < self.overhead:
+            self.overhead = overhead
+
+    def submit(self, submit, function, chunk):
+        timer = time.perf_counter
+        t_start = timer()
+        future = submit(function, chunk)
+
+        def callback(future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            run_time = future.result()[1]
+            self.record(len(chunk), run_time, timer() - t_start)
+
+        future.add_done_callback(callback)
+        return future
+
+
+def _starmap_adaptive(submit, function, iterable,
+                      timeout, unordered, buffersize, num_workers):
+    # pylint: disable=too-many-arguments
+    function = functools.partial(_apply_chunks_timed, function)
+    iterable = _AutoChunks(iterable, num_workers)
+    submit = functools.partial(iterable.submit, submit)
+    if buffersize is None:
+        buffersize = 2 * iterable.num_workers
+    result = _starmap_buffer(submit, function, iterable,
+                             timeout, unordered, buffersize)
+    return _chain_from_iterable_of_lists(item[0] for item in result)
+
+
 class MPICommExecutor:
     """Context manager for `MPIPoolExecutor`.
 
@@ -4,6 +4,10 @@ from ._core import Executor, Future
 from typing import Any, Optional, Type, TypeVar, Union
 from typing import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Tuple
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
 if sys.version_info >= (3, 10):
     from typing import ParamSpec
 else:
@@ -60,16 +64,18 @@ class MPIPoolExecutor(Executor):
         fn: Callable[..., _T],
         *iterables: Iterable[Any],
         timeout: Optional[float] = None,
-        chunksize: int = 1,
+        chunksize: Union[int, Literal['auto']] = 1,
         unordered: bool = False,
+        buffersize: Optional[int] = None,
     ) -> Iterator[_T]: ...
     def starmap(
         self,
         fn: Callable[..., _T],
         iterable: Iterable[Any],
         timeout: Optional[float] = None,
-        chunksize: int = 1,
+        chunksize: Union[int, Literal['auto']] = 1,
         unordered: bool = False,
+        buffersize: Optional[int] = None,
     ) -> Iterator[_T]: ...
     def shutdown(
         self,
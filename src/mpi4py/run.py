@@ -64,12 +64,85 @@ def set_abort_status(status):
     if not isinstance(status, int):
         status = 0 if status is None else 1
     pkg = __spec__.parent
+    cache = sys.modules.get(f'{pkg}.util.importcache')
+    finder = cache.installed() if cache is not None else None
+    if finder is not None and status:
+        # Imports are no longer collective while aborting
+        if finder in sys.meta_path:
+            sys.meta_path.remove(finder)
     mpi = sys.modules.get(f'{pkg}.MPI')
     if mpi is not None and status:
         # pylint: disable=protected-access
         mpi._set_abort_status(status)
 
 
+class _StatsData:
+    # pylint: disable=too-few-public-methods
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        """Implement interface required by ``pstats.Stats``."""
+
+
+def _profile_summary(stats, limit=20):
+    # pylint: disable=import-outside-toplevel
+    from pstats import func_std_string, func_strip_path
+    size = len(stats)
+    times = {}
+    for rank, data in enumerate(stats):
+        for func, (_, _, tottime, _, _) in data.items():
+            times.setdefault(func, [0.0] * size)[rank] = tottime
+    rows = []
+    for func, values in times.items():
+        tmax = max(values)
+        mean = sum(values) / size
+        rows.append((
+            tmax, func, min(values), mean,
+            values.index(tmax), tmax / mean if mean else 1.0,
+        ))
+    rows.sort(key=lambda row: (row[3] - row[0], -row[0]))
+    header = ('function', 'min[s]', 'mean[s]', 'max[s]', 'rank', 'max/mean')
+    rows = [header] + [
+        (func_std_string(func_strip_path(func)),
+         f'{tmin:.6f}', f'{mean:.6f}', f'{tmax:.6f}',
+         f'{rank}', f'{ratio:.2f}')
+        for tmax, func, tmin, mean, rank, ratio in rows[:limit]
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        '  '.join([
+            row[0].ljust(widths[0]),
+            *(cell.rjust(width) for cell, width in zip(row[1:], widths[1:])),
+        ])
+        for row in rows
+    ]
+    lines.insert(1, '-' * len(lines[0]))
+    return '\n'.join(lines)
+
+
+def _profile_report(profiler, filename, root=0):
+    # pylint: disable=import-outside-toplevel
+    import sys
+    from pstats import Stats
+    from . import MPI
+    profiler.create_stats()
+    if not MPI.Is_initialized() or MPI.Is_finalized():
+        print(
+            "mpi4py.run: cannot gather profile statistics, "
+            "MPI is not initialized or already finalized",
+            file=sys.stderr, flush=True,
+        )
+        return
+    stats = MPI.COMM_WORLD.gather(profiler.stats, root=root)
+    if stats is None:
+        return
+    summary = _profile_summary(stats)
+    merged = Stats(*[_StatsData(data) for data in stats])
+    merged.dump_stats(filename)
+    print(summary, file=sys.stderr, flush=True)
+
+
 def main():
     """Entry-point for ``python -m mpi4py.run ...``."""
     # pylint: disable=too-many-statements
@@ -104,6 +177,7 @@ def main():
           --version            show version number and exit
           -h|--help            show this help message and exit
           -rc <key=value,...>  set 'mpi4py.rc.key=value'
+          --profile[=<file>]   profile code and write merged statistics
         """).strip()
 
         if errmess:
@@ -123,6 +197,7 @@ def main():
             # pylint: disable=too-few-public-methods
             # pylint: disable=missing-class-docstring
             rc_args = {}
+            profile = None
 
         def poparg(args):
             if len(args) < 2 or args[1].startswith('-'):
@@ -145,6 +220,10 @@ def main():
                         opt, _, arg = arg0[1:].partition('=')
                         if opt in ('-rc',):
                             arg0, args[1:1] = opt, [arg]
+                        elif opt in ('-profile',):
+                            if not arg:
+                                raise ValueError(arg0)
+                            arg0, options.profile = opt, arg
                     else:
                         arg0 = arg0[1:]
                 if arg0 == '-rc':
@@ -158,6 +237,9 @@ def main():
                         except ValueError:
                             pass
                         options.rc_args[key] = val
+                elif arg0 == '-profile':
+                    if options.profile is None:
+                        options.profile = 'mpi4py.prof'
                 else:
                     usage('Unknown option: ' + args[0])
                 del args[0]
@@ -172,9 +254,32 @@ def main():
         return options, args
 
     def bootstrap(options):
+        from . import rc
         if options.rc_args:  # Set mpi4py.rc parameters
-            from . import rc
             rc(**options.rc_args)
+        if rc.import_cache or os.environ.get('MPI4PY_RC_IMPORT_CACHE'):
+            from . import MPI
+            # pylint: disable=protected-access
+            if MPI._import_cache():  # Broadcast imported modules
+                from .util import importcache
+                importcache.install()
+
+    def run_profile(args, filename):
+        from cProfile import Profile
+        profiler = Profile()
+        status = None
+        profiler.enable()
+        try:
+            run_command_line(args)
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                raise
+            status = exc
+        finally:
+            profiler.disable()
+        _profile_report(profiler, filename)
+        if status is not None:
+            raise status
 
     # Parse and process command line options
     options, args = parse_command_line()
@@ -183,7 +288,10 @@ def main():
     # Run user code. In case of an unhandled exception, abort
     # execution of the MPI program by calling 'MPI_Abort()'.
     try:
-        run_command_line(args)
+        if options.profile is not None:
+            run_profile(args, options.profile)
+        else:
+            run_command_line(args)
     except SystemExit as exc:
         set_abort_status(exc)
         raise
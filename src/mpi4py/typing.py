@@ -21,6 +21,7 @@ from .MPI import (
     Datatype,
     BottomType,
     InPlaceType,
+    BufferSpec,
 )
 if sys.version_info >= (3, 8):  # pragma: no branch
     from typing import Protocol
@@ -157,6 +158,7 @@ BufSpec = Union[
     Tuple[Buffer, Count, TypeSpec],
     Tuple[Bottom, Count, Datatype],
     List,
+    BufferSpec,
 ]
 """
 Buffer specification.
@@ -166,6 +168,7 @@ Buffer specification.
 * Tuple[`Buffer`, `TypeSpec`]
 * Tuple[`Buffer`, `Count`, `TypeSpec`]
 * Tuple[`Bottom`, `Count`, `Datatype`]
+* `BufferSpec`
 """
 
 
@@ -175,6 +178,7 @@ BufSpecB = Union[
     Tuple[Buffer, TypeSpec],
     Tuple[Buffer, Count, TypeSpec],
     List,
+    BufferSpec,
 ]
 """
 Buffer specification (block).
@@ -183,6 +187,7 @@ Buffer specification (block).
 * Tuple[`Buffer`, `Count`]
 * Tuple[`Buffer`, `TypeSpec`]
 * Tuple[`Buffer`, `Count`, `TypeSpec`]
+* `BufferSpec`
 """
 
 
@@ -0,0 +1,179 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Collective checkpoint of Python objects."""
+
+import struct as _struct
+
+from .. import MPI
+from ..MPI import Pickle
+
+_pickle = Pickle()
+
+_MAGIC = b'\x93MPI4PY\x01'
+_TRAILER = _struct.Struct('<qq8s')
+
+
+def _hindexed(lengths, displacements):
+    datatype = MPI.BYTE.Create_hindexed(lengths, displacements)
+    return datatype.Commit()
+
+
+def _addresses(buffers):
+    return [MPI.Get_address(buf) if len(buf) else 0 for buf in buffers]
+
+
+def _check_error(comm, error):
+    errors = [err for err in comm.allgather(error) if err is not None]
+    if errors:
+        raise ValueError(errors[0])
+
+
+def _read_index(fh):
+    fsize = fh.Get_size()
+    if fsize < len(_MAGIC) + _TRAILER.size:
+        raise ValueError("file is not a checkpoint file")
+    magic = bytearray(len(_MAGIC))
+    fh.Read_at(0, magic)
+    trailer = bytearray(_TRAILER.size)
+    fh.Read_at(fsize - _TRAILER.size, trailer)
+    offset, length, tail = _TRAILER.unpack(trailer)
+    if magic != _MAGIC or tail != _MAGIC:
+        raise ValueError("file is not a checkpoint file")
+    index = bytearray(length)
+    fh.Read_at(offset, index)
+    return _pickle.loads(index)
+
+
+def save(filename, obj, comm=MPI.COMM_WORLD, *, info=MPI.INFO_NULL):
+    """Save the objects of all processes to a single checkpoint file.
+
+    Every process pickles its object using out-of-band buffers, and all
+    pickle data streams and buffers are written with a single collective
+    write operation. The file ends with an index of the location of the
+    objects of every process. This function is collective over *comm*.
+    """
+    data, bufs = _pickle.dumps_oob(obj)
+    buffers = [data] + list(bufs)
+    lengths = [len(buf) for buf in buffers]
+    length = sum(lengths)
+    offset = comm.exscan(length) or 0
+    offset += len(_MAGIC)
+    index = comm.gather((offset, lengths), root=0)
+
+    amode = MPI.MODE_WRONLY | MPI.MODE_CREATE
+    fh = MPI.File.Open(comm, filename, amode, info)
+    try:
+        fh.Set_size(0)
+        datatype = _hindexed(lengths, _addresses(buffers))
+        try:
+            fh.Write_at_all(offset, [MPI.BOTTOM, 1, datatype])
+        finally:
+            datatype.Free()
+        if comm.Get_rank() == 0:
+            end = len(_MAGIC) + sum(sum(item[1]) for item in index)
+            index = _pickle.dumps(index)
+            trailer = _TRAILER.pack(end, len(index), _MAGIC)
+            fh.Write_at(0, _MAGIC)
+            fh.Write_at(end, index)
+            fh.Write_at(end + len(index), trailer)
+    finally:
+        fh.Close()
+
+
+def get_count(filename, comm=MPI.COMM_WORLD, *, info=MPI.INFO_NULL):
+    """Get the number of objects saved in a checkpoint file.
+
+    The number of objects is the number of processes that saved the
+    file. This function is collective over *comm*.
+    """
+    return len(_load_index(filename, comm, info))
+
+
+def _load_index(filename, comm, info):
+    fh = MPI.File.Open(comm, filename, MPI.MODE_RDONLY, info)
+    try:
+        return _bcast_index(fh, comm)
+    finally:
+        fh.Close()
+
+
+def _bcast_index(fh, comm):
+    if comm.Get_rank() == 0:
+        try:
+            index = _read_index(fh)
+        except Exception as exc:
+            index = exc
+    else:
+        index = None
+    index = comm.bcast(index, root=0)
+    if isinstance(index, BaseException):
+        raise index
+    return index
+
+
+def load(
+    filename,
+    comm=MPI.COMM_WORLD,
+    *,
+    ranks=None,
+    info=MPI.INFO_NULL,
+):
+    """Load objects from a checkpoint file.
+
+    If *ranks* is not given, every process loads the object saved by the
+    process with the same rank, and the number of processes must match
+    the number of saved objects. Otherwise, every process loads the
+    objects saved by the given ranks, and a list of objects is returned.
+    This function is collective over *comm*.
+    """
+    fh = MPI.File.Open(comm, filename, MPI.MODE_RDONLY, info)
+    try:
+        index = _bcast_index(fh, comm)
+        error = None
+        if ranks is None:
+            if len(index) != comm.Get_size():
+                error = (
+                    f"checkpoint saved by {len(index)} processes, "
+                    f"cannot load with {comm.Get_size()} processes")
+            selected = [comm.Get_rank()]
+        else:
+            selected = list(ranks)
+            for rank in selected:
+                if not 0 <= rank < len(index):
+                    error = (
+                        f"rank {rank} out of range, "
+                        f"checkpoint saved by {len(index)} processes")
+                    break
+        _check_error(comm, error)
+        entries = {}
+        flengths, fdispls = [], []
+        mlengths, mdispls = [], []
+        for rank in sorted(set(selected)):
+            offset, lengths = index[rank]
+            buffers = [bytearray(n) for n in lengths]
+            entries[rank] = buffers
+            flengths.append(sum(lengths))
+            fdispls.append(offset)
+            mlengths.extend(lengths)
+            mdispls.extend(_addresses(buffers))
+        if entries:
+            filetype = _hindexed(flengths, fdispls)
+            try:
+                fh.Set_view(0, MPI.BYTE, filetype)
+            finally:
+                filetype.Free()
+            memtype = _hindexed(mlengths, mdispls)
+        else:
+            fh.Set_view(0, MPI.BYTE, MPI.BYTE)
+            memtype = MPI.BYTE.Dup()
+        try:
+            fh.Read_all([MPI.BOTTOM, len(entries) and 1, memtype])
+        finally:
+            memtype.Free()
+    finally:
+        fh.Close()
+    objs = [_pickle.loads_oob(entries[rank][0], entries[rank][1:])
+            for rank in selected]
+    if ranks is None:
+        return objs[0]
+    return objs
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from .. import MPI
+from typing import Any, Iterable, Optional, Union
+from os import PathLike
+
+def save(
+    filename: Union[PathLike, str, bytes],
+    obj: Any,
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    info: MPI.Info = MPI.INFO_NULL,
+) -> None: ...
+def get_count(
+    filename: Union[PathLike, str, bytes],
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    info: MPI.Info = MPI.INFO_NULL,
+) -> int: ...
+def load(
+    filename: Union[PathLike, str, bytes],
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    ranks: Optional[Iterable[int]] = None,
+    info: MPI.Info = MPI.INFO_NULL,
+) -> Any: ...
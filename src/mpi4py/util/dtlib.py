@@ -10,6 +10,7 @@ from .. import MPI
 
 try:
     from numpy import dtype as _np_dtype
+    from numpy import asarray as _np_asarray
 except ImportError:  # pragma: no cover
     pass
 
@@ -112,9 +113,73 @@ def from_numpy_dtype(dtype):
 
     # elementary data type
     datatype = _get_datatype(dtype)
+    size = datatype.Get_size()
+    if size and dtype.itemsize > size and dtype.itemsize % size == 0:
+        # fixed-width strings
+        return datatype.Create_contiguous(dtype.itemsize // size)
     return datatype.Dup()
 
 
+_cache = {}
+_cache_maxsize = 128
+
+
+def _cache_free(datatype):
+    if not MPI.Is_finalized():
+        datatype.Free()
+
+
+def get_datatype(dtype):
+    """Get committed MPI datatype for NumPy datatype from a cache.
+
+    The cache holds a bounded number of derived datatypes and frees the
+    least recently used ones when full. Predefined MPI datatypes are
+    returned for elementary NumPy datatypes. The returned datatype must
+    not be freed.
+    """
+    try:
+        dtype = _np_dtype(dtype)
+    except NameError:
+        # pylint: disable=raise-missing-from
+        raise RuntimeError("NumPy is not available")
+
+    if not (dtype.fields or dtype.subdtype):
+        if dtype.hasobject:
+            raise ValueError("NumPy datatype with object entries")
+        if not dtype.isnative:
+            raise ValueError("NumPy datatype with non-native byteorder")
+        datatype = _get_datatype(dtype)
+        if dtype.itemsize == datatype.Get_size():
+            return datatype
+
+    try:
+        datatype = _cache.pop(dtype)
+    except KeyError:
+        datatype = from_numpy_dtype(dtype)
+        datatype.Commit()
+        while _cache and len(_cache) >= _cache_maxsize:
+            _cache_free(_cache.pop(next(iter(_cache))))
+    _cache[dtype] = datatype
+    return datatype
+
+
+def clear_cache():
+    """Free the MPI datatypes held by the `get_datatype` cache."""
+    while _cache:
+        _cache_free(_cache.popitem()[1])
+
+
+def _get_buffer_datatype(obj, itemsize):
+    dtype = getattr(obj, 'dtype', None)
+    if getattr(dtype, 'itemsize', None) != itemsize:
+        try:
+            dtype = _np_asarray(memoryview(obj)).dtype
+        except NameError:
+            # pylint: disable=raise-missing-from
+            raise RuntimeError("NumPy is not available")
+    return get_datatype(dtype)
+
+
 def to_numpy_dtype(datatype):
     """Convert MPI datatype to NumPy datatype."""
 
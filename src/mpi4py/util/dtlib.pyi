@@ -5,3 +5,5 @@ from ..MPI import Datatype
 
 def from_numpy_dtype(dtype: DTypeLike) -> Datatype: ...
 def to_numpy_dtype(datatype: Datatype) -> dtype: ...
+def get_datatype(dtype: DTypeLike) -> Datatype: ...
+def clear_cache() -> None: ...
@@ -0,0 +1,165 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Broadcast-based import of Python modules."""
+
+import importlib.machinery as _machinery
+import marshal as _marshal
+import sys as _sys
+import threading as _threading
+
+from .. import MPI
+
+
+class _CodeLoader(_machinery.SourceFileLoader):
+    """Loader executing code objects broadcast from the root process."""
+
+    def __init__(self, fullname, path, code):
+        super().__init__(fullname, path)
+        self.code = code
+
+    def get_code(self, fullname):
+        code, self.code = self.code, None
+        if code is None:
+            return super().get_code(fullname)
+        return code
+
+
+class Finder:
+    """Meta path finder broadcasting modules from the root process.
+
+    The root process searches the module with the default path-based
+    finder and reads its source or cached bytecode. The compiled code is
+    broadcast to all processes, which execute it without accessing the
+    file system. Extension modules are loaded by all processes from the
+    location found by the root process.
+    """
+
+    def __init__(self, comm=MPI.COMM_WORLD, root=0):
+        """Initialize the finder over a duplicate of *comm*."""
+        self.comm = comm.Dup()
+        self.root = root
+        self.thread = _threading.get_ident()
+        self.busy = False
+        self.hits = 0
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the module spec collectively over all processes."""
+        if self.busy:
+            return None
+        if self.thread != _threading.get_ident():
+            return None
+        if MPI.Is_finalized():
+            return None
+        self.busy = True
+        try:
+            return self._find_spec(fullname, path, target)
+        finally:
+            self.busy = False
+
+    def invalidate_caches(self):
+        """Invalidate finder caches."""
+
+    def _find_spec(self, fullname, path, target):
+        comm, root = self.comm, self.root
+        spec = info = None
+        if comm.Get_rank() == root:
+            try:
+                spec = _machinery.PathFinder.find_spec(fullname, path, target)
+                info = _spec_info(spec)
+            except Exception:  # pylint: disable=broad-except
+                info = None
+            info = (fullname, info)
+        info = comm.bcast(info, root)
+        if info[0] != fullname:
+            raise ImportError(
+                f"processes imported different modules: "
+                f"{info[0]!r} at root and {fullname!r} at this process",
+                name=fullname,
+            )
+        info = info[1]
+        if info is None:
+            return None
+        self.hits += 1
+        return _make_spec(fullname, *info)
+
+
+def _spec_info(spec):
+    if spec is None or not spec.has_location:
+        return None
+    loader = spec.loader
+    search = spec.submodule_search_locations
+    if search is not None:
+        search = list(search)
+    if isinstance(loader, _machinery.ExtensionFileLoader):
+        return ('ext', spec.origin, search, spec.cached, None)
+    if isinstance(loader, (
+        _machinery.SourceFileLoader,
+        _machinery.SourcelessFileLoader,
+    )):
+        code = loader.get_code(spec.name)
+        code = _marshal.dumps(code)
+        return ('src', spec.origin, search, spec.cached, code)
+    return None
+
+
+def _make_spec(fullname, kind, origin, search, cached, code):
+    if kind == 'ext':
+        loader = _machinery.ExtensionFileLoader(fullname, origin)
+    else:
+        # code objects marshaled by the root process of the same job
+        code = _marshal.loads(code)  # noqa: S302
+        loader = _CodeLoader(fullname, origin, code)
+    spec = _machinery.ModuleSpec(
+        fullname, loader,
+        origin=origin,
+        is_package=search is not None,
+    )
+    if search is not None:
+        spec.submodule_search_locations = search
+    spec.has_location = True
+    spec.cached = cached
+    return spec
+
+
+_finder = None
+
+
+def install(comm=MPI.COMM_WORLD, root=0):
+    """Install the broadcast-based module finder.
+
+    While installed, modules not found in :data:`sys.modules` are
+    searched and read by the *root* process and broadcast to all
+    processes in *comm*. All processes must import the same modules in
+    the same order. This function is collective over *comm*.
+    """
+    global _finder  # pylint: disable=global-statement
+    if _finder is not None:
+        raise RuntimeError("module finder already installed")
+    _finder = Finder(comm, root)
+    meta_path = _sys.meta_path
+    index = len(meta_path)
+    if _machinery.PathFinder in meta_path:
+        index = meta_path.index(_machinery.PathFinder)
+    meta_path.insert(index, _finder)
+    return _finder
+
+
+def uninstall():
+    """Uninstall the broadcast-based module finder.
+
+    This function is collective over the communicator used to install
+    the module finder.
+    """
+    global _finder  # pylint: disable=global-statement
+    finder, _finder = _finder, None
+    if finder is None:
+        return
+    if finder in _sys.meta_path:
+        _sys.meta_path.remove(finder)
+    if not MPI.Is_finalized():
+        finder.comm.Free()
+
+
+def installed():
+    """Return the installed module finder, or `None`."""
+    return _finder
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from .. import MPI
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Optional, Sequence
+
+class Finder:
+    comm: MPI.Intracomm
+    root: int
+    thread: int
+    busy: bool
+    hits: int
+    def __init__(
+        self,
+        comm: MPI.Intracomm = MPI.COMM_WORLD,
+        root: int = 0,
+    ) -> None: ...
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]: ...
+    def invalidate_caches(self) -> None: ...
+
+def install(
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    root: int = 0,
+) -> Finder: ...
+def uninstall() -> None: ...
+def installed() -> Optional[Finder]: ...
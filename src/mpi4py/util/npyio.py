@@ -0,0 +1,240 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Parallel I/O of NumPy arrays in ``.npy`` format."""
+
+import io as _io
+
+from .. import MPI
+
+try:
+    from numpy import dtype as _np_dtype
+    from numpy import empty as _np_empty
+    from numpy import asarray as _np_asarray
+    from numpy.lib import format as _np_format
+except ImportError:  # pragma: no cover
+    pass
+
+
+def _check_numpy():
+    try:
+        return _np_format
+    except NameError:
+        # pylint: disable=raise-missing-from
+        raise RuntimeError("NumPy is not available")
+
+
+def _header_bytes(header):
+    npyfmt = _check_numpy()
+    stream = _io.BytesIO()
+    try:
+        npyfmt.write_array_header_1_0(stream, header)
+    except ValueError:  # pragma: no cover
+        stream = _io.BytesIO()
+        npyfmt.write_array_header_2_0(stream, header)
+    return stream.getvalue()
+
+
+def _read_header(fh):
+    npyfmt = _check_numpy()
+    prefix = bytearray(npyfmt.MAGIC_LEN + 4)
+    status = MPI.Status()
+    fh.Read_at(0, prefix, status)
+    count = status.Get_count(MPI.BYTE)
+    stream = _io.BytesIO(prefix[:count])
+    version = npyfmt.read_magic(stream)
+    if version == (1, 0):
+        hlen = int.from_bytes(prefix[npyfmt.MAGIC_LEN:][:2], 'little')
+        offset = npyfmt.MAGIC_LEN + 2 + hlen
+        read_array_header = npyfmt.read_array_header_1_0
+    elif version == (2, 0):
+        hlen = int.from_bytes(prefix[npyfmt.MAGIC_LEN:][:4], 'little')
+        offset = npyfmt.MAGIC_LEN + 4 + hlen
+        read_array_header = npyfmt.read_array_header_2_0
+    else:  # pragma: no cover
+        raise ValueError(f"unsupported .npy format version {version}")
+    header = bytearray(offset)
+    fh.Read_at(0, header)
+    stream = _io.BytesIO(header)
+    npyfmt.read_magic(stream)
+    shape, fortran_order, dtype = read_array_header(stream)
+    return shape, fortran_order, dtype, offset
+
+
+def _check_error(comm, error):
+    errors = [err for err in comm.allgather(error) if err is not None]
+    if errors:
+        raise ValueError(errors[0])
+
+
+def _block_partition(comm, shape, subsizes, starts):
+    shape = tuple(shape)
+    if subsizes is None:
+        if not shape:
+            subsizes = ()
+        else:
+            size = comm.Get_size()
+            rank = comm.Get_rank()
+            q, r = divmod(shape[0], size)
+            subsizes = (q + (r > rank),) + shape[1:]
+            starts = (rank * q + min(rank, r),) + (0,) * len(shape[1:])
+    subsizes = tuple(subsizes)
+    if starts is None:
+        starts = (0,) * len(shape)
+    starts = tuple(starts)
+    error = None
+    if not len(shape) == len(subsizes) == len(starts):
+        error = (
+            f"mismatch in number of dimensions of "
+            f"shape {shape}, subsizes {subsizes}, and starts {starts}")
+    elif not all(
+        m >= 0 and s >= 0 and s + m <= n
+        for n, m, s in zip(shape, subsizes, starts)
+    ):
+        error = (
+            f"block with subsizes {subsizes} and starts {starts} "
+            f"out of bounds of array with shape {shape}")
+    _check_error(comm, error)
+    return subsizes, starts
+
+
+def _file_view(fh, offset, dtype, shape, subsizes, starts, order):
+    etype = MPI.BYTE.Create_contiguous(dtype.itemsize).Commit()
+    size = 1
+    for n in subsizes:
+        size *= n
+    if size > 0 and shape:
+        filetype = etype.Create_subarray(shape, subsizes, starts, order)
+        filetype.Commit()
+    else:
+        filetype = etype
+    try:
+        fh.Set_view(offset, etype, filetype)
+    finally:
+        if filetype != etype:
+            filetype.Free()
+    return etype, size
+
+
+def save(
+    filename,
+    array,
+    comm=MPI.COMM_WORLD,
+    *,
+    shape=None,
+    starts=None,
+    info=MPI.INFO_NULL,
+):
+    """Write a block-distributed array to a ``.npy`` file.
+
+    Each process contributes its local block *array* of the global
+    array. If *shape* and *starts* are not given, the global array is
+    assembled by stacking the local blocks along the first axis in rank
+    order. This function is collective over *comm*.
+    """
+    _check_numpy()
+    array = _np_asarray(array)
+    if not array.flags.c_contiguous:
+        array = array.copy(order='C')
+    dtype = array.dtype
+    subsizes = array.shape
+    error = None
+    if dtype.hasobject:
+        error = "cannot write arrays with object entries"
+    elif (shape is None) != (starts is None):
+        error = "shape and starts must be given together"
+    _check_error(comm, error)
+    layout = (array.ndim, subsizes[1:]) if shape is None else None
+    if comm.allgather(layout) != [layout] * comm.Get_size():
+        raise ValueError("mismatch in local array shapes")
+    if shape is None:
+        if array.ndim == 0:
+            shape = ()
+        else:
+            count = subsizes[0]
+            start = comm.exscan(count) or 0
+            total = comm.allreduce(count)
+            shape = (total,) + subsizes[1:]
+            starts = (start,) + (0,) * (array.ndim - 1)
+    subsizes, starts = _block_partition(comm, shape, subsizes, starts)
+    if comm.allgather(dtype.str) != [dtype.str] * comm.Get_size():
+        raise ValueError("mismatch in local array datatypes")
+
+    header = _header_bytes({
+        'descr': _np_format.dtype_to_descr(dtype),
+        'fortran_order': False,
+        'shape': tuple(shape),
+    })
+    amode = MPI.MODE_WRONLY | MPI.MODE_CREATE
+    fh = MPI.File.Open(comm, filename, amode, info)
+    try:
+        fh.Set_size(0)
+        if comm.Get_rank() == 0:
+            fh.Write_at(0, header)
+        etype, size = _file_view(
+            fh, len(header), dtype,
+            shape, subsizes, starts, MPI.ORDER_C,
+        )
+        if not shape and comm.Get_rank() != 0:
+            size = 0
+        try:
+            fh.Write_all([array, size, etype])
+        finally:
+            etype.Free()
+    finally:
+        fh.Close()
+
+
+def load(
+    filename,
+    comm=MPI.COMM_WORLD,
+    *,
+    subsizes=None,
+    starts=None,
+    info=MPI.INFO_NULL,
+):
+    """Read a block of an array from a ``.npy`` file.
+
+    Each process reads the block of the global array with sizes
+    *subsizes* at offsets *starts*. If *subsizes* is not given, the
+    global array is partitioned along the first axis in nearly equal
+    blocks assigned in rank order. The number of processes may differ
+    from the one used to write the file. This function is collective
+    over *comm*.
+    """
+    _check_numpy()
+    amode = MPI.MODE_RDONLY
+    fh = MPI.File.Open(comm, filename, amode, info)
+    try:
+        if comm.Get_rank() == 0:
+            try:
+                meta = _read_header(fh)
+            except Exception as exc:
+                meta = exc
+        else:
+            meta = None
+        meta = comm.bcast(meta, root=0)
+        if isinstance(meta, BaseException):
+            raise meta
+        shape, fortran_order, dtype, offset = meta
+        dtype = _np_dtype(dtype)
+        if dtype.hasobject:
+            raise ValueError("cannot read arrays with object entries")
+        subsizes, starts = _block_partition(comm, shape, subsizes, starts)
+        if fortran_order:
+            shape = shape[::-1]
+            subsizes = subsizes[::-1]
+            starts = starts[::-1]
+        array = _np_empty(subsizes, dtype)
+        etype, size = _file_view(
+            fh, offset, dtype,
+            shape, subsizes, starts, MPI.ORDER_C,
+        )
+        try:
+            fh.Read_all([array, size, etype])
+        finally:
+            etype.Free()
+    finally:
+        fh.Close()
+    if fortran_order:
+        array = array.T
+    return array
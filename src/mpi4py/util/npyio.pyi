@@ -0,0 +1,24 @@
+from __future__ import annotations
+from numpy import ndarray
+from numpy.typing import ArrayLike
+from .. import MPI
+from typing import Optional, Sequence, Union
+from os import PathLike
+
+def save(
+    filename: Union[PathLike, str, bytes],
+    array: ArrayLike,
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    shape: Optional[Sequence[int]] = None,
+    starts: Optional[Sequence[int]] = None,
+    info: MPI.Info = MPI.INFO_NULL,
+) -> None: ...
+def load(
+    filename: Union[PathLike, str, bytes],
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    subsizes: Optional[Sequence[int]] = None,
+    starts: Optional[Sequence[int]] = None,
+    info: MPI.Info = MPI.INFO_NULL,
+) -> ndarray: ...
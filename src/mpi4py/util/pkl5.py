@@ -2,7 +2,9 @@
 # Contact: dalcinl@gmail.com
 """Pickle-based communication using protocol 5."""
 
+import os as _os
 import struct as _struct
+import threading as _threading
 
 from .. import MPI
 from ..MPI import (
@@ -82,6 +84,70 @@ class _BigMPI:
 _bigmpi = _BigMPI()
 
 
+class _Pipeline:
+    """Support for segmented, pipelined broadcast."""
+
+    segsize = None
+    window = 4
+    maxcache = 1024**2 * 16  # 16 MiB
+
+    def __init__(self):
+        self.local = _threading.local()
+
+    def get_segsize(self):
+        segsize = self.segsize
+        if segsize is None:
+            segsize = int(_os.environ.get('MPI4PY_PKL5_BCAST_SEGSIZE', 0))
+        return segsize
+
+    def alloc(self, size):
+        if size > self.maxcache:
+            return _new_buffer(size)
+        # the cached buffer is taken while in use,
+        # nested broadcasts allocate a new one
+        buf = getattr(self.local, 'buffer', None)
+        self.local.buffer = None
+        if buf is None or len(buf) < size:
+            capacity = 1 << max(size - 1, 0).bit_length()
+            buf = _new_buffer(capacity)
+        return buf[:size]
+
+    def release(self, buf):
+        buf = getattr(buf, 'obj', None)
+        if not isinstance(buf, MPI.memory):
+            return
+        if len(buf) > self.maxcache:
+            return
+        cached = getattr(self.local, 'buffer', None)
+        if cached is None or len(cached) < len(buf):
+            self.local.buffer = buf
+
+    def bcast(self, comm, bcast, buf, root):
+        buf = memoryview(buf).cast('B')
+        count = buf.nbytes
+        segsize = self.get_segsize()
+        with _bigmpi as bigmpi:
+            if segsize <= 0 or count <= segsize:
+                bcast(comm, bigmpi(buf), root)
+                return
+            if bcast is not MPI.Comm.Bcast:
+                for offset in range(0, count, segsize):
+                    segment = buf[offset:offset + segsize]
+                    bcast(comm, bigmpi(segment), root)
+                return
+            window = max(self.window, 1)
+            reqs = []
+            for offset in range(0, count, segsize):
+                if len(reqs) >= window:
+                    reqs.pop(0).Wait()
+                segment = buf[offset:offset + segsize]
+                reqs.append(MPI.Comm.Ibcast(comm, bigmpi(segment), root))
+            MPI.Request.Waitall(reqs)
+
+
+_pipeline = _Pipeline()
+
+
 def _info_typecode():
     return 'q'
 
@@ -317,12 +383,12 @@ def _bcast_intra_raw(comm, bcast, data, bufs, root):
         info = _info_alloc(infosize)
         bcast(comm, (info, infotype), root)
         info = _info_unpack(info)
-        data = _new_buffer(info[0])
+        data = _pipeline.alloc(info[0])
         bufs = list(map(_new_buffer, info[1:]))
-    with _bigmpi as bigmpi:
-        bcast(comm, bigmpi(data), root)
-        for rbuf in bufs:
-            bcast(comm, bigmpi(rbuf), root)
+    pipeline = _pipeline
+    pipeline.bcast(comm, bcast, data, root)
+    for rbuf in bufs:
+        pipeline.bcast(comm, bcast, rbuf, root)
     return data, bufs
 
 
@@ -334,7 +400,10 @@ def _bcast_intra(comm, bcast, obj, root):
         data, bufs = _pickle_dumps(None)
     with _comm_lock(comm, 'bcast'):
         data, bufs = _bcast_intra_raw(comm, bcast, data, bufs, root)
-    return _pickle_loads(data, bufs)
+    try:
+        return _pickle_loads(data, bufs)
+    finally:
+        _pipeline.release(data)
 
 
 def _bcast_inter(comm, bcast, obj, root):
@@ -356,7 +425,10 @@ def _bcast_inter(comm, bcast, obj, root):
             data, bufs = _pickle_dumps(None)
         with _comm_lock(localcomm, 'bcast'):
             data, bufs = _bcast_intra_raw(localcomm, bcast, data, bufs, 0)
-        return _pickle_loads(data, bufs)
+        try:
+            return _pickle_loads(data, bufs)
+        finally:
+            _pipeline.release(data)
     comm.Call_errhandler(MPI.ERR_ROOT)
     raise MPI.Exception(MPI.ERR_ROOT)
 
@@ -380,106 +452,211 @@ def _get_p2p_backend():
     return reqs, send, recv
 
 
+def _pack_items(items):
+    info = [len(items)]
+    for data, bufs in items:
+        info.extend((len(data), len(bufs)))
+    data = [_info_pack(info)]
+    data.extend(data for data, _ in items)
+    data = b''.join(data)
+    bufs = [sbuf for _, bufs in items for sbuf in bufs]
+    return data, bufs
+
+
+def _unpack_items(data, bufs):
+    data = memoryview(data).cast('B')
+    itemsize = _struct.calcsize(_info_typecode())
+    count = _info_unpack(data[:itemsize])[0]
+    offset = itemsize * (1 + 2 * count)
+    info = _info_unpack(data[itemsize:offset])
+    bufs = iter(bufs)
+    items = []
+    for i in range(count):
+        size, nbufs = info[2 * i], info[2 * i + 1]
+        item_data = data[offset:offset + size]
+        item_bufs = [next(bufs) for _ in range(nbufs)]
+        items.append((item_data, item_bufs))
+        offset += size
+    return items
+
+
+def _send_items(comm, send, items, dest, tag):
+    # pylint: disable=too-many-arguments
+    data, bufs = _pack_items(items)
+    _send_raw(comm, send, data, bufs, dest, tag)
+
+
+def _recv_items(comm, recv, source, tag):
+    data, bufs = _recv_raw(comm, recv, None, source, tag)
+    return _unpack_items(data, bufs)
+
+
+def _load_items(items):
+    return [_pickle_loads(data, bufs) for data, bufs in items]
+
+
+def _gather_tree(comm, send, recv, item, root, tag):
+    # pylint: disable=too-many-arguments
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    vrank = (rank - root) % size
+    items = [item]
+    mask = 1
+    while mask < size:
+        if vrank & mask:
+            dest = (rank - mask) % size
+            _send_items(comm, send, items, dest, tag)
+            return None
+        if vrank + mask < size:
+            source = (rank + mask) % size
+            items.extend(_recv_items(comm, recv, source, tag))
+        mask <<= 1
+    shift = (size - root) % size
+    return items[shift:] + items[:shift]
+
+
+def _scatter_tree(comm, send, recv, items, root, tag):
+    # pylint: disable=too-many-arguments
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    vrank = (rank - root) % size
+    if vrank == 0:
+        items = items[root:] + items[:root]
+    mask = 1
+    while mask < size:
+        if vrank & mask:
+            source = (rank - mask) % size
+            items = _recv_items(comm, recv, source, tag)
+            break
+        mask <<= 1
+    mask >>= 1
+    while mask > 0:
+        if vrank + mask < size:
+            dest = (rank + mask) % size
+            _send_items(comm, send, items[mask:], dest, tag)
+            items = items[:mask]
+        mask >>= 1
+    return items[0]
+
+
+def _allgather_bruck(comm, send, recv, item, tag):
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    items = [item]
+    dist = 1
+    while dist < size:
+        count = min(dist, size - dist)
+        dest = (rank - dist) % size
+        source = (rank + dist) % size
+        _send_items(comm, send, items[:count], dest, tag)
+        items.extend(_recv_items(comm, recv, source, tag))
+        dist <<= 1
+    shift = (size - rank) % size
+    return items[shift:] + items[:shift]
+
+
+def _dumps_items(objs, size):
+    if objs is None:
+        objs = [None] * size
+    elif not isinstance(objs, list):
+        objs = list(objs)
+    if len(objs) != size:
+        raise ValueError(f"expecting {size} items, got {len(objs)}")
+    return list(map(_pickle_dumps, objs))
+
+
 def _gather(comm, obj, root):
     reqs, send, recv = _get_p2p_backend()
+    objs = None
     if comm.Is_inter():
-        comm, tag, *_ = _commctx_inter(comm)
+        comm, tag, localcomm, _ = _commctx_inter(comm)
         size = comm.Get_remote_size()
         if root == PROC_NULL:
-            send = recv = None
-        elif root == MPI.ROOT:
-            send = None
+            pass
+        elif root == ROOT:
+            items = _recv_items(comm, recv, 0, tag)
+            objs = _load_items(items)
         elif 0 <= root < size:
-            recv = None
+            item = _pickle_dumps(obj)
+            items = _gather_tree(localcomm, send, recv, item, 0, tag)
+            if items is not None:
+                _send_items(comm, send, items, root, tag)
         else:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
     else:
         comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-        if root != comm.Get_rank():
-            recv = None
         if root < 0 or root >= size:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
-
-    if send:
-        data, bufs = _pickle_dumps(obj)
-        _send_raw(comm, send, data, bufs, root, tag)
-    objs = None
-    if recv:
-        objs = []
-        for source in range(size):
-            data, bufs = _recv_raw(comm, recv, None, source, tag)
-            obj = _pickle_loads(data, bufs)
-            objs.append(obj)
-    if send:
-        MPI.Request.Waitall(reqs)
+        item = _pickle_dumps(obj)
+        items = _gather_tree(comm, send, recv, item, root, tag)
+        if items is not None:
+            objs = _load_items(items)
+    MPI.Request.Waitall(reqs)
     return objs
 
 
 def _scatter(comm, objs, root):
-    # pylint: disable=too-many-branches
     reqs, send, recv = _get_p2p_backend()
+    obj = None
     if comm.Is_inter():
-        comm, tag, *_ = _commctx_inter(comm)
+        comm, tag, localcomm, _ = _commctx_inter(comm)
         size = comm.Get_remote_size()
         if root == PROC_NULL:
-            send = recv = None
+            pass
         elif root == ROOT:
-            recv = None
+            items = _dumps_items(objs, size)
+            _send_items(comm, send, items, 0, tag)
         elif 0 <= root < size:
-            send = None
+            items = None
+            if localcomm.Get_rank() == 0:
+                items = _recv_items(comm, recv, root, tag)
+            item = _scatter_tree(localcomm, send, recv, items, 0, tag)
+            obj = _pickle_loads(*item)
         else:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
     else:
         comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-        if root != comm.Get_rank():
-            send = None
         if root < 0 or root >= size:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
-
-    if send:
-        if objs is None:
-            objs = [None] * size
-        elif not isinstance(objs, list):
-            objs = list(objs)
-        if len(objs) != size:
-            raise ValueError(f"expecting {size} items, got {len(objs)}")
-        for dest, obj in enumerate(objs):
-            data, bufs = _pickle_dumps(obj)
-            _send_raw(comm, send, data, bufs, dest, tag)
-    obj = None
-    if recv:
-        data, bufs = _recv_raw(comm, recv, None, root, tag)
-        obj = _pickle_loads(data, bufs)
-    if send:
-        MPI.Request.Waitall(reqs)
+        items = None
+        if root == comm.Get_rank():
+            items = _dumps_items(objs, size)
+        item = _scatter_tree(comm, send, recv, items, root, tag)
+        obj = _pickle_loads(*item)
+    MPI.Request.Waitall(reqs)
     return obj
 
 
 def _allgather(comm, obj):
     reqs, send, recv = _get_p2p_backend()
+    item = _pickle_dumps(obj)
     if comm.Is_inter():
-        comm, tag, *_ = _commctx_inter(comm)
-        size = comm.Get_remote_size()
+        comm, tag, localcomm, _ = _commctx_inter(comm)
+        items = _gather_tree(localcomm, send, recv, item, 0, tag)
+        if items is not None:
+            _send_items(comm, send, items, 0, tag)
+            data, bufs = _recv_raw(comm, recv, None, 0, tag)
+        else:
+            data, bufs = _pickle_dumps(None)
+        MPI.Request.Waitall(reqs)
+        bcast = MPI.Comm.Bcast
+        with _comm_lock(localcomm, 'bcast'):
+            data, bufs = _bcast_intra_raw(localcomm, bcast, data, bufs, 0)
+        try:
+            return _load_items(_unpack_items(data, bufs))
+        finally:
+            _pipeline.release(data)
     else:
         comm, tag = _commctx_intra(comm)
-        size = comm.Get_size()
-
-    data, bufs = _pickle_dumps(obj)
-    for dest in range(size):
-        _send_raw(comm, send, data, bufs, dest, tag)
-    objs = []
-    for source in range(size):
-        data, bufs = _recv_raw(comm, recv, None, source, tag)
-        obj = _pickle_loads(data, bufs)
-        objs.append(obj)
-    MPI.Request.Waitall(reqs)
-    return objs
+        items = _allgather_bruck(comm, send, recv, item, tag)
+        MPI.Request.Waitall(reqs)
+    return _load_items(items)
 
 
 def _alltoall(comm, objs):
@@ -491,20 +668,17 @@ def _alltoall(comm, objs):
         comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
 
-    if objs is None:
-        objs = [None] * size
-    elif not isinstance(objs, list):
-        objs = list(objs)
-    if len(objs) != size:
-        raise ValueError(f"expecting {size} items, got {len(objs)}")
-    for dest, obj in enumerate(objs):
-        data, bufs = _pickle_dumps(obj)
+    items = _dumps_items(objs, size)
+    rank = comm.Get_rank()
+    for i in range(size):
+        dest = (rank + i) % size
+        data, bufs = items[dest]
         _send_raw(comm, send, data, bufs, dest, tag)
-    objs = []
-    for source in range(size):
+    objs = [None] * size
+    for i in range(size):
+        source = (rank - i) % size
         data, bufs = _recv_raw(comm, recv, None, source, tag)
-        obj = _pickle_loads(data, bufs)
-        objs.append(obj)
+        objs[source] = _pickle_loads(data, bufs)
     MPI.Request.Waitall(reqs)
     return objs
 
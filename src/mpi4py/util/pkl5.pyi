@@ -1,5 +1,6 @@
 from __future__ import annotations
 import sys
+import threading
 from .. import MPI
 from ..MPI import ROOT, PROC_NULL, ANY_SOURCE, ANY_TAG
 from ..MPI import Status, Datatype
@@ -26,6 +27,25 @@ class _BigMPI:
 
 _bigmpi: _BigMPI = ...
 
+class _Pipeline:
+    segsize: Optional[int] = ...
+    window: int = ...
+    maxcache: int = ...
+    local: threading.local = ...
+    def __init__(self) -> None: ...
+    def get_segsize(self) -> int: ...
+    def alloc(self, size: int) -> Buffer: ...
+    def release(self, buf: Buffer) -> None: ...
+    def bcast(
+        self,
+        comm: MPI.Comm,
+        bcast: Callable[[MPI.Comm, Any, int], Any],
+        buf: Buffer,
+        root: int,
+    ) -> None: ...
+
+_pipeline: _Pipeline = ...
+
 class Request(Tuple[MPI.Request, ...]):
     @overload
     def __new__(cls, request: Optional[MPI.Request] = None) -> Request: ...
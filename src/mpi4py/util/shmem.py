@@ -0,0 +1,102 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Node-local shared-memory arrays."""
+
+from .. import MPI
+
+try:
+    from numpy import dtype as _np_dtype
+    from numpy import ndarray as _np_ndarray
+except ImportError:  # pragma: no cover
+    pass
+
+
+class SharedArray:
+    """Node-local shared-memory NumPy array.
+
+    The array memory is allocated once per shared-memory node with
+    `MPI.Win.Allocate_shared`, and every process gets a NumPy array
+    viewing the same memory. The constructor is collective over the
+    given communicator.
+    """
+
+    def __init__(
+        self,
+        shape,
+        dtype=float,
+        comm=MPI.COMM_WORLD,
+        order='C',
+        info=MPI.INFO_NULL,
+    ):
+        """Allocate a node-local shared-memory array."""
+        try:
+            dtype = _np_dtype(dtype)
+        except NameError:
+            # pylint: disable=raise-missing-from
+            raise RuntimeError("NumPy is not available")
+        if dtype.hasobject:
+            raise ValueError("NumPy datatype with object entries")
+        try:
+            shape = (int(shape),)
+        except TypeError:
+            shape = tuple(int(n) for n in shape)
+        if any(n < 0 for n in shape):
+            raise ValueError(f"negative dimensions in shape {shape}")
+        size = 1
+        for n in shape:
+            size *= n
+        nbytes = size * dtype.itemsize
+
+        self.comm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        try:
+            leader = self.comm.Get_rank() == 0
+            self.win = MPI.Win.Allocate_shared(
+                nbytes if leader else 0,
+                max(dtype.itemsize, 1),
+                info, self.comm,
+            )
+        except BaseException:
+            self.comm.Free()
+            raise
+        mem, _ = self.win.Shared_query(0)
+        self.array = _np_ndarray(shape, dtype, mem, order=order)
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Exit context manager."""
+        self.free()
+
+    @property
+    def leader(self):
+        """Whether the calling process allocated the array memory."""
+        return self.comm.Get_rank() == 0
+
+    def fence(self, assertion=0):
+        """Synchronize with a fence on the array window."""
+        self.win.Fence(assertion)
+
+    def barrier(self):
+        """Synchronize memory and processes within the node."""
+        win = self.win
+        win.Lock_all(MPI.MODE_NOCHECK)
+        try:
+            win.Sync()
+            self.comm.Barrier()
+            win.Sync()
+        finally:
+            win.Unlock_all()
+
+    def free(self):
+        """Free the array memory and the node communicator.
+
+        This method is collective over the node communicator. The
+        array (and any view of it) must not be used after freeing.
+        """
+        self.array = None
+        if self.win:
+            self.win.Free()
+        if self.comm:
+            self.comm.Free()
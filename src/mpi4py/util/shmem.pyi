@@ -0,0 +1,31 @@
+from __future__ import annotations
+from numpy import ndarray
+from numpy.typing import DTypeLike
+from .. import MPI
+from typing import Any, Optional
+from typing import Sequence, Union
+import sys
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+class SharedArray:
+    comm: MPI.Intracomm
+    win: MPI.Win
+    array: Optional[ndarray]
+    def __init__(
+        self,
+        shape: Union[int, Sequence[int]],
+        dtype: DTypeLike = float,
+        comm: MPI.Intracomm = MPI.COMM_WORLD,
+        order: Literal['C', 'F'] = 'C',
+        info: MPI.Info = MPI.INFO_NULL,
+    ) -> None: ...
+    def __enter__(self) -> SharedArray: ...
+    def __exit__(self, *exc: Any) -> None: ...
+    @property
+    def leader(self) -> bool: ...
+    def fence(self, assertion: int = 0) -> None: ...
+    def barrier(self) -> None: ...
+    def free(self) -> None: ...
@@ -0,0 +1,231 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Synchronization utilities."""
+
+import array as _array
+
+from .. import MPI
+
+
+def _new_buffer(typechar, values):
+    datatype = MPI.Datatype.fromcode(typechar)
+    return [_array.array(typechar, values), datatype]
+
+
+class Counter:
+    """Global counter.
+
+    Atomic counter built on `MPI.Win.Fetch_and_op` with passive target
+    synchronization. The counter value is held by a single process.
+    """
+
+    def __init__(
+        self,
+        start=0,
+        step=1,
+        *,
+        typechar='q',
+        comm=MPI.COMM_SELF,
+        info=MPI.INFO_NULL,
+        root=0,
+    ):
+        """Create a global counter.
+
+        This method is collective over the given communicator.
+        """
+        datatype = MPI.Datatype.fromcode(typechar)
+        itemsize = datatype.Get_size()
+        count = 1 if comm.Get_rank() == root else 0
+        window = MPI.Win.Allocate(count * itemsize, itemsize, info, comm)
+        if count:
+            window.Lock(root)
+            window.Put(_new_buffer(typechar, [start]), root)
+            window.Unlock(root)
+        comm.Barrier()
+        window.Lock_all(MPI.MODE_NOCHECK)
+        self._start = start
+        self._step = step
+        self._root = root
+        self._window = window
+        self._incr = _new_buffer(typechar, [0])
+        self._result = _new_buffer(typechar, [0])
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Exit context manager."""
+        self.free()
+
+    def __iter__(self):
+        """Implement ``iter(self)``."""
+        return self
+
+    def __next__(self):
+        """Implement ``next(self)``."""
+        return self.next()
+
+    def next(self, incr=None):
+        """Return the current value and increment the counter."""
+        if incr is None:
+            incr = self._step
+        window = self._window
+        self._incr[0][0] = incr
+        window.Fetch_and_op(self._incr, self._result, self._root)
+        window.Flush(self._root)
+        return self._result[0][0]
+
+    def claim(self, count=1):
+        """Claim a batch of `count` consecutive counter values."""
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        step = self._step
+        value = self.next(count * step)
+        return range(value, value + count * step, step)
+
+    def indices(self, stop, batch=1):
+        """Iterate over counter values before `stop` claimed in batches."""
+        yield from _indices(self, stop, batch, self._step)
+
+    def free(self):
+        """Free the counter.
+
+        This method is collective over the communicator used to create
+        the counter.
+        """
+        window = self._window
+        if window:
+            window.Unlock_all()
+            window.Free()
+
+
+class NodeCounter:
+    """Global counter with per-node aggregation.
+
+    Processes claim counter values from a node-local reservation, which
+    is refilled in chunks from a global `Counter`. The process holding
+    the global counter value is accessed once per chunk instead of once
+    per claim.
+    """
+
+    def __init__(
+        self,
+        start=0,
+        step=1,
+        *,
+        chunksize=None,
+        typechar='q',
+        comm=MPI.COMM_SELF,
+        info=MPI.INFO_NULL,
+        root=0,
+    ):
+        """Create a global counter with per-node aggregation.
+
+        This method is collective over the given communicator.
+        """
+        node = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        if chunksize is None:
+            chunksize = 16 * node.Get_size()
+        if chunksize < 1:
+            node.Free()
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        datatype = MPI.Datatype.fromcode(typechar)
+        itemsize = datatype.Get_size()
+        count = 2 if node.Get_rank() == 0 else 0
+        window = MPI.Win.Allocate(count * itemsize, itemsize, info, node)
+        if count:
+            window.Lock(0)
+            window.Put(_new_buffer(typechar, [start, start]), 0)
+            window.Unlock(0)
+        node.Barrier()
+        self._step = step
+        self._chunksize = chunksize
+        self._node = node
+        self._window = window
+        self._state = _new_buffer(typechar, [0, 0])
+        self._counter = Counter(
+            start, step, typechar=typechar,
+            comm=comm, info=info, root=root,
+        )
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Exit context manager."""
+        self.free()
+
+    def __iter__(self):
+        """Implement ``iter(self)``."""
+        return self
+
+    def __next__(self):
+        """Implement ``next(self)``."""
+        return self.next()
+
+    def next(self):
+        """Return the current value and increment the counter."""
+        return self.claim(1)[0]
+
+    def claim(self, count=1):
+        """Claim a batch of `count` counter values.
+
+        The values are consecutive unless the batch spans the end of the
+        node-local reservation.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        step = self._step
+        state = self._state
+        window = self._window
+        window.Lock(0, MPI.LOCK_EXCLUSIVE)
+        try:
+            window.Get(state, 0)
+            window.Flush(0)
+            lo, hi = state[0]
+            avail = (hi - lo) // step
+            if avail >= count:
+                values = range(lo, lo + count * step, step)
+                lo += count * step
+            else:
+                need = count - avail
+                nchunk = max(self._chunksize, need)
+                value = self._counter.next(nchunk * step)
+                values = range(value, value + need * step, step)
+                if avail > 0:
+                    values = list(range(lo, hi, step)) + list(values)
+                lo = value + need * step
+                hi = value + nchunk * step
+            state[0][0], state[0][1] = lo, hi
+            window.Put(state, 0)
+        finally:
+            window.Unlock(0)
+        return values
+
+    def indices(self, stop, batch=1):
+        """Iterate over counter values before `stop` claimed in batches."""
+        yield from _indices(self, stop, batch, self._step)
+
+    def free(self):
+        """Free the counter.
+
+        This method is collective over the communicator used to create
+        the counter.
+        """
+        if self._window:
+            self._window.Free()
+        if self._node:
+            self._node.Free()
+        self._counter.free()
+
+
+def _indices(counter, stop, batch, step):
+    if batch < 1:
+        raise ValueError(f"batch must be positive, got {batch}")
+    while True:
+        for value in counter.claim(batch):
+            if (value >= stop) if step > 0 else (value <= stop):
+                return
+            yield value
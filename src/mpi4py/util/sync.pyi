@@ -0,0 +1,44 @@
+from __future__ import annotations
+from .. import MPI
+from typing import Any, Iterator, Optional, Sequence
+
+class Counter:
+    def __init__(
+        self,
+        start: int = 0,
+        step: int = 1,
+        *,
+        typechar: str = 'q',
+        comm: MPI.Intracomm = MPI.COMM_SELF,
+        info: MPI.Info = MPI.INFO_NULL,
+        root: int = 0,
+    ) -> None: ...
+    def __enter__(self) -> Counter: ...
+    def __exit__(self, *exc: Any) -> None: ...
+    def __iter__(self) -> Counter: ...
+    def __next__(self) -> int: ...
+    def next(self, incr: Optional[int] = None) -> int: ...
+    def claim(self, count: int = 1) -> range: ...
+    def indices(self, stop: int, batch: int = 1) -> Iterator[int]: ...
+    def free(self) -> None: ...
+
+class NodeCounter:
+    def __init__(
+        self,
+        start: int = 0,
+        step: int = 1,
+        *,
+        chunksize: Optional[int] = None,
+        typechar: str = 'q',
+        comm: MPI.Intracomm = MPI.COMM_SELF,
+        info: MPI.Info = MPI.INFO_NULL,
+        root: int = 0,
+    ) -> None: ...
+    def __enter__(self) -> NodeCounter: ...
+    def __exit__(self, *exc: Any) -> None: ...
+    def __iter__(self) -> NodeCounter: ...
+    def __next__(self) -> int: ...
+    def next(self) -> int: ...
+    def claim(self, count: int = 1) -> Sequence[int]: ...
+    def indices(self, stop: int, batch: int = 1) -> Iterator[int]: ...
+    def free(self) -> None: ...
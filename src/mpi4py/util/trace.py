@@ -0,0 +1,190 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Tracing of MPI calls."""
+
+import collections as _collections
+import json as _json
+import sys as _sys
+
+from .. import MPI
+
+
+Event = _collections.namedtuple('Event', [
+    'rank', 'kind', 'name', 'label', 'peer',
+    'nbytes', 'start', 'stop', 'pickle',
+])
+Event.__doc__ = """Traced call."""
+
+
+def enable(size=65536):
+    """Start tracing calls, recording at most the last *size* calls.
+
+    Calls from all threads are recorded.
+    Previously recorded calls are discarded.
+    """
+    MPI._trace_start(size)  # pylint: disable=protected-access
+
+
+def disable():
+    """Stop tracing calls."""
+    MPI._trace_stop()  # pylint: disable=protected-access
+
+
+def _local_events(offset=0.0):
+    # pylint: disable=protected-access
+    count, events = MPI._trace_events()
+    rank = 0
+    if _mpi_active():
+        rank = MPI.COMM_WORLD.Get_rank()
+    events = [
+        Event(rank, *event[:5], event[5] - offset, event[6] - offset, event[7])
+        for event in events
+    ]
+    return events, count - len(events)
+
+
+def _mpi_active():
+    return MPI.Is_initialized() and not MPI.Is_finalized()
+
+
+def get_events():
+    """Return the calls recorded by the calling process."""
+    return _local_events()[0]
+
+
+def gather(comm=MPI.COMM_WORLD, root=0):
+    """Gather the calls recorded by all processes at *root*.
+
+    Tracing is stopped on all processes. Start and stop times are
+    aligned across processes at the exit of a barrier and are relative
+    to the first recorded call. This function is collective over *comm*.
+    """
+    disable()
+    comm.Barrier()
+    offset = MPI.Wtime()
+    events, dropped = _local_events(offset)
+    events = comm.gather(events, root=root)
+    dropped = comm.reduce(dropped, root=root)
+    if events is None:
+        return None
+    events = sorted(
+        (event for local in events for event in local),
+        key=lambda event: (event.start, event.rank),
+    )
+    if events:
+        tmin = events[0].start
+        events = [
+            event._replace(start=event.start - tmin, stop=event.stop - tmin)
+            for event in events
+        ]
+    if dropped:
+        print(
+            f"mpi4py.util.trace: {dropped} calls dropped, "
+            f"increase the size of the trace buffer",
+            file=_sys.stderr, flush=True,
+        )
+    return events
+
+
+def summary(events):
+    """Return a table of per-call statistics of traced calls."""
+    stats = {}
+    for event in events:
+        key = (event.kind, event.name)
+        elapsed = event.stop - event.start
+        calls, total, tmax, nbytes, pickle = stats.get(key, (0, 0, 0, 0, 0))
+        stats[key] = (
+            calls + 1,
+            total + elapsed,
+            max(tmax, elapsed),
+            nbytes + event.nbytes,
+            pickle + event.pickle,
+        )
+    header = ('call', 'count', 'total[s]', 'mean[us]',
+              'max[us]', 'bytes', 'pickle[s]')
+    rows = [
+        (f'{kind}.{name}', f'{calls}', f'{total:.6f}',
+         f'{total / calls * 1e6:.1f}', f'{tmax * 1e6:.1f}',
+         f'{nbytes}', f'{pickle:.6f}')
+        for (kind, name), (calls, total, tmax, nbytes, pickle) in sorted(
+            stats.items(), key=lambda item: -item[1][1])
+    ]
+    widths = [
+        max(len(row[i]) for row in [header, *rows])
+        for i in range(len(header))
+    ]
+    lines = [
+        '  '.join([
+            row[0].ljust(widths[0]),
+            *(cell.rjust(width) for cell, width in zip(row[1:], widths[1:])),
+        ])
+        for row in [header, *rows]
+    ]
+    lines.insert(1, '-' * len(lines[0]))
+    return '\n'.join(lines)
+
+
+def chrome_trace(events):
+    """Return traced calls in the Chrome trace event format.
+
+    The result can be serialized as JSON and loaded in Perfetto or in
+    the trace viewer of Chromium-based browsers. Every process is shown
+    as a separate track.
+    """
+    trace = []
+    for rank in sorted({event.rank for event in events}):
+        trace.append({
+            'name': 'process_name', 'ph': 'M', 'pid': rank,
+            'args': {'name': f'rank {rank}'},
+        })
+    for event in events:
+        args = {}
+        if event.label:
+            args['object'] = event.label
+        if event.peer is not None:
+            args['peer'] = event.peer
+        if event.nbytes:
+            args['bytes'] = event.nbytes
+        if event.pickle:
+            args['pickle[us]'] = event.pickle * 1e6
+        trace.append({
+            'name': event.name,
+            'cat': event.kind,
+            'ph': 'X',
+            'ts': event.start * 1e6,
+            'dur': (event.stop - event.start) * 1e6,
+            'pid': event.rank,
+            'tid': 0,
+            'args': args,
+        })
+    return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+
+def report(
+    filename='mpi4py-trace.json',
+    comm=MPI.COMM_WORLD,
+    *,
+    root=0,
+    file=None,
+):
+    """Gather traced calls, write a trace file, and print a summary.
+
+    The calls of all processes are written by *root* to *filename* in
+    the Chrome trace event format, and a summary table is printed to
+    *file* (default: `sys.stderr`). If MPI is not initialized or
+    already finalized, only the calls of the calling process are
+    reported. This function is collective over *comm*.
+    """
+    if _mpi_active():
+        events = gather(comm, root)
+    else:
+        disable()
+        events = get_events()
+    if events is None:
+        return
+    if filename is not None:
+        with open(filename, 'w', encoding='utf-8') as fh:
+            _json.dump(chrome_trace(events), fh)
+    if file is None:
+        file = _sys.stderr
+    print(summary(events), file=file, flush=True)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from .. import MPI
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO
+from typing import Union
+from os import PathLike
+
+class Event(NamedTuple):
+    rank: int
+    kind: str
+    name: str
+    label: str
+    peer: Optional[int]
+    nbytes: int
+    start: float
+    stop: float
+    pickle: float
+
+def enable(size: int = 65536) -> None: ...
+def disable() -> None: ...
+def get_events() -> List[Event]: ...
+def gather(
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    root: int = 0,
+) -> Optional[List[Event]]: ...
+def summary(events: List[Event]) -> str: ...
+def chrome_trace(events: List[Event]) -> Dict[str, Any]: ...
+def report(
+    filename: Optional[Union[PathLike, str, bytes]] = 'mpi4py-trace.json',
+    comm: MPI.Intracomm = MPI.COMM_WORLD,
+    *,
+    root: int = 0,
+    file: Optional[TextIO] = None,
+) -> None: ...
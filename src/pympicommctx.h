@@ -19,6 +19,8 @@
 typedef struct {
   MPI_Comm dupcomm;
   MPI_Comm localcomm;
+  MPI_Comm nbccomm;
+  MPI_Request nbcreq;
   int      tag;
   int      low_group;
 } PyMPI_Commctx;
@@ -38,6 +40,8 @@ static int PyMPI_Commctx_new(PyMPI_Commctx **_commctx)
   if (commctx) {
     commctx->dupcomm = MPI_COMM_NULL;
     commctx->localcomm = MPI_COMM_NULL;
+    commctx->nbccomm = MPI_COMM_NULL;
+    commctx->nbcreq = MPI_REQUEST_NULL;
     commctx->tag = 0;
     commctx->low_group = -1;
   }
@@ -53,6 +57,10 @@ static int MPIAPI PyMPI_Commctx_free_fn(MPI_Comm comm, int k, void *v, void *xs)
   if (!commctx) return MPI_SUCCESS;
   ierr = MPI_Finalized(&finalized); CHKERR(ierr);
   if (finalized) goto fn_exit;
+  if (commctx->nbcreq != MPI_REQUEST_NULL)
+    {ierr = MPI_Wait(&commctx->nbcreq, MPI_STATUS_IGNORE); CHKERR(ierr);}
+  if (commctx->nbccomm != MPI_COMM_NULL)
+    {ierr = MPI_Comm_free(&commctx->nbccomm); CHKERR(ierr);}
   if (commctx->localcomm != MPI_COMM_NULL)
     {ierr = MPI_Comm_free(&commctx->localcomm); CHKERR(ierr);}
   if (commctx->dupcomm != MPI_COMM_NULL)
@@ -86,7 +94,6 @@ static int PyMPI_Commctx_lookup(MPI_Comm comm, PyMPI_Commctx **_commctx)
   ierr = PyMPI_Commctx_new(&commctx); CHKERR(ierr);
   if (!commctx) {(void)MPI_Comm_call_errhandler(comm, MPI_ERR_INTERN); return MPI_ERR_INTERN;}
   ierr = MPI_Comm_set_attr(comm, keyval, commctx); CHKERR(ierr);
-  ierr = MPI_Comm_dup(comm, &commctx->dupcomm); CHKERR(ierr);
 
  fn_exit:
   if (commctx->tag >= PyMPI_Commctx_TAG_UB) commctx->tag = 0;
@@ -110,6 +117,8 @@ static int PyMPI_Commctx_intra(MPI_Comm comm, MPI_Comm *dupcomm, int *tag)
   int ierr;
   PyMPI_Commctx *commctx = NULL;
   ierr = PyMPI_Commctx_lookup(comm, &commctx);CHKERR(ierr);
+  if (commctx->dupcomm == MPI_COMM_NULL)
+    {ierr = MPI_Comm_dup(comm, &commctx->dupcomm); CHKERR(ierr);}
   if (dupcomm)
     *dupcomm = commctx->dupcomm;
   if (tag)
@@ -123,6 +132,8 @@ static int PyMPI_Commctx_inter(MPI_Comm comm, MPI_Comm *dupcomm, int *tag,
   int ierr;
   PyMPI_Commctx *commctx = NULL;
   ierr = PyMPI_Commctx_lookup(comm, &commctx);CHKERR(ierr);
+  if (commctx->dupcomm == MPI_COMM_NULL)
+    {ierr = MPI_Comm_dup(comm, &commctx->dupcomm); CHKERR(ierr);}
   if (commctx->localcomm == MPI_COMM_NULL) {
     int localsize, remotesize, mergerank;
     MPI_Comm mergecomm = MPI_COMM_NULL;
@@ -156,6 +167,34 @@ static int PyMPI_Commctx_inter(MPI_Comm comm, MPI_Comm *dupcomm, int *tag,
   return MPI_SUCCESS;
 }
 
+static int PyMPI_Commctx_nbc(MPI_Comm comm, MPI_Comm *nbccomm)
+{
+  int ierr;
+  PyMPI_Commctx *commctx = NULL;
+  ierr = PyMPI_Commctx_lookup(comm, &commctx);CHKERR(ierr);
+  if (commctx->nbccomm == MPI_COMM_NULL)
+    {ierr = MPI_Comm_idup(comm, &commctx->nbccomm,
+                          &commctx->nbcreq); CHKERR(ierr);}
+  if (nbccomm)
+    *nbccomm = commctx->nbccomm;
+  return MPI_SUCCESS;
+}
+
+static int PyMPI_Commctx_nbc_ready(MPI_Comm comm, int blocking, int *flag)
+{
+  int ierr;
+  PyMPI_Commctx *commctx = NULL;
+  ierr = PyMPI_Commctx_lookup(comm, &commctx);CHKERR(ierr);
+  if (commctx->nbcreq != MPI_REQUEST_NULL) {
+    if (blocking)
+      {ierr = MPI_Wait(&commctx->nbcreq, MPI_STATUS_IGNORE); CHKERR(ierr);}
+    else
+      {ierr = MPI_Test(&commctx->nbcreq, flag, MPI_STATUS_IGNORE); CHKERR(ierr);}
+  }
+  *flag = (commctx->nbcreq == MPI_REQUEST_NULL);
+  return MPI_SUCCESS;
+}
+
 static int PyMPI_Commctx_finalize(void)
 {
   int ierr;
@@ -28,12 +28,21 @@ $MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 1
 $MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 128 -o
 $MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 128 -p --protocol 4
 $MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 128 -o --threshold 32
+$MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 128 -z zlib --compress-threshold 32
+$MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench pingpong -q -l 1 -s 1 -n 128 -o -z lzma --threshold 32
+$MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench reduce -n 64 > /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench reduce -n 64 --no-header > /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench reduce -n 64 --no-stats  > /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench reduce -q -l 1 -s 1 -n 128
+$MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench reduce -q -l 1 -s 1 -n 128 -a array
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -l 1             > /dev/null
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 --no-header > /dev/null
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 --no-stats  > /dev/null
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 -a numpy -e mpi     -q
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 -a bytes -e process -q
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 -a array -e thread  -q
+$MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 -p 4 -e mpi -q
+$MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench futures -w 1 -t 1 -n 8 -P wait --latency > /dev/null
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench              > /dev/null 2>&1 || true
 $MPIEXEC -n 2 $PYTHON -m coverage run -m mpi4py.bench              > /dev/null 2>&1 || true
 $MPIEXEC -n 1 $PYTHON -m coverage run -m mpi4py.bench qwerty       > /dev/null 2>&1 || true
@@ -63,6 +72,18 @@ $MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_pkl5.py  -q 2> /dev/null
 $MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_pkl5.py  -q 2> /dev/null
 $MPIEXEC -n 3 $PYTHON -m coverage run test/test_util_pkl5.py  -q 2> /dev/null
 $MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_dtlib.py -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_shmem.py -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_shmem.py -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_sync.py  -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_sync.py  -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_npyio.py -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_npyio.py -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_checkpoint.py -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_checkpoint.py -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_trace.py -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_trace.py -q 2> /dev/null
+$MPIEXEC -n 1 $PYTHON -m coverage run test/test_util_importcache.py -q 2> /dev/null
+$MPIEXEC -n 2 $PYTHON -m coverage run test/test_util_importcache.py -q 2> /dev/null
 $PYTHON -m coverage run demo/test-run/test_run.py             -q 2> /dev/null
 
 $MPIEXEC -n 1 $PYTHON -m coverage run demo/futures/test_futures.py -q 2> /dev/null
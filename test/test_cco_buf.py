@@ -1,6 +1,7 @@
 from mpi4py import MPI
 import mpiunittest as unittest
 import arrayimpl
+import array
 
 from functools import reduce
 prod = lambda sequence,start=1: reduce(lambda x, y: x*y, sequence, start)
@@ -288,6 +289,138 @@ class BaseTestCCOBuf(object):
                         elif op == MPI.MIN:
                             self.assertEqual(value, i)
 
+    def testAllgathervAlloc(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for typecode, datatype in arrayimpl.TypeMap.items():
+            if typecode not in 'bhilqfd': continue
+            sbuf = array.array(typecode, [rank] * (rank + 1))
+            for args in ((sbuf,), ((sbuf, datatype), datatype)):
+                rbuf, counts, displs = self.COMM.Allgatherv_alloc(*args)
+                self.assertEqual(counts, [i + 1 for i in range(size)])
+                self.assertEqual(displs, [i*(i+1)//2 for i in range(size)])
+                rbuf = array.array(typecode, bytes(rbuf))
+                for i in range(size):
+                    block = rbuf[displs[i]:displs[i]+counts[i]]
+                    self.assertEqual(block.tolist(), [i] * (i + 1))
+        sbuf = array.array('i', [rank] * rank)
+        rbuf, counts, displs = self.COMM.Allgatherv_alloc(sbuf, MPI.BYTE)
+        self.assertEqual(len(rbuf), sum(counts))
+        self.assertEqual(counts, [4 * i for i in range(size)])
+        with self.assertRaises(ValueError):
+            self.COMM.Allgatherv_alloc([bytearray(2), MPI.BYTE], MPI.INT)
+        rtype = MPI.INT.Create_resized(0, 2 * MPI.INT.extent).Commit()
+        try:
+            sbuf = array.array('i', [rank] * (rank + 1))
+            rbuf, counts, displs = self.COMM.Allgatherv_alloc(sbuf, rtype)
+        finally:
+            rtype.Free()
+        total = sum(counts)
+        rbuf = array.array('i', bytes(rbuf))
+        self.assertEqual(len(rbuf), 2 * total - 1)
+        self.assertEqual(
+            rbuf[::2].tolist(), [i for i in range(size) for _ in range(i + 1)])
+
+    def testAlltoallvAlloc(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for typecode, datatype in arrayimpl.TypeMap.items():
+            if typecode not in 'bhilqfd': continue
+            scounts = [i + rank for i in range(size)]
+            sbuf = array.array(typecode)
+            for i in range(size):
+                sbuf.extend([10 * rank + i] * scounts[i])
+            for args in (
+                ((sbuf, scounts),),
+                ((sbuf, scounts, datatype), datatype),
+                ([array.array(typecode, [10 * rank + i] * scounts[i])
+                  for i in range(size)],),
+            ):
+                rbuf, counts, displs = self.COMM.Alltoallv_alloc(*args)
+                self.assertEqual(counts, [i + rank for i in range(size)])
+                self.assertEqual(displs, [sum(counts[:i]) for i in range(size)])
+                rbuf = array.array(typecode, bytes(rbuf))
+                self.assertEqual(len(rbuf), sum(counts))
+                for i in range(size):
+                    block = rbuf[displs[i]:displs[i]+counts[i]]
+                    self.assertEqual(block.tolist(), [10 * i + rank] * counts[i])
+        vectype = MPI.INT.Create_vector(2, 1, 2).Commit()
+        try:
+            sbuf = array.array('i', [rank, -1] * 2)
+            sendbufs = [(sbuf, 1, vectype)] * size
+            with self.assertRaises(ValueError):
+                self.COMM.Alltoallv_alloc(sendbufs)
+            request = MPI.COMM_SELF.Irecv(
+                bytearray(64), MPI.ANY_SOURCE, MPI.ANY_TAG)
+            rbuf, counts, displs = self.COMM.Alltoallv_alloc(sendbufs, MPI.INT)
+            request.Cancel()
+            status = MPI.Status()
+            request.Wait(status)
+            self.assertTrue(status.Is_cancelled())
+        finally:
+            vectype.Free()
+        self.assertEqual(counts, [2] * size)
+        rbuf = array.array('i', bytes(rbuf))
+        self.assertEqual(rbuf.tolist(), [i for i in range(size) for _ in 'ab'])
+        with self.assertRaises(ValueError):
+            self.COMM.Alltoallv_alloc([bytearray(1)] * (size + 1))
+        sendbufs = [array.array('i', [rank])] * size
+        sendbufs[-1] = array.array('d', [rank])
+        if size > 1:
+            with self.assertRaises(ValueError):
+                self.COMM.Alltoallv_alloc(sendbufs)
+
+    def testSparseExchange(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        result = self.COMM.Sparse_exchange({})
+        self.assertEqual(result, {})
+        result = self.COMM.Sparse_exchange({MPI.PROC_NULL: b''})
+        self.assertEqual(result, {})
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        for typecode, datatype in arrayimpl.TypeMap.items():
+            if typecode not in 'bhilqfd': continue
+            for count in range(3):
+                sbuf = array.array(typecode, [rank] * (count + rank))
+                result = self.COMM.Sparse_exchange({dest: sbuf}, datatype)
+                self.assertEqual(list(result), [source])
+                rbuf = array.array(typecode, bytes(result[source]))
+                self.assertEqual(rbuf.tolist(), [source] * (count + source))
+            sendbufs = {
+                i: (array.array(typecode, [i] * (i + 1)), datatype)
+                for i in range(size)
+            }
+            result = self.COMM.Sparse_exchange(sendbufs, datatype)
+            self.assertEqual(sorted(result), list(range(size)))
+            for i in range(size):
+                rbuf = array.array(typecode, bytes(result[i]))
+                self.assertEqual(rbuf.tolist(), [rank] * (rank + 1))
+        rtype = MPI.INT.Create_resized(0, 2 * MPI.INT.extent).Commit()
+        try:
+            sbuf = array.array('i', range(rank + 3))
+            result = self.COMM.Sparse_exchange({dest: sbuf}, rtype)
+            rbuf = array.array('i', bytes(result[source]))
+            self.assertEqual(len(rbuf), 2 * (source + 3) - 1)
+            self.assertEqual(rbuf[::2].tolist(), list(range(source + 3)))
+        finally:
+            rtype.Free()
+        sendbufs = {dest: bytearray(3 if dest == 0 else 4)}
+        if rank == 0:
+            with self.assertRaises(ValueError):
+                self.COMM.Sparse_exchange(sendbufs, MPI.INT)
+        else:
+            result = self.COMM.Sparse_exchange(sendbufs, MPI.INT)
+            self.assertEqual(list(result), [source])
+        sendbufs = {i: [bytearray(4), MPI.BYTE] for i in range(size)}
+        if rank == 0:
+            sendbufs[size - 1] = object()
+            with self.assertRaises(TypeError):
+                self.COMM.Sparse_exchange(sendbufs, MPI.INT)
+        else:
+            result = self.COMM.Sparse_exchange(sendbufs, MPI.INT)
+            self.assertEqual(sorted(result), list(range(1, size)))
+
     def testBcastTypeIndexed(self):
         size = self.COMM.Get_size()
         rank = self.COMM.Get_rank()
@@ -5,6 +5,11 @@ from functools import reduce
 cumsum  = lambda seq: reduce(lambda x, y: x+y, seq, 0)
 cumprod = lambda seq: reduce(lambda x, y: x*y, seq, 1)
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 _basic = [
     None,
     True, False,
@@ -21,6 +26,13 @@ messages += [
     dict((f'k{k}', v) for k, v in enumerate(_basic)),
 ]
 
+def _raise_unpickle():
+    raise ValueError("cannot unpickle")
+
+class BadUnpickle(object):
+    def __reduce__(self):
+        return (_raise_unpickle, ())
+
 class BaseTestCCOObj(object):
 
     COMM = MPI.COMM_NULL
@@ -198,6 +210,382 @@ class BaseTestCCOObj(object):
             else:
                 self.assertEqual(rscan, 0)
 
+    def testSparseExchange(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        # --
+        result = self.COMM.sparse_exchange({})
+        self.assertEqual(result, {})
+        result = self.COMM.sparse_exchange({MPI.PROC_NULL: None})
+        self.assertEqual(result, {})
+        # --
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        for smess in messages:
+            result = self.COMM.sparse_exchange({dest: (rank, smess)})
+            self.assertEqual(result, {source: (source, smess)})
+        # --
+        sendobj = {i: [rank, i] for i in range(rank % 2, size, 2)}
+        result = self.COMM.sparse_exchange(sendobj)
+        if rank % 2:
+            expected = {i: [i, rank] for i in range(1, size, 2)}
+        else:
+            expected = {i: [i, rank] for i in range(0, size, 2)}
+        self.assertEqual(result, expected)
+        # --
+        sendobj = {i: i*rank for i in range(size)}
+        for _ in range(3):
+            result = self.COMM.sparse_exchange(sendobj)
+            self.assertEqual(result, {i: i*rank for i in range(size)})
+        # --
+        sendobj = {i: rank for i in range(size)}
+        if rank == 0:
+            sendobj[size-1] = lambda: None
+        if rank == 0:
+            with self.assertRaises(Exception):
+                self.COMM.sparse_exchange(sendobj)
+        else:
+            result = self.COMM.sparse_exchange(sendobj)
+            self.assertEqual(result, {i: i for i in range(1, size)})
+        sendobj = {i: rank for i in range(size)}
+        if rank == 0:
+            sendobj = {size: rank, **sendobj}
+        if rank == 0:
+            with self.assertRaises(MPI.Exception):
+                self.COMM.sparse_exchange(sendobj)
+        else:
+            result = self.COMM.sparse_exchange(sendobj)
+            self.assertEqual(result, {i: i for i in range(1, size)})
+        sendobj = {i: rank for i in range(size)}
+        sendobj[0] = BadUnpickle()
+        if rank == 0:
+            with self.assertRaises(ValueError):
+                self.COMM.sparse_exchange(sendobj)
+        else:
+            result = self.COMM.sparse_exchange(sendobj)
+            self.assertEqual(result, {i: i for i in range(size)})
+        sendobj = {i: rank for i in range(size)}
+        result = self.COMM.sparse_exchange(sendobj)
+        self.assertEqual(result, {i: i for i in range(size)})
+
+    def testReduceScalar(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for values in (
+            [r for r in range(size)],
+            [1.5 * r for r in range(size)],
+            [complex(r, -r) for r in range(size)],
+        ):
+            value = values[rank]
+            for op in (MPI.SUM, MPI.PROD, MPI.MAX, MPI.MIN):
+                if type(value) is complex and op in (MPI.MAX, MPI.MIN):
+                    continue
+                expected = reduce(op, values)
+                result = self.COMM.allreduce(value, op=op)
+                self.assertIs(type(result), type(value))
+                self.assertEqual(result, expected)
+                result = self.COMM.reduce(value, op=op, root=size-1)
+                if rank == size-1:
+                    self.assertEqual(result, expected)
+                else:
+                    self.assertIsNone(result)
+                result = self.COMM.scan(value, op=op)
+                self.assertEqual(result, reduce(op, values[:rank+1]))
+                result = self.COMM.exscan(value, op=op)
+                if rank == 0:
+                    self.assertIsNone(result)
+                else:
+                    self.assertEqual(result, reduce(op, values[:rank]))
+        for op in (MPI.BAND, MPI.BOR, MPI.BXOR):
+            result = self.COMM.allreduce(rank, op=op)
+            self.assertEqual(result, reduce(op, range(size)))
+        # integers not representable in 64 bits
+        for value in (2**61, 2**62, -2**63, 2**100):
+            result = self.COMM.allreduce(value + rank, op=MPI.SUM)
+            self.assertEqual(result, value * size + cumsum(range(size)))
+            result = self.COMM.allreduce(value, op=MPI.PROD)
+            self.assertEqual(result, value ** size)
+            result = self.COMM.allreduce(value + rank, op=MPI.MAX)
+            self.assertEqual(result, value + size - 1)
+        # mixed operand types
+        value = rank if rank % 2 else float(rank)
+        result = self.COMM.allreduce(value, op=MPI.SUM)
+        self.assertEqual(result, cumsum(range(size)))
+        value = True if rank == 0 else rank
+        result = self.COMM.allreduce(value, op=MPI.SUM)
+        self.assertEqual(result, 1 + cumsum(range(1, size)))
+
+    @unittest.skipIf(numpy is None, 'numpy')
+    def testReduceArray(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        ops = [
+            (MPI.SUM,  numpy.add),
+            (MPI.PROD, numpy.multiply),
+            (MPI.MAX,  numpy.maximum),
+            (MPI.MIN,  numpy.minimum),
+            (MPI.BAND, numpy.bitwise_and),
+            (MPI.BOR,  numpy.bitwise_or),
+            (MPI.BXOR, numpy.bitwise_xor),
+        ]
+        for typecode in 'bhilqBHILQfdgFD':
+            kind = numpy.dtype(typecode).kind
+            for op, func in ops:
+                if kind == 'f' and op in (MPI.BAND, MPI.BOR, MPI.BXOR):
+                    continue
+                if kind == 'c' and op not in (MPI.SUM, MPI.PROD):
+                    continue
+                for shape in ((), (5,), (2, 3)):
+                    base = numpy.arange(numpy.prod(shape, dtype=int))
+                    base = (base % 3 + 1).reshape(shape)
+                    arrays = [numpy.array(base + r, dtype=typecode)
+                              for r in range(size)]
+                    sendobj = arrays[rank].copy()
+                    expected = reduce(func, arrays)
+                    result = self.COMM.allreduce(sendobj, op=op)
+                    self.assertIs(type(result), type(expected))
+                    self.assertEqual(result.dtype, sendobj.dtype)
+                    self.assertEqual(result.shape, shape)
+                    self.assertTrue(numpy.all(result == expected))
+                    self.assertTrue(numpy.all(sendobj == arrays[rank]))
+                    for root in range(size):
+                        result = self.COMM.reduce(sendobj, op=op, root=root)
+                        if rank == root:
+                            self.assertTrue(numpy.all(result == expected))
+                        else:
+                            self.assertIsNone(result)
+                    result = self.COMM.scan(sendobj, op=op)
+                    expected = reduce(func, arrays[:rank+1])
+                    self.assertIs(type(result), type(expected))
+                    self.assertTrue(numpy.all(result == expected))
+                    result = self.COMM.exscan(sendobj, op=op)
+                    if rank == 0:
+                        self.assertIsNone(result)
+                    else:
+                        expected = reduce(func, arrays[:rank])
+                        self.assertIs(type(result), type(expected))
+                        self.assertTrue(numpy.all(result == expected))
+        # non-contiguous and non-native byte order operands
+        sendobj = numpy.arange(10, dtype='>i4')[::2] + rank
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        expected = numpy.arange(10)[::2] * size + cumsum(range(size))
+        self.assertTrue(numpy.all(result == expected))
+        # operands with mismatched shapes fall back to pickle
+        sendobj = numpy.ones(1 if rank == 0 else 3)
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertTrue(numpy.all(result == size))
+        # NumPy scalars and other numbers take part in the check
+        sendobj = numpy.float64(rank) if rank % 2 else float(rank)
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertEqual(result, cumsum(range(size)))
+        # operands of mixed kinds fall back together
+        for other in ([1, 1, 1], numpy.ma.ones(3)):
+            sendobj = other if rank == 0 else numpy.ones(3)
+            result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+            self.assertTrue(numpy.all(numpy.asarray(result) == size))
+            result = self.COMM.reduce(sendobj, op=MPI.SUM, root=size-1)
+            if rank == size-1:
+                self.assertTrue(numpy.all(numpy.asarray(result) == size))
+            else:
+                self.assertIsNone(result)
+
+    def testIbcast(self):
+        for smess in messages:
+            for root in range(self.COMM.Get_size()):
+                request = self.COMM.ibcast(smess, root=root)
+                rmess = request.wait()
+                self.assertEqual(smess, rmess)
+
+    def testIgather(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in messages + [messages]:
+            for root in range(size):
+                request = self.COMM.igather(smess, root=root)
+                rmess = request.wait()
+                if rank == root:
+                    self.assertEqual(rmess, [smess] * size)
+                else:
+                    self.assertIsNone(rmess)
+
+    def testIscatter(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in messages + [messages]:
+            for root in range(size):
+                if rank == root:
+                    sobj = [(smess, i) for i in range(size)]
+                else:
+                    sobj = None
+                request = self.COMM.iscatter(sobj, root=root)
+                rmess = request.wait()
+                self.assertEqual(rmess, (smess, rank))
+
+    def testIallgather(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in messages + [messages]:
+            request = self.COMM.iallgather((smess, rank))
+            rmess = request.wait()
+            self.assertEqual(rmess, [(smess, i) for i in range(size)])
+
+    def testIalltoall(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in messages + [messages]:
+            sobj = [(smess, rank, i) for i in range(size)]
+            request = self.COMM.ialltoall(sobj)
+            rmess = request.wait()
+            self.assertEqual(rmess, [(smess, i, rank) for i in range(size)])
+
+    def testIallreduce(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for op in (MPI.SUM, MPI.PROD, MPI.MAX, MPI.MIN):
+            request = self.COMM.iallreduce(rank, op)
+            value = request.wait()
+            if op == MPI.SUM:
+                self.assertEqual(value, cumsum(range(size)))
+            elif op == MPI.PROD:
+                self.assertEqual(value, cumprod(range(size)))
+            elif op == MPI.MAX:
+                self.assertEqual(value, size-1)
+            elif op == MPI.MIN:
+                self.assertEqual(value, 0)
+        value = self.COMM.iallreduce(rank, lambda x, y: x+y).wait()
+        self.assertEqual(value, cumsum(range(size)))
+        value = self.COMM.iallreduce((rank, rank), MPI.MAXLOC).wait()
+        self.assertEqual(value, (size-1, size-1))
+
+    def testICollMany(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        requests = [
+            self.COMM.ibcast(messages, root=0),
+            self.COMM.igather(rank, root=size-1),
+            self.COMM.iscatter(list(range(size)), root=0),
+            self.COMM.iallgather(rank),
+            self.COMM.ialltoall([rank] * size),
+            self.COMM.iallreduce(rank, MPI.SUM),
+        ]
+        expected = [
+            messages,
+            list(range(size)) if rank == size-1 else None,
+            rank,
+            list(range(size)),
+            list(range(size)),
+            cumsum(range(size)),
+        ]
+        # complete in reverse order
+        for request, result in reversed(list(zip(requests, expected))):
+            self.assertEqual(request.wait(), result)
+        # complete with waitall/testall
+        for blocking in (True, False):
+            requests = [self.COMM.iallgather(rank) for _ in range(3)]
+            if blocking:
+                results = MPI.Request.waitall(requests)
+            else:
+                flag, results = MPI.Request.testall(requests)
+                while not flag:
+                    flag, results = MPI.Request.testall(requests)
+            self.assertEqual(results, [list(range(size))] * 3)
+        # complete with test
+        request = self.COMM.iallreduce(rank, MPI.MAX)
+        flag, value = request.test()
+        while not flag:
+            flag, value = request.test()
+        self.assertEqual(value, size-1)
+        # complete with waitany/testany
+        for blocking in (True, False):
+            requests = [self.COMM.iallgather(rank) for _ in range(3)]
+            results = [None] * len(requests)
+            while any(r for r in requests):
+                if blocking:
+                    index, value = MPI.Request.waitany(requests)
+                    flag = True
+                else:
+                    index, flag, value = MPI.Request.testany(requests)
+                if flag and index != MPI.UNDEFINED:
+                    results[index] = value
+            self.assertEqual(results, [list(range(size))] * 3)
+        # complete with waitsome/testsome
+        for blocking in (True, False):
+            requests = [self.COMM.iallgather(rank) for _ in range(3)]
+            results = [None] * len(requests)
+            while any(r for r in requests):
+                if blocking:
+                    indices, values = MPI.Request.waitsome(requests)
+                else:
+                    indices, values = MPI.Request.testsome(requests)
+                for index, value in zip(indices or [], values or []):
+                    results[index] = value
+            self.assertEqual(results, [list(range(size))] * 3)
+        # complete with uppercase methods
+        requests = [self.COMM.ibcast(messages, root=0) for _ in range(3)]
+        MPI.Request.Waitall(requests)
+        self.assertFalse(any(requests))
+        request = self.COMM.iallgather(rank)
+        request.Wait()
+        self.assertFalse(request)
+        request = self.COMM.iallgather(rank)
+        while not request.Get_status(): pass
+        while not request.Test(): pass
+        self.assertFalse(request)
+        requests = [self.COMM.iallgather(rank) for _ in range(3)]
+        while not MPI.Request.Testall(requests): pass
+        self.assertFalse(any(requests))
+        for complete in (
+            MPI.Request.Waitany,
+            MPI.Request.Testany,
+            MPI.Request.Waitsome,
+            MPI.Request.Testsome,
+        ):
+            requests = [self.COMM.iallgather(rank) for _ in range(3)]
+            while any(requests):
+                complete(requests)
+        self.assertEqual(self.COMM.allgather(rank), list(range(size)))
+
+    def testICollNonBlockingSetup(self):
+        comm = self.COMM.Dup()
+        try:
+            size = comm.Get_size()
+            rank = comm.Get_rank()
+            # the first nonblocking collective must not synchronize
+            if rank == 0:
+                request = comm.ibcast(messages, root=0)
+                for source in range(1, size):
+                    self.assertEqual(comm.recv(source=source), source)
+            else:
+                comm.ssend(rank, dest=0)
+                request = comm.ibcast(None, root=0)
+            self.assertEqual(request.wait(), messages)
+            # freed requests are dropped from the queue
+            request = MPI.COMM_SELF.ibcast(rank)
+            request.Free()
+            request = MPI.COMM_SELF.ibcast(rank + 1)
+            self.assertEqual(request.wait(), rank + 1)
+        finally:
+            comm.Free()
+
+    def testICollThreads(self):
+        if MPI.Query_thread() < MPI.THREAD_MULTIPLE:
+            self.skipTest('mpi-thread-multiple')
+        import threading
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        requests = [self.COMM.iallgather(rank + i) for i in range(8)]
+        results = [None] * len(requests)
+        def target(i):
+            results[i] = requests[i].wait()
+        threads = [
+            threading.Thread(target=target, args=(i,))
+            for i in range(len(requests))
+        ]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        for i, result in enumerate(results):
+            self.assertEqual(result, [r + i for r in range(size)])
+
 
 class TestCCOObjSelf(BaseTestCCOObj, unittest.TestCase):
     COMM = MPI.COMM_SELF
@@ -172,6 +172,90 @@ class BaseTestCCOObjInter(object):
             elif op == MPI.MIN:
                 self.assertEqual(value, 0)
 
+    @unittest.skipMPI('openmpi')  # rooted NBC with MPI.PROC_NULL
+    def testIbcast(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in messages + [messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.ibcast(smess, root=MPI.ROOT)
+                        else:
+                            request = self.INTERCOMM.ibcast(None, root=MPI.PROC_NULL)
+                        self.assertIsNone(request.wait())
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.ibcast(None, root=root)
+                        self.assertEqual(request.wait(), smess)
+
+    @unittest.skipMPI('openmpi')  # rooted NBC with MPI.PROC_NULL
+    def testIgather(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in messages + [messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.igather(smess, root=MPI.ROOT)
+                            rmess = request.wait()
+                            self.assertEqual(rmess, [smess] * rsize)
+                        else:
+                            request = self.INTERCOMM.igather(None, root=MPI.PROC_NULL)
+                            self.assertIsNone(request.wait())
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.igather(smess, root=root)
+                        self.assertIsNone(request.wait())
+
+    @unittest.skipMPI('msmpi(<8.0.0)')
+    @unittest.skipMPI('openmpi')  # rooted NBC with MPI.PROC_NULL
+    def testIscatter(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in messages + [messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.iscatter([smess] * rsize, root=MPI.ROOT)
+                        else:
+                            request = self.INTERCOMM.iscatter(None, root=MPI.PROC_NULL)
+                        self.assertIsNone(request.wait())
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.iscatter(None, root=root)
+                        self.assertEqual(request.wait(), smess)
+
+    def testIallgather(self):
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in messages + [messages]:
+            request = self.INTERCOMM.iallgather(smess)
+            self.assertEqual(request.wait(), [smess] * rsize)
+
+    def testIalltoall(self):
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in messages + [messages]:
+            request = self.INTERCOMM.ialltoall([smess] * rsize)
+            self.assertEqual(request.wait(), [smess] * rsize)
+
+    def testIallreduce(self):
+        rank = self.INTERCOMM.Get_rank()
+        rsize = self.INTERCOMM.Get_remote_size()
+        requests = [
+            self.INTERCOMM.iallreduce(rank, op)
+            for op in (MPI.SUM, MPI.MAX, MPI.MIN, MPI.PROD)
+        ]
+        values = MPI.Request.waitall(requests)
+        self.assertEqual(values, [
+            cumsum(range(rsize)), rsize-1, 0, cumprod(range(rsize)),
+        ])
+
 
 class TestCCOObjInter(BaseTestCCOObjInter, unittest.TestCase):
     BASECOMM = MPI.COMM_WORLD
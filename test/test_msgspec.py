@@ -223,6 +223,83 @@ class TestMessageBlock(unittest.TestCase):
         MPI.Free_mem(buf)
 
 
+class TestMessageBufferSpec(unittest.TestCase):
+
+    def testAttributes(self):
+        spec = MPI.BufferSpec.__new__(MPI.BufferSpec)
+        self.assertIsNone(spec.buf)
+        self.assertEqual(spec.count, 0)
+        self.assertIsNone(spec.datatype)
+        self.assertTrue(spec.readonly)
+        buf = bytearray(8)
+        spec = MPI.BufferSpec([buf, MPI.INT])
+        self.assertEqual(len(spec.buf), 8)
+        self.assertEqual(spec.count, 2)
+        self.assertEqual(spec.datatype, MPI.INT)
+        self.assertFalse(spec.readonly)
+        spec = MPI.BufferSpec([buf, 1, "i"])
+        self.assertEqual(spec.count, 1)
+        spec = MPI.BufferSpec([buf, (1, 1), "i"])
+        self.assertEqual(spec.count, 1)
+        spec = MPI.BufferSpec(b"abc", readonly=True)
+        self.assertEqual(spec.count, 3)
+        self.assertEqual(spec.datatype.Get_size(), 1)
+        self.assertTrue(spec.readonly)
+        spec = MPI.BufferSpec([MPI.BOTTOM, 0, MPI.INT])
+        self.assertEqual(spec.count, 0)
+        spec = MPI.BufferSpec(spec)
+        self.assertEqual(spec.datatype, MPI.INT)
+
+    def testMessageBad(self):
+        self.assertRaises(ValueError, Sendrecv,
+                          MPI.BufferSpec.__new__(MPI.BufferSpec),
+                          [None, 0, "B"])
+        self.assertRaises((BufferError, TypeError, ValueError),
+                          MPI.BufferSpec, b"abc")
+        self.assertRaises(ValueError,
+                          MPI.BufferSpec, [bytearray(8), -1, "i"])
+        sbuf = MPI.BufferSpec(b"abc", readonly=True)
+        rbuf = MPI.BufferSpec(bytearray(3), readonly=True)
+        self.assertRaises(BufferError, Sendrecv, sbuf, rbuf)
+
+    def testSendrecv(self):
+        sbuf = bytearray(b"abcd")
+        rbuf = bytearray(4)
+        smsg = MPI.BufferSpec([sbuf, "c"])
+        rmsg = MPI.BufferSpec([rbuf, MPI.CHAR])
+        for i in range(3):
+            sbuf[0] = ord("x") + i
+            Sendrecv(smsg, rmsg)
+            self.assertEqual(sbuf, rbuf)
+        rbuf[:] = b"\0" * 4
+        smsg = MPI.BufferSpec(b"abcd", readonly=True)
+        rmsg = MPI.BufferSpec([rbuf, 2, 1, "c"])
+        Sendrecv([b"ab", "c"], rmsg)
+        self.assertEqual(rbuf, b"\0ab\0")
+
+    def testCollectives(self):
+        comm = MPI.COMM_WORLD
+        size = comm.Get_size()
+        sbuf = bytearray(range(size))
+        rbuf = bytearray(size)
+        smsg = MPI.BufferSpec(sbuf)
+        rmsg = MPI.BufferSpec([rbuf, MPI.BYTE])
+        comm.Alltoall(smsg, rmsg)
+        self.assertEqual(rbuf, bytearray([comm.rank] * size))
+        comm.Allgather([sbuf, 1, MPI.BYTE], rmsg)
+        self.assertEqual(rbuf, bytearray(size))
+        sbuf = bytearray([1])
+        rbuf = bytearray(1)
+        comm.Allreduce(MPI.BufferSpec(sbuf), MPI.BufferSpec(rbuf))
+        self.assertEqual(rbuf[0], size % 256)
+        comm.Bcast(MPI.BufferSpec(rbuf), root=0)
+        self.assertEqual(rbuf[0], size % 256)
+        if size > 1:
+            rbuf = bytearray(size + 1)
+            rmsg = MPI.BufferSpec([rbuf, MPI.BYTE])
+            self.assertRaises(ValueError, comm.Alltoall, rmsg, rmsg)
+
+
 class BaseTestMessageSimpleArray(object):
 
     TYPECODES = "bhil"+"BHIL"+"fd"
@@ -422,13 +499,68 @@ class TestMessageSimpleNumPy(unittest.TestCase,
         )
 
     def testNotContiguous(self):
-        sbuf = numpy.ones([3,2])[:,0]
+        sbuf = numpy.arange(6.0).reshape([3,2])[:,0]
         rbuf = numpy.zeros([3])
+        Sendrecv(sbuf, rbuf)
+        self.assertTrue((sbuf == rbuf).all())
+        sbuf = numpy.arange(6.0)[::-1]
+        rbuf = numpy.zeros([6])
         self.assertRaises(
             (BufferError, ValueError, TypeError),
             Sendrecv, sbuf, rbuf,
         )
 
+    def testStrided(self):
+        array = numpy.arange(4*5*6, dtype='i').reshape([4,5,6])
+        views = [
+            lambda a: a[::2],
+            lambda a: a[:,::2],
+            lambda a: a[:,:,::3],
+            lambda a: a[1::2,1:4,::2],
+            lambda a: a[:,3,1:5],
+            lambda a: a.transpose([1,0,2])[:,1:3],
+            lambda a: a[0:1,::-1][:,::-1],
+        ]
+        for view in views:
+            sbuf = view(array)
+            for rbuf in (
+                numpy.zeros_like(array),
+                numpy.zeros(array.shape, 'i', order='F'),
+            ):
+                rbuf = view(rbuf)
+                Sendrecv(sbuf, rbuf)
+                self.assertTrue((sbuf == rbuf).all())
+                rbuf[...] = 0
+                Sendrecv(sbuf, rbuf.copy())
+                Sendrecv(sbuf.copy(), rbuf)
+                self.assertTrue((sbuf == rbuf).all())
+        sbuf = array[:,2]
+        rbuf = numpy.zeros_like(array)[:,2]
+        Sendrecv([sbuf, 2], [rbuf, 2])
+        self.assertTrue((sbuf[:2] == rbuf[:2]).all())
+        self.assertTrue((rbuf[2:] == 0).all())
+        Sendrecv([sbuf, (1, 2)], [rbuf, (1, 2)])
+        self.assertTrue((sbuf[2:3] == rbuf[2:3]).all())
+        self.assertTrue((rbuf[3:] == 0).all())
+        sbuf = numpy.broadcast_to(array[0], array.shape)
+        self.assertRaises(BufferError, Sendrecv, sbuf, array.copy())
+
+    def testStridedCacheEviction(self):
+        comm = MPI.COMM_SELF
+        array = numpy.arange(400, dtype='i')
+        sbuf, rbuf = array[::2], numpy.zeros_like(array)[::2]
+        sreq = comm.Send_init(sbuf, 0, 0)
+        rreq = comm.Recv_init(rbuf, 0, 0)
+        try:
+            for k in range(3, 3 + 200):
+                Sendrecv(array[::k], numpy.zeros_like(array)[::k])
+            MPI.Prequest.Startall([sreq, rreq])
+            MPI.Prequest.Waitall([sreq, rreq])
+            self.assertTrue((sbuf == rbuf).all())
+        finally:
+            sreq.Free()
+            rreq.Free()
+
 
 @unittest.skipIf(array is None, 'array')
 @unittest.skipIf(dlpack is None, 'dlpack')
@@ -477,10 +609,10 @@ class TestMessageSimpleCuPy(unittest.TestCase,
 
     @unittest.skipIf(cupy_issue_2259, 'cupy-issue-2259')
     def testNotContiguous(self):
-        sbuf = cupy.ones([3,2])[:,0]
+        sbuf = cupy.arange(6.0).reshape([3,2])[:,0]
         rbuf = cupy.zeros([3])
-        self.assertRaises((BufferError, ValueError),
-                          Sendrecv, sbuf, rbuf)
+        Sendrecv(sbuf, rbuf)
+        self.assertTrue((sbuf == rbuf).all())
 
 
 @unittest.skipIf(numba is None, 'numba')
@@ -525,8 +657,9 @@ class TestMessageSimpleNumba(unittest.TestCase,
         sbuf = sbuf.reshape(3,2)[:,0]
         rbuf = numba.cuda.device_array((3,))
         rbuf[:] = 0
-        self.assertRaises((BufferError, ValueError),
-                          Sendrecv, sbuf, rbuf)
+        Sendrecv(sbuf, rbuf)
+        for i in range(3):
+            self.assertEqual(sbuf[i], rbuf[i])
 
 
 # ---
@@ -648,6 +781,21 @@ class TestMessageDLPackCPUBuf(unittest.TestCase):
         #
         del dltensor
 
+    def testStrided(self):
+        smsg = DLPackCPUBuf('i', [1,2,3])
+        rmsg = DLPackCPUBuf('i', [0]*6)
+        dltensor = rmsg.managed.dl_tensor
+        #
+        dltensor.ndim, dltensor.shape, dltensor.strides = \
+            dlpack.make_dl_shape([3], order='C')
+        dltensor.strides[0] = 2
+        Sendrecv(smsg, rmsg)
+        self.assertEqual(list(rmsg._buf), [1,0,2,0,3,0])
+        dltensor.strides[0] = 0
+        self.assertRaises(BufferError, Sendrecv, smsg, rmsg)
+        #
+        del dltensor
+
     def testByteOffset(self):
         buf = DLPackCPUBuf('B', [0,1,2,3])
         dltensor = buf.managed.dl_tensor
@@ -678,10 +826,24 @@ class TestMessageCAIBuf(unittest.TestCase):
         good_strides = strides[:-2] + (0, 7)
         rmsg.__cuda_array_interface__['strides'] = good_strides
         Sendrecv(smsg, rmsg)
-        bad_strides = (7,) + strides[1:]
+        bad_strides = (0,) + strides[1:]
         rmsg.__cuda_array_interface__['strides'] = bad_strides
         self.assertRaises(BufferError, Sendrecv, smsg, rmsg)
 
+    def testStrided(self):
+        smsg = CAIBuf('i', [1,2,3])
+        rmsg = CAIBuf('i', [0]*6)
+        itemsize = rmsg._buf.itemsize
+        cai = rmsg.__cuda_array_interface__
+        cai['shape'] = (3,)
+        cai['strides'] = (2*itemsize,)
+        Sendrecv(smsg, rmsg)
+        self.assertEqual(list(rmsg._buf), [1,0,2,0,3,0])
+        del cai['strides']
+        cai['shape'] = (1, 3)
+        Sendrecv(smsg, rmsg)
+        self.assertEqual(list(rmsg._buf), [1,2,3,0,3,0])
+
     def testAttrNone(self):
         smsg = CAIBuf('B', [1,2,3])
         rmsg = CAIBuf('B', [0,0,0])
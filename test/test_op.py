@@ -83,6 +83,114 @@ class TestOp(unittest.TestCase):
             ops.append(o)
         for o in ops: o.Free() # cleanup
 
+    @unittest.skipIf(array is None, 'array')
+    def testCreateManyShared(self):
+        N = 32 * 32
+        ops = [MPI.Op.Create(mysum, commute=i%2) for i in range(N)]
+        try:
+            for o in ops[::2]: o.Free()
+            ops = ops[1::2]
+            for myop in ops[::N//16]:
+                a = array.array('i', [1]*4)
+                b = array.array('i', [2]*4)
+                myop.Reduce_local(a, b)
+                self.assertEqual(b.tolist(), [3]*4)
+                self.assertEqual(myop(a, b).tolist(), [4]*4)
+        finally:
+            for o in ops: o.Free()
+        # distinct functions use one slot each
+        funcs = [lambda a, b, dt: mysum(a, b, dt) for _ in range(16)]
+        ops = [MPI.Op.Create(f) for f in funcs for _ in range(4)]
+        for o in ops: o.Free()
+
+    @unittest.skipIf(array is None, 'array')
+    def testCreateManyDistinct(self):
+        N = 32 * 3
+        def make(k):
+            def myop(a, b, dt):
+                mysum(a, b, dt)
+                memoryview(b).cast('B').cast('i')[0] += k
+            return myop
+        comm = MPI.COMM_WORLD
+        size = comm.Get_size()
+        for _ in range(2):
+            ops = [MPI.Op.Create(make(k), commute=True) for k in range(N)]
+            try:
+                for k in (0, 31, 32, 33, N-1):
+                    myop = ops[k]
+                    a = array.array('i', [1]*4)
+                    b = array.array('i', [2]*4)
+                    myop.Reduce_local(a, b)
+                    self.assertEqual(b.tolist(), [3+k, 3, 3, 3])
+                    sbuf = array.array('i', [1]*4)
+                    rbuf = array.array('i', [0]*4)
+                    comm.Allreduce(sbuf, rbuf, op=myop)
+                    expected = [size+k*(size-1)] + [size]*3
+                    self.assertEqual(rbuf.tolist(), expected)
+            finally:
+                for o in ops: o.Free()
+
+    @unittest.skipIf(array is None, 'array')
+    def testCreateTyped(self):
+        record = []
+        def myop(a, b, dt):
+            ma, mb = memoryview(a), memoryview(b)
+            record.append((id(a), id(b), id(dt)))
+            record.append((ma.format, ma.itemsize, len(ma), dt))
+            mb[:] = array.array(mb.format, map(sum, zip(ma, mb)))
+        op = MPI.Op.Create(myop, commute=True)
+        try:
+            for typecode, datatype in (
+                ('i', MPI.INT),
+                ('l', MPI.LONG),
+                ('d', MPI.DOUBLE),
+            ):
+                for n in (0, 1, 5):
+                    del record[:]
+                    a = array.array(typecode, range(n))
+                    b = array.array(typecode, [1]*n)
+                    op.Reduce_local([a, datatype], [b, datatype])
+                    self.assertEqual(b.tolist(), [i+1 for i in range(n)])
+                    op.Reduce_local([a, datatype], [b, datatype])
+                    self.assertEqual(b.tolist(), [2*i+1 for i in range(n)])
+                    if n == 0:
+                        continue
+                    fmt, itemsize, length, dt = record[1]
+                    self.assertEqual(fmt, typecode)
+                    self.assertEqual(itemsize, a.itemsize)
+                    self.assertEqual(length, n)
+                    self.assertEqual(dt, MPI.DATATYPE_NULL)
+                    # datatype retained by callback is not reused
+                    self.assertNotEqual(record[0][2], record[2][2])
+            # untyped memory for derived datatypes
+            del record[:]
+            a = array.array('i', [1, 2])
+            b = array.array('i', [3, 4])
+            datatype = MPI.INT.Create_contiguous(2).Commit()
+            try:
+                op.Reduce_local([a, datatype], [b, datatype])
+            finally:
+                datatype.Free()
+            fmt, itemsize, length, _ = record[1]
+            self.assertEqual((fmt, itemsize, length), ('B', 1, 8))
+        finally:
+            op.Free()
+
+    @unittest.skipIf(array is None, 'array')
+    def testCreateReuse(self):
+        record = []
+        def myop(a, b, dt):
+            record.append((id(a), id(b), id(dt)))
+        op = MPI.Op.Create(myop, commute=True)
+        try:
+            a = array.array('i', [1])
+            b = array.array('i', [2])
+            for _ in range(3):
+                op.Reduce_local(a, b)
+            self.assertEqual(len(set(record)), 1)
+        finally:
+            op.Free()
+
     def _test_call(self, op, args, res):
         self.assertEqual(op(*args), res)
         self.assertEqual(MPI.Op(op)(*args), res)
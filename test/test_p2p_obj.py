@@ -612,6 +612,48 @@ class BaseTestP2PObj(object):
         finally:
             comm.Free()
 
+    def testIRecvLarge(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dst = (rank+1)%size
+        src = (rank-1)%size
+        for n in (1<<10, 1<<16, 1<<20, (1<<22)+1):
+            smess = bytes(range(256)) * (n // 256) + b'x'
+            # message already available when irecv() is called
+            sreq = comm.isend(smess, dst, 0)
+            while not comm.iprobe(src, 0): pass
+            rreq = comm.irecv(None, src, 0)
+            rmess = rreq.wait()
+            sreq.wait()
+            self.assertEqual(rmess, smess)
+            # receive size grows up to 4 MiB at most
+            if n > (1<<22): continue
+            # receive posted before send, sized after previous messages
+            comm.barrier()
+            rreq = comm.irecv(None, src, 0)
+            comm.barrier()
+            comm.send(smess, dst, 0)
+            rmess = rreq.wait()
+            self.assertEqual(rmess, smess)
+
+    def testRecvReuse(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dst = (rank+1)%size
+        src = (rank-1)%size
+        for n in (0, 1, 255, 256, 4096, 1<<20) * 3:
+            smess = [n, bytes(n)]
+            sreq = comm.isend(smess, dst, 0)
+            rmess = comm.recv(None, src, 0)
+            sreq.wait()
+            self.assertEqual(rmess, smess)
+            sreq = comm.isend(smess, dst, 0)
+            rreq = comm.irecv(None, src, 0)
+            rmess = MPI.Request.waitall([sreq, rreq])[1]
+            self.assertEqual(rmess, smess)
+
     def testWaitSomeRecv(self):
         comm = self.COMM.Dup()
         rank = comm.Get_rank()
@@ -1,6 +1,7 @@
 from mpi4py import MPI
 import mpiunittest as unittest
 import sys
+import zlib
 
 try:
     import pickle as pyPickle
@@ -45,6 +46,13 @@ OBJS = [
 def tobytes(s):
     return memoryview(s).tobytes()
 
+class Int(int):
+    pass
+
+class ZlibCodec:
+    compress = staticmethod(zlib.compress)
+    decompress = staticmethod(zlib.decompress)
+
 class TestPickle(unittest.TestCase):
 
     def setUp(self):
@@ -144,6 +152,114 @@ class TestPickle(unittest.TestCase):
             self.do_pickle(obj, pickle)
         self.do_pickle(OBJS2, pickle)
 
+    def testFastPath(self):
+        comm = MPI.COMM_SELF
+        items = [
+            None, True, False,
+            0, -1, 2**63-1, -2**63, 2**63, -2**63-1, 2**100,
+            0.0, -0.0, 1e300, float('inf'), float('-inf'),
+            '', 'mpi4py', '\u00e1\u20ac\U0001f600', '\ud800', 'x' * 2048,
+            b'', b'\x00\xff', b'x' * 2048,
+            Int(7), 1+2j,
+        ]
+        objs = list(items)
+        objs += [tuple(items), list(items), (), []]
+        objs += [(1, (2, 3)), [[1], [2]], (1.0,) * 1000]
+        for obj in objs:
+            o = comm.sendrecv(obj, 0, 0, None, 0, 0)
+            self.assertEqual(type(o), type(obj))
+            self.assertEqual(repr(o), repr(obj))
+        nan = comm.sendrecv(float('nan'), 0, 0, None, 0, 0)
+        self.assertNotEqual(nan, nan)
+        data = pyPickle.dumps(None, pyPickle.HIGHEST_PROTOCOL)
+        self.assertEqual(self.pickle.dumps(None), data)
+        msgs = [
+            (b'\xffN', None),
+            (b'\xffi' + (-5).to_bytes(8, 'little', signed=True), -5),
+            (b'\xfft\x02\x00\x00\x00TF', (True, False)),
+            (b'\xffs\x02\x00\x00\x00ok', 'ok'),
+        ]
+        for msg, obj in msgs:
+            comm.Send(msg, 0, 0)
+            self.assertEqual(comm.recv(None, 0, 0), obj)
+        msgs = [
+            b'\xff', b'\xff?', b'\xffNN', b'\xffi\x00',
+            b'\xffs\x05\x00\x00\x00ok', b'\xffl\x09\x00\x00\x00N',
+            b'\xfft\x01\x00\x00\x00t\x00\x00\x00\x00',
+        ]
+        for msg in msgs:
+            comm.Send(msg, 0, 0)
+            self.assertRaises(ValueError, comm.recv, None, 0, 0)
+
+    def testCompress(self):
+        comm = MPI.COMM_SELF
+        pickle = self.pickle
+        self.assertIsNone(pickle.COMPRESS)
+        self.assertEqual(pickle.COMPRESS_THRESHOLD, 64 * 1024)
+        obj = ['mpi4py'] * 1000
+        plain = pickle.dumps(obj)
+        codecs = ['zlib', 'bz2', 'lzma', True, zlib, ZlibCodec()]
+        for codec in codecs:
+            pickle.__init__(compress=codec, compress_threshold=0)
+            data = pickle.dumps(obj)
+            self.assertEqual(data[0], 0xFE)
+            self.assertLess(len(data), len(plain))
+            self.assertEqual(pickle.loads(data), obj)
+            o = comm.sendrecv(obj, 0, 0, None, 0, 0)
+            self.assertEqual(o, obj)
+            unpickle = MPI.Pickle()
+            if isinstance(codec, ZlibCodec):
+                self.assertEqual(data[1], 0)
+                self.assertRaises(ValueError, unpickle.loads, data)
+            else:
+                self.assertEqual(unpickle.loads(data), obj)
+        pickle.__init__(compress='zlib', compress_threshold=0)
+        self.assertEqual(pickle.COMPRESS, 'zlib')
+        self.assertEqual(pickle.COMPRESS_THRESHOLD, 0)
+        data = pickle.dumps(bytes(range(256)))
+        self.assertNotEqual(data[0], 0xFE)
+        pickle.COMPRESS_THRESHOLD = len(plain) + 1
+        self.assertEqual(pickle.dumps(obj), plain)
+        pickle.COMPRESS_THRESHOLD = None
+        self.assertEqual(pickle.COMPRESS_THRESHOLD, 64 * 1024)
+        pickle.COMPRESS = False
+        self.assertIsNone(pickle.COMPRESS)
+        self.assertEqual(pickle.dumps(obj), plain)
+        pickle.COMPRESS = True
+        self.assertEqual(pickle.COMPRESS, 'zlib')
+        with self.assertRaises(ValueError):
+            pickle.COMPRESS = 'qwerty'
+        with self.assertRaises(TypeError):
+            pickle.COMPRESS = object()
+        for msg in [b'\xfe\x00', b'\xfe\x07']:
+            self.assertRaises(ValueError, MPI.pickle.loads, msg)
+
+    @unittest.skipIf(sys.version_info[:2] < (3, 8), 'python')
+    def testCompressOOB(self):
+        pickle = self.pickle
+        pickle.__init__(compress='zlib', compress_threshold=0)
+        pickle.THRESHOLD = 0
+        obj = [bytearray(4096), bytearray(range(256)), b'']
+        obj = [pyPickle.PickleBuffer(buf) for buf in obj]
+        data, bufs = pickle.dumps_oob(obj)
+        self.assertEqual(data[0], 0xFD)
+        self.assertEqual(len(bufs), 3)
+        self.assertLess(len(bufs[0]), 4096)
+        self.assertEqual(len(bufs[1]), 256)
+        for unpickle in (pickle, MPI.Pickle()):
+            result = unpickle.loads_oob(data, bufs)
+            result = [bytes(buf) for buf in result]
+            self.assertEqual(result, [bytes(4096), bytes(range(256)), b''])
+            self.assertRaises(ValueError, unpickle.loads_oob, data, bufs[:1])
+        obj = bytes(range(256))
+        data, bufs = pickle.dumps_oob(obj)
+        self.assertEqual(bufs, [])
+        self.assertEqual(pickle.loads_oob(data, bufs), obj)
+        obj = [bytes(4096)]
+        data, bufs = pickle.dumps_oob(obj)
+        self.assertEqual(data[0], 0xFE)
+        self.assertEqual(pickle.loads_oob(data, bufs), obj)
+
 
 if __name__ == '__main__':
     unittest.main()
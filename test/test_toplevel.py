@@ -17,6 +17,8 @@ class TestRC(unittest.TestCase):
         rc(fast_reduce  = rc.fast_reduce)
         rc(recv_mprobe  = rc.recv_mprobe)
         rc(errors       = rc.errors)
+        rc(trace        = rc.trace)
+        rc(import_cache = rc.import_cache)
         return rc
 
     def testCallKwArgs(self):
@@ -0,0 +1,163 @@
+from mpi4py import MPI
+from mpi4py.util import checkpoint
+import unittest
+import tempfile
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def file_io_ok():
+    try:
+        return MPI.File.Open is not None
+    except (AttributeError, NotImplementedError):
+        return False
+
+
+def make_object(rank):
+    obj = {
+        'rank': rank,
+        'data': list(range(rank * 3)),
+        'text': 'x' * rank,
+        'blob': bytearray(rank * 1000),
+    }
+    if numpy is not None:
+        obj['array'] = numpy.full(rank * 1000 + 1, rank, dtype='d')
+        obj['empty'] = numpy.zeros(0, dtype='i')
+    return obj
+
+
+@unittest.skipUnless(file_io_ok(), 'mpi-file')
+class BaseTestCheckpoint(object):
+
+    COMM = MPI.COMM_NULL
+
+    def setUp(self):
+        comm = self.COMM
+        if comm.Get_rank() == 0:
+            fd, fname = tempfile.mkstemp(prefix='mpi4py-', suffix='.ckpt')
+            os.close(fd)
+        else:
+            fname = None
+        self.filename = comm.bcast(fname, root=0)
+
+    def tearDown(self):
+        self.COMM.Barrier()
+        if self.COMM.Get_rank() == 0:
+            os.remove(self.filename)
+
+    def assertObjectEqual(self, obj, rank):
+        expected = make_object(rank)
+        self.assertEqual(sorted(obj), sorted(expected))
+        for key, value in expected.items():
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                self.assertEqual(obj[key].dtype, value.dtype)
+                self.assertTrue((obj[key] == value).all())
+            else:
+                self.assertEqual(obj[key], value)
+
+    def testSaveLoad(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        checkpoint.save(self.filename, make_object(rank), comm)
+        self.assertEqual(checkpoint.get_count(self.filename, comm), size)
+        obj = checkpoint.load(self.filename, comm)
+        self.assertObjectEqual(obj, rank)
+
+    def testRanks(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        checkpoint.save(self.filename, make_object(rank), comm)
+        for ranks in (
+            [],
+            [rank],
+            [(rank + 1) % size],
+            list(range(size)),
+            list(reversed(range(size))),
+            [0, 0, size - 1],
+        ):
+            objs = checkpoint.load(self.filename, comm, ranks=ranks)
+            self.assertEqual(len(objs), len(ranks))
+            for obj, r in zip(objs, ranks):
+                self.assertObjectEqual(obj, r)
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm, ranks=[size])
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm, ranks=[-1])
+        bad = [size] if rank == 0 else [0]
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm, ranks=bad)
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm,
+                            ranks=[size] if rank == 0 else None)
+        objs = checkpoint.load(self.filename, comm, ranks=[0])
+        self.assertObjectEqual(objs[0], 0)
+
+    def testRestart(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        if rank == 0:
+            checkpoint.save(self.filename, 'self', MPI.COMM_SELF)
+        comm.Barrier()
+        self.assertEqual(checkpoint.get_count(self.filename, comm), 1)
+        objs = checkpoint.load(self.filename, comm, ranks=[0])
+        self.assertEqual(objs, ['self'])
+        if size > 1:
+            with self.assertRaises(ValueError):
+                checkpoint.load(self.filename, comm)
+        comm.Barrier()
+        objs = [None] * (2 * size + 1)
+        if rank == 0:
+            for i in range(len(objs)):
+                objs[i] = make_object(i)
+        sub = comm.Split(0 if rank == 0 else MPI.UNDEFINED, 0)
+        if sub:
+            checkpoint.save(self.filename, objs, sub)
+            sub.Free()
+        comm.Barrier()
+        objs = checkpoint.load(self.filename, comm, ranks=[0])[0]
+        for i, obj in enumerate(objs):
+            self.assertObjectEqual(obj, i)
+
+    def testOverwrite(self):
+        comm = self.COMM
+        rank = comm.Get_rank()
+        checkpoint.save(self.filename, make_object(rank + 7), comm)
+        checkpoint.save(self.filename, rank, comm)
+        self.assertEqual(checkpoint.load(self.filename, comm), rank)
+
+    def testBadFile(self):
+        comm = self.COMM
+        if comm.Get_rank() == 0:
+            with open(self.filename, 'wb') as f:
+                f.write(b'not a checkpoint file, but long enough')
+        comm.Barrier()
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm)
+        with self.assertRaises(ValueError):
+            checkpoint.get_count(self.filename, comm)
+        comm.Barrier()
+        if comm.Get_rank() == 0:
+            with open(self.filename, 'wb') as f:
+                f.write(b'short')
+        comm.Barrier()
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.filename, comm)
+
+
+class TestCheckpointSelf(BaseTestCheckpoint, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+
+
+class TestCheckpointWorld(BaseTestCheckpoint, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+
+
+if __name__ == '__main__':
+    unittest.main()
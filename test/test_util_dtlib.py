@@ -504,10 +504,94 @@ class TestUtilDTLib(unittest.TestCase):
                     self.assertTrue(dt['aligned'])
             with self.assertRaises(RuntimeError):
                 fromnumpy(None)
+            with self.assertRaises(RuntimeError):
+                dtlib.get_datatype(None)
         finally:
             if np_dtype is not None:
                 setattr(dtlib, '_np_dtype', np_dtype)
 
+    @unittest.skipIf(numpy is None, 'numpy')
+    def testStrings(self):
+        for t in ('S', 'U'):
+            for n in (1, 3, 7):
+                with self.subTest(typecode=t, length=n):
+                    dt = np_dtype(f'{t}{n}')
+                    mt = fromnumpy(dt)
+                    self.assertEqual(mt.size, dt.itemsize)
+                    self.assertEqual(mt.extent, dt.itemsize)
+                    mt.Free()
+
+    @unittest.skipIf(numpy is None, 'numpy')
+    def testCache(self):
+        from mpi4py.util import dtlib
+        maxsize = dtlib._cache_maxsize
+        dtlib.clear_cache()
+        try:
+            for t in typecodes:
+                with self.subTest(typecode=t):
+                    mt = dtlib.get_datatype(t)
+                    self.assertTrue(mt.is_predefined)
+                    code = np_dtype(t).char
+                    self.assertEqual(mt, MPI.Datatype.fromcode(code))
+            self.assertEqual(len(dtlib._cache), 0)
+            dtlib._cache_maxsize = 2
+            dtypes = [
+                np_dtype([('a', 'i'), ('b', 'd')], align=True),
+                np_dtype([('a', 'd'), ('b', 'S3')], align=True),
+                np_dtype(('f', (2, 3))),
+            ]
+            mt0 = dtlib.get_datatype(dtypes[0])
+            self.assertFalse(mt0.is_predefined)
+            self.assertNotEqual(mt0.Get_envelope()[3], MPI.COMBINER_NAMED)
+            self.assertIs(dtlib.get_datatype(dtypes[0]), mt0)
+            self.assertEqual(mt0.extent, dtypes[0].itemsize)
+            mt1 = dtlib.get_datatype(dtypes[1])
+            self.assertIs(dtlib.get_datatype(dtypes[0]), mt0)
+            mt2 = dtlib.get_datatype(dtypes[2])
+            self.assertEqual(len(dtlib._cache), 2)
+            self.assertFalse(mt1)
+            self.assertTrue(mt0)
+            self.assertTrue(mt2)
+            dtlib.clear_cache()
+            self.assertEqual(len(dtlib._cache), 0)
+            self.assertFalse(mt0)
+            self.assertFalse(mt2)
+        finally:
+            dtlib._cache_maxsize = maxsize
+            dtlib.clear_cache()
+        endian = '>' if np_dtype('<i').isnative else '<'
+        get_datatype = dtlib.get_datatype
+        self.assertRaises(ValueError, get_datatype, np_dtype(endian+'i'))
+        self.assertRaises(ValueError, get_datatype, np_dtype('O'))
+
+    @unittest.skipIf(numpy is None, 'numpy')
+    def testCacheMessage(self):
+        from mpi4py.util import dtlib
+        comm = MPI.COMM_SELF
+        dtypes = [
+            np_dtype([('a', 'i'), ('b', 'd', (2,)), ('c', 'S3')], align=True),
+            np_dtype([('x', 'f'), ('y', 'f'), ('z', 'f')]),
+        ]
+        try:
+            for dt in dtypes:
+                with self.subTest(dtype=dt):
+                    sbuf = numpy.zeros(5, dt)
+                    for i, name in enumerate(dt.names):
+                        sbuf[name] = i + 1
+                    for _ in range(3):
+                        rbuf = numpy.zeros_like(sbuf)
+                        comm.Sendrecv(sbuf, 0, 0, rbuf, 0, 0)
+                        self.assertTrue((sbuf == rbuf).all())
+                        rbuf = sbuf.copy()
+                        comm.Bcast(rbuf, 0)
+                        self.assertTrue((sbuf == rbuf).all())
+                        rbuf = numpy.zeros_like(sbuf)
+                        comm.Allgather(sbuf, rbuf)
+                        self.assertTrue((sbuf == rbuf).all())
+                        dtlib.clear_cache()
+        finally:
+            dtlib.clear_cache()
+
     @unittest.skipIf(numpy is None, 'numpy')
     def testFailures(self):
         endian = '>' if np_dtype('<i').isnative else '<'
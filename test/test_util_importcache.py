@@ -0,0 +1,104 @@
+from mpi4py import MPI
+from mpi4py.util import importcache
+import mpiunittest as unittest
+import importlib
+import threading
+import tempfile
+import shutil
+import sys
+import os
+
+
+PACKAGE = {
+    '__init__.py': "from . import mod\nVALUE = mod.VALUE + 1\n",
+    'mod.py': "VALUE = 41\n",
+    'sub/__init__.py': "",
+    'sub/data.py': "DATA = [1, 2, 3]\n",
+}
+
+
+class BaseTestImportCache:
+
+    COMM = MPI.COMM_NULL
+
+    def setUp(self):
+        self.comm = self.COMM
+        self.rank = self.comm.Get_rank()
+        tempdir = None
+        if self.rank == 0:
+            tempdir = tempfile.mkdtemp()
+        self.tempdir = self.comm.bcast(tempdir, root=0)
+        self.pkgname = self.comm.bcast(f'_importcache_{id(self)}')
+        if self.rank == 0:
+            pkgdir = os.path.join(self.tempdir, self.pkgname)
+            for filename, source in PACKAGE.items():
+                path = os.path.join(pkgdir, filename)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as fh:
+                    fh.write(source)
+            sys.path.insert(0, self.tempdir)
+        importlib.invalidate_caches()
+        self.comm.Barrier()
+
+    def tearDown(self):
+        importcache.uninstall()
+        for name in list(sys.modules):
+            if name.split('.')[0] == self.pkgname:
+                del sys.modules[name]
+        if self.tempdir in sys.path:
+            sys.path.remove(self.tempdir)
+        self.comm.Barrier()
+        if self.rank == 0:
+            shutil.rmtree(self.tempdir)
+
+    def testImport(self):
+        finder = importcache.install(self.comm)
+        self.assertIs(importcache.installed(), finder)
+        self.assertIn(finder, sys.meta_path)
+        self.assertEqual(finder.hits, 0)
+        pkg = importlib.import_module(self.pkgname)
+        self.assertEqual(pkg.VALUE, 42)
+        self.assertEqual(pkg.mod.VALUE, 41)
+        data = importlib.import_module(f'{self.pkgname}.sub.data')
+        self.assertEqual(data.DATA, [1, 2, 3])
+        self.assertEqual(finder.hits, 4)
+        self.assertTrue(pkg.__file__.startswith(self.tempdir))
+        self.assertEqual(len(pkg.__path__), 1)
+        self.assertTrue(pkg.__path__[0].startswith(self.tempdir))
+        self.assertIsNone(data.__spec__.submodule_search_locations)
+        with self.assertRaises(ImportError):
+            importlib.import_module(f'{self.pkgname}.qwerty')
+        self.assertEqual(finder.hits, 4)
+        importcache.uninstall()
+        self.assertIsNone(importcache.installed())
+        self.assertNotIn(finder, sys.meta_path)
+        importcache.uninstall()
+
+    def testInstall(self):
+        importcache.install(self.comm)
+        with self.assertRaises(RuntimeError):
+            importcache.install(self.comm)
+
+    def testThread(self):
+        finder = importcache.install(self.comm)
+        result = []
+        def target():
+            spec = finder.find_spec(self.pkgname)
+            result.append(spec)
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [None])
+        self.assertEqual(finder.hits, 0)
+
+
+class TestImportCacheSelf(BaseTestImportCache, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+
+
+class TestImportCacheWorld(BaseTestImportCache, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+
+
+if __name__ == '__main__':
+    unittest.main()
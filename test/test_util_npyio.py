@@ -0,0 +1,200 @@
+from mpi4py import MPI
+from mpi4py.util import npyio
+import unittest
+import tempfile
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def file_io_ok():
+    try:
+        MPI.File
+        return MPI.File.Get_amode is not None
+    except (AttributeError, NotImplementedError):
+        return False
+
+
+@unittest.skipIf(numpy is None, 'numpy')
+@unittest.skipUnless(file_io_ok(), 'mpi-file')
+class BaseTestNpyIO(object):
+
+    COMM = MPI.COMM_NULL
+
+    def setUp(self):
+        comm = self.COMM
+        if comm.Get_rank() == 0:
+            fd, fname = tempfile.mkstemp(prefix='mpi4py-', suffix='.npy')
+            os.close(fd)
+        else:
+            fname = None
+        self.filename = comm.bcast(fname, root=0)
+
+    def tearDown(self):
+        self.COMM.Barrier()
+        if self.COMM.Get_rank() == 0:
+            os.remove(self.filename)
+
+    def testSaveLoad(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        for dtype in ('b', 'i', 'd', 'D', '>i4', [('a', 'i'), ('b', 'f8')]):
+            for shape in [(3,), (3, 2), (2, 3, 4), (0, 2)]:
+                local = numpy.zeros(shape, dtype)
+                if local.dtype.names:
+                    local['a'] = rank
+                    local['b'] = rank / 2
+                else:
+                    local[...] = rank
+                npyio.save(self.filename, local, comm)
+                comm.Barrier()
+                total = numpy.load(self.filename)
+                gshape = (shape[0] * size,) + shape[1:]
+                self.assertEqual(total.shape, gshape)
+                self.assertEqual(total.dtype, local.dtype)
+                for i in range(size):
+                    block = total[i*shape[0]:(i+1)*shape[0]]
+                    if local.dtype.names:
+                        self.assertTrue((block['a'] == i).all())
+                    else:
+                        self.assertTrue((block == i).all())
+                comm.Barrier()
+                array = npyio.load(self.filename, comm)
+                q, r = divmod(gshape[0], size)
+                lo = rank * q + min(rank, r)
+                hi = lo + q + (rank < r)
+                self.assertEqual(array.shape, (hi - lo,) + shape[1:])
+                self.assertTrue((array == total[lo:hi]).all())
+                comm.Barrier()
+
+    def testSubarray(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        shape = (4, 3 * size)
+        local = numpy.arange(12, dtype='i').reshape(4, 3) + 100 * rank
+        npyio.save(self.filename, local, comm,
+                   shape=shape, starts=(0, 3 * rank))
+        comm.Barrier()
+        total = numpy.load(self.filename)
+        self.assertEqual(total.shape, shape)
+        for i in range(size):
+            block = total[:, 3*i:3*(i+1)]
+            expected = numpy.arange(12, dtype='i').reshape(4, 3) + 100 * i
+            self.assertTrue((block == expected).all())
+        array = npyio.load(self.filename, comm,
+                           subsizes=(2, 3), starts=(1, 3 * rank))
+        self.assertTrue((array == local[1:3]).all())
+        with self.assertRaises(ValueError):
+            npyio.save(self.filename, local, comm, shape=shape)
+        with self.assertRaises(ValueError):
+            npyio.save(self.filename, local, comm, starts=(0, 0))
+        with self.assertRaises(ValueError):
+            npyio.save(self.filename, local, comm,
+                       shape=(4, 2), starts=(0, 0))
+        with self.assertRaises(ValueError):
+            npyio.load(self.filename, comm, subsizes=(5, 1))
+        with self.assertRaises(ValueError):
+            npyio.load(self.filename, comm, subsizes=(1,), starts=(1,))
+
+    def testFortran(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        if rank == 0:
+            total = numpy.asfortranarray(
+                numpy.arange(5 * size * 3, dtype='d').reshape(5 * size, 3))
+            numpy.save(self.filename, total)
+        comm.Barrier()
+        total = numpy.load(self.filename)
+        self.assertTrue(total.flags.f_contiguous)
+        array = npyio.load(self.filename, comm)
+        self.assertTrue((array == total[5*rank:5*(rank+1)]).all())
+        array = npyio.load(self.filename, comm,
+                           subsizes=(2, 2), starts=(rank, 1))
+        self.assertTrue((array == total[rank:rank+2, 1:3]).all())
+
+    def testScalar(self):
+        comm = self.COMM
+        rank = comm.Get_rank()
+        local = numpy.array(42.0 + rank)
+        npyio.save(self.filename, local, comm)
+        comm.Barrier()
+        self.assertEqual(numpy.load(self.filename), 42.0)
+        array = npyio.load(self.filename, comm)
+        self.assertEqual(array.shape, ())
+        self.assertEqual(array, 42.0)
+
+    def testNotContiguous(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        local = numpy.arange(20, dtype='i').reshape(4, 5)[:, ::2] + rank
+        npyio.save(self.filename, local, comm)
+        comm.Barrier()
+        total = numpy.load(self.filename)
+        for i in range(size):
+            self.assertTrue((total[4*i:4*(i+1)] == local - rank + i).all())
+
+    def testObject(self):
+        comm = self.COMM
+        local = numpy.array([None, 1], dtype=object)
+        with self.assertRaises(ValueError):
+            npyio.save(self.filename, local, comm)
+        if comm.Get_rank() == 0:
+            numpy.save(self.filename, local, allow_pickle=True)
+        comm.Barrier()
+        with self.assertRaises(ValueError):
+            npyio.load(self.filename, comm)
+
+    def testCollectiveErrors(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        if size > 1:
+            cols = 3 if rank == 0 else 2
+            local = numpy.zeros((2, cols), dtype='i')
+            with self.assertRaises(ValueError):
+                npyio.save(self.filename, local, comm)
+            local = numpy.zeros((2, 2), dtype='i')
+            if rank == 0:
+                local = local[0]
+            with self.assertRaises(ValueError):
+                npyio.save(self.filename, local, comm)
+        local = numpy.zeros((2, 2), dtype='i')
+        if rank == 0:
+            local = local.astype(object)
+        with self.assertRaises(ValueError):
+            npyio.save(self.filename, local, comm)
+        local = numpy.zeros((2, 2), dtype='i')
+        npyio.save(self.filename, local, comm)
+        subsizes = (2 * size + 1, 2) if rank == 0 else (1, 2)
+        with self.assertRaises(ValueError):
+            npyio.load(self.filename, comm, subsizes=subsizes)
+        array = npyio.load(self.filename, comm)
+        self.assertTrue((array == 0).all())
+
+    def testBadFile(self):
+        comm = self.COMM
+        if comm.Get_rank() == 0:
+            with open(self.filename, 'wb') as f:
+                f.write(b'not a npy file')
+        comm.Barrier()
+        with self.assertRaises(ValueError):
+            npyio.load(self.filename, comm)
+
+
+class TestNpyIOSelf(BaseTestNpyIO, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+
+
+class TestNpyIOWorld(BaseTestNpyIO, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+
+
+if __name__ == '__main__':
+    unittest.main()
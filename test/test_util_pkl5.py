@@ -34,6 +34,21 @@ except ImportError:
     numpy = None
 
 
+class NestedBcast(object):
+
+    comm = None
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __reduce__(self):
+        return (_nested_bcast, (self.obj,))
+
+
+def _nested_bcast(obj):
+    return NestedBcast.comm.bcast(obj * 150, root=0)
+
+
 class BaseTest(object):
 
     COMM = MPI.COMM_NULL
@@ -46,9 +61,13 @@ class BaseTest(object):
         self.bigmpi_prev = pkl5._bigmpi
         self.bigmpi = pkl5._BigMPI()
         pkl5._bigmpi = self.bigmpi
+        self.pipeline_prev = pkl5._pipeline
+        self.pipeline = pkl5._Pipeline()
+        pkl5._pipeline = self.pipeline
 
     def tearDown(self):
         pkl5._bigmpi = self.bigmpi_prev
+        pkl5._pipeline = self.pipeline_prev
 
     def testSendAndRecv(self):
         size = self.COMM.Get_size()
@@ -687,6 +706,12 @@ class BaseTest(object):
                     self.assertEqual(rmess, [smess]*size)
                 else:
                     self.assertIsNone(rmess)
+        for root in range(size):
+            rmess = comm.gather(rank, root)
+            if rank == root:
+                self.assertEqual(rmess, list(range(size)))
+            else:
+                self.assertIsNone(rmess)
         self.assertRaises(MPI.Exception, comm.gather, None, root=-1)
         self.assertRaises(MPI.Exception, comm.gather, None, root=size)
 
@@ -709,6 +734,19 @@ class BaseTest(object):
                     for root in range(rsize):
                         rmess = comm.gather(smess, root=root)
                         self.assertIsNone(rmess)
+        for color in [0, 1]:
+            if color == COLOR:
+                for root in range(size):
+                    if root == rank:
+                        rmess = comm.gather(None, root=MPI.ROOT)
+                        self.assertEqual(rmess, list(range(rsize)))
+                    else:
+                        rmess = comm.gather(None, root=MPI.PROC_NULL)
+                        self.assertIsNone(rmess)
+            else:
+                for root in range(rsize):
+                    rmess = comm.gather(rank, root=root)
+                    self.assertIsNone(rmess)
         self.assertRaises(MPI.Exception, comm.gather, None, root=max(size,rsize))
         self.assertRaises(MPI.Exception, comm.gather, None, root=max(size,rsize))
         comm.Free()
@@ -724,6 +762,10 @@ class BaseTest(object):
                 self.assertEqual(rmess, smess)
                 rmess = comm.scatter(iter([smess]*size), root)
                 self.assertEqual(rmess, smess)
+        rank = comm.Get_rank()
+        for root in range(size):
+            rmess = comm.scatter(list(range(size)), root)
+            self.assertEqual(rmess, rank)
         self.assertRaises(MPI.Exception, comm.scatter, [None]*size, root=-1)
         self.assertRaises(MPI.Exception, comm.scatter, [None]*size, root=size)
         if size == 1:
@@ -748,6 +790,19 @@ class BaseTest(object):
                     for root in range(rsize):
                         rmess = comm.scatter(None, root=root)
                         self.assertEqual(rmess, smess)
+        for color in [0, 1]:
+            if color == COLOR:
+                for root in range(size):
+                    if root == rank:
+                        sobj = list(range(rsize))
+                        rmess = comm.scatter(sobj, root=MPI.ROOT)
+                    else:
+                        rmess = comm.scatter(None, root=MPI.PROC_NULL)
+                    self.assertIsNone(rmess)
+            else:
+                for root in range(rsize):
+                    rmess = comm.scatter(None, root=root)
+                    self.assertEqual(rmess, rank)
         self.assertRaises(MPI.Exception, comm.scatter, None, root=max(size, rsize))
         self.assertRaises(MPI.Exception, comm.scatter, None, root=max(size, rsize))
         comm.Free()
@@ -760,6 +815,9 @@ class BaseTest(object):
             self.assertEqual(rmess, [None]*size)
             rmess = comm.allgather(smess)
             self.assertEqual(rmess, [smess]*size)
+        rank = comm.Get_rank()
+        rmess = comm.allgather(rank)
+        self.assertEqual(rmess, list(range(size)))
 
     def testAllgatherInter(self):
         comm, COLOR = self.make_intercomm(self.COMM)
@@ -769,6 +827,9 @@ class BaseTest(object):
             self.assertEqual(rmess, [None]*size)
             rmess = comm.allgather(smess)
             self.assertEqual(rmess, [smess]*size)
+        rank = comm.Get_rank()
+        rmess = comm.allgather(rank)
+        self.assertEqual(rmess, list(range(size)))
         comm.Free()
 
     def testAlltoallIntra(self):
@@ -781,6 +842,9 @@ class BaseTest(object):
             self.assertEqual(rmess, [smess]*size)
             rmess = comm.alltoall(iter([smess]*size))
             self.assertEqual(rmess, [smess]*size)
+        rank = comm.Get_rank()
+        rmess = comm.alltoall([(rank, i) for i in range(size)])
+        self.assertEqual(rmess, [(i, rank) for i in range(size)])
         self.assertRaises(ValueError, comm.alltoall, [None]*(size-1))
         self.assertRaises(ValueError, comm.alltoall, [None]*(size+1))
 
@@ -847,6 +911,79 @@ class BaseTest(object):
             self.testBcastIntra([(c, c.copy())], check2)
             self.testBcastInter([(c, c.copy())], check2)
 
+    @unittest.skipIf(numpy is None, 'numpy')
+    def testBcastPipeline(self):
+        pipeline = self.pipeline
+        segsizes = (
+            0, 1, 63, 64, 65,
+            (1<<12)-1,
+            (1<<12),
+            (1<<12)+1,
+        )
+        a = numpy.arange(1024, dtype='i')
+        b = numpy.arange(1024, dtype='d')
+        c = ''.join(map(str, range(1024)))
+        for window in (1, 2, 4):
+            pipeline.window = window
+            for segsize in segsizes:
+                pipeline.segsize = segsize
+                check = lambda x: numpy.all(x == a)
+                self.testBcastIntra([a], check)
+                self.testBcastInter([a], check)
+                check = lambda x: (
+                    numpy.all(x[0] == a) and
+                    numpy.all(x[1] == b) and
+                    x[2] == c
+                )
+                self.testBcastIntra([(a, b, c)], check)
+                self.testBcastInter([(a, b, c)], check)
+        pipeline.maxcache = 0
+        self.testBcastIntra([a], lambda x: numpy.all(x == a))
+
+    def testBcastPipelineCustom(self):
+        comm = MPI.COMM_WORLD
+        pipeline = self.pipeline
+        pipeline.segsize = 64
+        calls = []
+        def bcast(comm, buf, root):
+            calls.append(buf[1])
+            MPI.Comm.Bcast(comm, buf, root)
+        data = bytearray(b'x' * 200) if comm.Get_rank() == 0 else bytearray(200)
+        pipeline.bcast(comm, bcast, data, 0)
+        self.assertEqual(data, b'x' * 200)
+        self.assertEqual(calls, [64, 64, 64, 8])
+
+    def testBcastPipelineEnviron(self):
+        import os
+        comm = MPI.COMM_WORLD
+        pipeline = self.pipeline
+        calls = []
+        def bcast(comm, buf, root):
+            calls.append(buf[1])
+            MPI.Comm.Bcast(comm, buf, root)
+        data = bytearray(100)
+        save = os.environ.get('MPI4PY_PKL5_BCAST_SEGSIZE')
+        try:
+            for segsize in ('0', '32'):
+                os.environ['MPI4PY_PKL5_BCAST_SEGSIZE'] = segsize
+                pipeline.bcast(comm, bcast, data, 0)
+        finally:
+            del os.environ['MPI4PY_PKL5_BCAST_SEGSIZE']
+            if save is not None:
+                os.environ['MPI4PY_PKL5_BCAST_SEGSIZE'] = save
+        self.assertEqual(calls, [100, 32, 32, 32, 4])
+
+    def testBcastPipelineNested(self):
+        comm = pkl5.Intracomm(self.COMM)
+        NestedBcast.comm = comm
+        try:
+            smess = [NestedBcast('a' * 10), 'b' * 2000]
+            for _ in range(2):
+                rmess = comm.bcast(smess, root=0)
+                self.assertEqual(rmess, ['a' * 1500, 'b' * 2000])
+        finally:
+            NestedBcast.comm = None
+
 
 class BaseTestPKL5(object):
     CommType = pkl5.Intracomm
@@ -0,0 +1,95 @@
+from mpi4py import MPI
+from mpi4py.util import shmem
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def allocate_shared_ok():
+    try:
+        comm = MPI.COMM_SELF
+        win = MPI.Win.Allocate_shared(1, 1, comm=comm)
+        win.Free()
+        return True
+    except NotImplementedError:
+        return False
+    except MPI.Exception:
+        return False
+
+
+@unittest.skipIf(numpy is None, 'numpy')
+@unittest.skipUnless(allocate_shared_ok(), 'mpi-win-shared')
+class TestSharedArray(unittest.TestCase):
+
+    COMM = MPI.COMM_WORLD
+
+    def testShape(self):
+        for shape in [7, (7,), (2, 3), (2, 3, 4), (0,), (3, 0)]:
+            for order in ('C', 'F'):
+                with shmem.SharedArray(shape, 'i', self.COMM, order) as sa:
+                    if isinstance(shape, int):
+                        shape = (shape,)
+                    array = sa.array
+                    self.assertIsInstance(array, numpy.ndarray)
+                    self.assertEqual(array.shape, shape)
+                    self.assertEqual(array.dtype, numpy.dtype('i'))
+                    if order == 'C':
+                        self.assertTrue(array.flags.c_contiguous)
+                    else:
+                        self.assertTrue(array.flags.f_contiguous)
+                    self.assertTrue(array.flags.writeable)
+                    sa.barrier()
+
+    def testDatatype(self):
+        dtypes = ['b', 'i', 'f', 'd', 'D']
+        dtypes += [numpy.dtype([('a', 'i'), ('b', 'd')], align=True)]
+        for dtype in dtypes:
+            with shmem.SharedArray((3, 5), dtype, self.COMM) as sa:
+                self.assertEqual(sa.array.dtype, numpy.dtype(dtype))
+        self.assertRaises(
+            ValueError, shmem.SharedArray, 3, object, self.COMM,
+        )
+        self.assertRaises(
+            ValueError, shmem.SharedArray, (3, -1), 'i', self.COMM,
+        )
+
+    def testShared(self):
+        with shmem.SharedArray((5, 7), 'd', self.COMM) as sa:
+            comm = sa.comm
+            rank = comm.Get_rank()
+            size = comm.Get_size()
+            self.assertEqual(sa.leader, rank == 0)
+            sa.fence()
+            if sa.leader:
+                sa.array[...] = 0
+            sa.fence()
+            self.assertTrue((sa.array == 0).all())
+            sa.fence()
+            sa.array.flat[rank::size] = rank + 1
+            sa.barrier()
+            for i, value in enumerate(sa.array.flat):
+                self.assertEqual(value, i % size + 1)
+            sa.barrier()
+
+    def testFree(self):
+        sa = shmem.SharedArray(3, 'i', self.COMM)
+        self.assertTrue(sa.win)
+        self.assertTrue(sa.comm)
+        self.assertIsNotNone(sa.array)
+        sa.free()
+        self.assertFalse(sa.win)
+        self.assertFalse(sa.comm)
+        self.assertIsNone(sa.array)
+        sa.free()
+
+
+class TestSharedArraySelf(TestSharedArray):
+
+    COMM = MPI.COMM_SELF
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+from mpi4py import MPI
+from mpi4py.util import sync
+import unittest
+
+
+def win_allocate_ok():
+    try:
+        win = MPI.Win.Allocate(1, 1, comm=MPI.COMM_SELF)
+        win.Free()
+        return True
+    except NotImplementedError:
+        return False
+    except MPI.Exception:
+        return False
+
+
+@unittest.skipUnless(win_allocate_ok(), 'mpi-win-allocate')
+class BaseTestCounter(object):
+
+    COMM = MPI.COMM_NULL
+    KWARGS = {}
+
+    def newcounter(self, *args, **kwargs):
+        kwargs.update(self.KWARGS)
+        return self.Counter(*args, comm=self.COMM, **kwargs)
+
+    def testDefault(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        with self.newcounter() as counter:
+            values = [next(counter) for _ in range(5)]
+            self.assertEqual(values, sorted(values))
+            values = comm.allreduce(values)
+            self.assertEqual(sorted(values), list(range(5*size)))
+
+    def testStartStep(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        for start, step in [(0, 1), (7, 1), (3, 2), (-1, -3)]:
+            for root in range(size):
+                with self.newcounter(start, step, root=root) as counter:
+                    values = [counter.next() for _ in range(3)]
+                    values = comm.allreduce(values)
+                expected = [start + i*step for i in range(3*size)]
+                self.assertEqual(sorted(values), sorted(expected))
+
+    def testTypechar(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        for typechar in ('i', 'l', 'q', 'I', 'Q'):
+            with self.newcounter(typechar=typechar) as counter:
+                values = [next(counter) for _ in range(3)]
+                values = comm.allreduce(values)
+            self.assertEqual(sorted(values), list(range(3*size)))
+
+    def testClaim(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        with self.newcounter(5, 2) as counter:
+            values = []
+            for count in (0, 1, 3, 7):
+                batch = counter.claim(count)
+                self.assertEqual(len(batch), count)
+                values.extend(batch)
+            self.assertRaises(ValueError, counter.claim, -1)
+            values = comm.allreduce(values)
+        expected = [5 + i*2 for i in range(11*size)]
+        self.assertEqual(sorted(values), expected)
+
+    def testIndices(self):
+        comm = self.COMM
+        for stop in (0, 1, 10, 97):
+            for batch in (1, 3, 50):
+                with self.newcounter() as counter:
+                    values = list(counter.indices(stop, batch))
+                    values = comm.allreduce(values)
+                self.assertEqual(sorted(values), list(range(stop)))
+        with self.newcounter(10, -1) as counter:
+            values = list(counter.indices(0, 2))
+            values = comm.allreduce(values)
+        self.assertEqual(sorted(values), list(range(1, 11)))
+        with self.newcounter() as counter:
+            with self.assertRaises(ValueError):
+                next(counter.indices(10, 0))
+
+    def testFree(self):
+        counter = self.newcounter()
+        counter.free()
+        counter.free()
+
+
+class TestCounterSelf(BaseTestCounter, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+    Counter = sync.Counter
+
+
+class TestCounterWorld(BaseTestCounter, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+    Counter = sync.Counter
+
+    def testNextIncr(self):
+        comm = self.COMM
+        with self.newcounter() as counter:
+            for incr in (1, 2, 3):
+                counter.next(incr)
+            total = comm.allreduce(6)
+            comm.Barrier()
+            self.assertEqual(counter.next(0), total)
+
+
+class TestNodeCounterSelf(BaseTestCounter, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+    Counter = sync.NodeCounter
+
+
+class TestNodeCounterWorld(BaseTestCounter, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+    Counter = sync.NodeCounter
+
+
+class TestNodeCounterChunk(BaseTestCounter, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+    Counter = sync.NodeCounter
+    KWARGS = dict(chunksize=2)
+
+    def testChunksize(self):
+        self.assertRaises(
+            ValueError, self.Counter, chunksize=0, comm=self.COMM,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+from mpi4py import MPI
+from mpi4py.util import trace
+import unittest
+import tempfile
+import threading
+import json
+import sys
+import io
+import os
+
+
+def trace_ok():
+    try:
+        trace.enable()
+        trace.disable()
+        return True
+    except NotImplementedError:
+        return False
+
+
+@unittest.skipUnless(trace_ok(), 'trace')
+class BaseTestTrace(object):
+
+    COMM = MPI.COMM_NULL
+
+    def setUp(self):
+        self.comm = self.COMM.Dup()
+        size = self.comm.Get_size()
+        rank = self.comm.Get_rank()
+        self.dest = (rank + 1) % size
+        self.source = (rank - 1) % size
+
+    def tearDown(self):
+        trace.disable()
+        self.comm.Free()
+
+    def exchange(self):
+        comm = self.comm
+        dest, source = self.dest, self.source
+        sbuf = bytearray(16)
+        rbuf = bytearray(16)
+        comm.Sendrecv(sbuf, dest, 0, rbuf, source, 0)
+        obj = comm.sendrecv({'data': [dest] * 8}, dest, 1, None, source, 1)
+        comm.Barrier()
+        return obj
+
+    def testEvents(self):
+        comm = self.comm
+        comm.Set_name('tracecomm')
+        trace.enable()
+        self.exchange()
+        len([comm])
+        trace.disable()
+        comm.Barrier()
+        events = trace.get_events()
+        names = [event.name for event in events]
+        self.assertEqual(names, ['Sendrecv', 'sendrecv', 'Barrier'])
+        for event in events:
+            self.assertEqual(event.rank, MPI.COMM_WORLD.Get_rank())
+            self.assertEqual(event.kind, 'Comm')
+            self.assertEqual(event.label, 'tracecomm')
+            self.assertLessEqual(event.start, event.stop)
+        sendrecv, psendrecv, barrier = events
+        self.assertEqual(sendrecv.peer, self.source)
+        self.assertEqual(sendrecv.nbytes, 32)
+        self.assertEqual(sendrecv.pickle, 0)
+        self.assertGreater(psendrecv.nbytes, 0)
+        self.assertGreaterEqual(psendrecv.pickle, 0)
+        self.assertIsNone(barrier.peer)
+        self.assertEqual(barrier.nbytes, 0)
+
+    def testRingBuffer(self):
+        comm = self.comm
+        trace.enable(size=2)
+        for _ in range(5):
+            comm.Get_rank()
+        comm.Get_size()
+        trace.disable()
+        events = trace.get_events()
+        names = [event.name for event in events]
+        self.assertEqual(names, ['Get_rank', 'Get_size'])
+        trace.enable()
+        trace.disable()
+        self.assertEqual(trace.get_events(), [])
+        with self.assertRaises(ValueError):
+            trace.enable(size=0)
+
+    def testRequest(self):
+        comm = self.comm
+        trace.enable()
+        request = comm.Ibarrier()
+        request.Wait()
+        trace.disable()
+        events = trace.get_events()
+        self.assertEqual(
+            [(event.kind, event.name) for event in events],
+            [('Comm', 'Ibarrier'), ('Request', 'Wait')],
+        )
+
+    def testProfiler(self):
+        comm = self.comm
+        calls = []
+        def profile(frame, event, arg):
+            if event == 'c_call':
+                calls.append(arg)
+        sys.setprofile(profile)
+        try:
+            trace.enable()
+            comm.Barrier()
+            self.assertIs(sys.getprofile(), profile)
+            trace.disable()
+        finally:
+            sys.setprofile(None)
+        self.assertTrue(calls)
+        events = trace.get_events()
+        self.assertEqual([event.name for event in events], ['Barrier'])
+
+    def testThreads(self):
+        comm = self.comm
+        trace.enable()
+        thread = threading.Thread(target=comm.Get_rank)
+        thread.start()
+        thread.join()
+        comm.Get_size()
+        trace.disable()
+        comm.Get_rank()
+        events = trace.get_events()
+        names = [event.name for event in events]
+        self.assertEqual(names, ['Get_rank', 'Get_size'])
+
+    def testGather(self):
+        comm = self.comm
+        size = comm.Get_size()
+        for root in range(size):
+            trace.enable()
+            self.exchange()
+            events = trace.gather(comm, root)
+            if comm.Get_rank() == root:
+                self.assertEqual(len(events), 3 * size)
+                ranks = sorted({event.rank for event in events})
+                world = MPI.COMM_WORLD.Get_rank()
+                self.assertEqual(len(ranks), size)
+                self.assertIn(world, ranks)
+                starts = [event.start for event in events]
+                self.assertEqual(starts, sorted(starts))
+                self.assertEqual(starts[0], 0)
+            else:
+                self.assertIsNone(events)
+
+    def testSummary(self):
+        trace.enable()
+        self.exchange()
+        trace.disable()
+        events = trace.get_events()
+        table = trace.summary(events).splitlines()
+        self.assertEqual(len(table), 2 + 3)
+        self.assertTrue(table[0].startswith('call'))
+        self.assertEqual(set(table[1]), {'-'})
+        calls = sorted(line.split()[0] for line in table[2:])
+        self.assertEqual(
+            calls, ['Comm.Barrier', 'Comm.Sendrecv', 'Comm.sendrecv'])
+        table = trace.summary([]).splitlines()
+        self.assertEqual(len(table), 2)
+
+    def testChromeTrace(self):
+        trace.enable()
+        self.exchange()
+        trace.disable()
+        events = trace.get_events()
+        data = json.loads(json.dumps(trace.chrome_trace(events)))
+        records = data['traceEvents']
+        meta = [r for r in records if r['ph'] == 'M']
+        calls = [r for r in records if r['ph'] == 'X']
+        self.assertEqual(len(meta), 1)
+        self.assertEqual(len(calls), len(events))
+        for record, event in zip(calls, events):
+            self.assertEqual(record['name'], event.name)
+            self.assertEqual(record['cat'], event.kind)
+            self.assertEqual(record['pid'], event.rank)
+            self.assertGreaterEqual(record['dur'], 0)
+
+    def testReport(self):
+        comm = self.comm
+        rank = comm.Get_rank()
+        filename = None
+        if rank == 0:
+            fd, filename = tempfile.mkstemp(suffix='.json')
+            os.close(fd)
+        filename = comm.bcast(filename, root=0)
+        try:
+            output = io.StringIO()
+            trace.enable()
+            self.exchange()
+            trace.report(filename, comm, file=output)
+            if rank == 0:
+                self.assertIn('Comm.Sendrecv', output.getvalue())
+                with open(filename, encoding='utf-8') as fh:
+                    data = json.load(fh)
+                records = data['traceEvents']
+                calls = [r for r in records if r['ph'] == 'X']
+                self.assertEqual(len(calls), 3 * comm.Get_size())
+            else:
+                self.assertEqual(output.getvalue(), '')
+            output = io.StringIO()
+            trace.enable()
+            trace.report(None, comm, file=output)
+            if rank == 0:
+                self.assertTrue(output.getvalue().startswith('call'))
+        finally:
+            comm.Barrier()
+            if rank == 0:
+                os.remove(filename)
+
+
+class TestTraceSelf(BaseTestTrace, unittest.TestCase):
+    COMM = MPI.COMM_SELF
+
+
+class TestTraceWorld(BaseTestTrace, unittest.TestCase):
+    COMM = MPI.COMM_WORLD
+
+
+if __name__ == '__main__':
+    unittest.main()